@@ -0,0 +1,180 @@
+import json
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from database import month_range
+from formatting import round_rupiah
+
+API_URL = "http://127.0.0.1:1323/transaksi"
+
+# Urutan field baris transaksi, sama dengan kolom tabel & tuple dari database
+FIELDS = ("id", "type", "amount", "date", "description", "buyer", "phone", "address")
+
+STREAM_HEADERS = {"Accept": "application/x-ndjson, application/json"}
+
+
+class BackendError(Exception):
+    pass
+
+
+class StorageBackend(ABC):
+    # 🔥 Antarmuka penyimpanan jarak jauh yang dipakai aplikasi (BackendLoadTask, BackendWriteTask, Replica).
+    # Baris transaksi selalu berupa tuple (id, type, amount, date yyyy-mm-dd, description, buyer, phone, address).
+    @abstractmethod
+    def list_month(self, year, month):
+        pass
+
+    @abstractmethod
+    def create_transaction(self, row):
+        pass
+
+    @abstractmethod
+    def update_transaction(self, trans_id, data):
+        pass
+
+    @abstractmethod
+    def delete_transaction(self, trans_id):
+        pass
+
+    def close(self):
+        pass
+
+
+class Changes:
+    # Hasil GET delta: items = iterator item JSON (termasuk tombstone {"id", "deleted": true, "updated_at"}).
+    # full = server mengirim seluruh data (sync pertama, atau server tidak mendukung updated_since).
+    def __init__(self, items, full, etag=None, last_modified=None):
+        self.items = items
+        self.full = full
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class RestBackend(StorageBackend):
+    # 🔥 Satu requests.Session awet (koneksi keep-alive dipakai ulang), timeout di setiap request,
+    # retry dengan backoff untuk error koneksi & 502/503/504, dan thread pool untuk request paralel (push outbox Replica).
+    def __init__(self, url=API_URL, timeout=(3.05, 10), retries=3, backoff=0.3, workers=8):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+
+        # POST tidak diulang setelah request terkirim (bisa membuat data ganda); gagal connect tetap diulang
+        retry = Retry(
+            total=retries, backoff_factor=backoff,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "PUT", "DELETE"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def _request(self, method, path="", ok=(200,), **kwargs):
+        try:
+            response = self.session.request(method, self.url + path, timeout=self.timeout, **kwargs)
+        except requests.exceptions.RequestException as e:
+            raise BackendError(f"Gagal menghubungi server: {e}") from e
+        if response.status_code not in ok:
+            raise BackendError(f"Server mengembalikan status {response.status_code}")
+        return response
+
+    def list_month(self, year, month):
+        rows = list(self.iter_range(*month_range(year, month)))
+        # Urutan sama dengan mode lokal (date DESC, id), juga jika server tidak mengurutkan
+        rows.sort(key=itemgetter(0))
+        rows.sort(key=itemgetter(3), reverse=True)
+        return rows
+
+    def iter_range(self, start, end, page_size=500):
+        # 🔥 Filter rentang tanggal, urutan & halaman dikirim ke server, jadi yang diunduh hanya data yang dibutuhkan.
+        # Server lama yang mengabaikan parameter ini tetap didukung: seluruh data dikembalikan dalam satu
+        # halaman tanpa info halaman berikutnya, lalu disaring di sini (cek string, tanpa parsing tanggal).
+        params = {"start": start, "end": end, "sort": "-date", "page": 1, "per_page": page_size}
+        for item in self._iter_pages(params):
+            row = row_from_json(item)
+            if start <= row[3] < end:
+                yield row
+
+    def changes_since(self, since=None, etag=None, last_modified=None, page_size=1000):
+        # 🔥 Delta sync: hanya record yang berubah sejak watermark updated_at (termasuk yang dihapus).
+        # Dengan If-None-Match/If-Modified-Since server cukup membalas 304 tanpa body jika tidak ada perubahan;
+        # hasilnya None. Server yang tidak mengenal updated_since dikenali dari tidak adanya header X-Updated-Since.
+        params = {"page": 1, "per_page": page_size}
+        headers = dict(STREAM_HEADERS)
+        if since:
+            params["updated_since"] = since
+        if etag:
+            headers["If-None-Match"] = etag
+        elif last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = self._request("GET", params=params, headers=headers, stream=True, ok=(200, 304))
+        if response.status_code == 304:
+            response.close()
+            return None
+        return Changes(
+            self._iter_pages(params, response),
+            full=not since or "X-Updated-Since" not in response.headers,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def _iter_pages(self, params, response=None):
+        # Halaman berikutnya dari header X-Next-Page atau field next_page/meta.next_page
+        page = params["page"]
+        while page:
+            if response is None:
+                response = self._request("GET", params={**params, "page": page}, headers=STREAM_HEADERS, stream=True)
+            items, next_page = read_page(response)
+            yield from items
+            response = None
+            page = next_page if next_page and next_page != page else None
+
+    def create_transaction(self, row):
+        self._request("POST", json=row_to_json(row))
+
+    def update_transaction(self, trans_id, data):
+        payload = row_to_json((trans_id, *data))
+        del payload["id"]
+        self._request("PUT", f"/{trans_id}", json=payload)
+
+    def delete_transaction(self, trans_id, missing_ok=False):
+        self._request("DELETE", f"/{trans_id}", ok=(200, 404) if missing_ok else (200,))
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.session.close()
+
+
+def read_page(response):
+    # Mengembalikan (iterator item, nomor halaman berikutnya atau None).
+    # NDJSON dibaca baris per baris langsung dari socket; JSON biasa {"data": [...]} dibaca utuh per halaman.
+    next_page = response.headers.get("X-Next-Page")
+    if response.headers.get("Content-Type", "").startswith("application/x-ndjson"):
+        items = (json.loads(line) for line in response.iter_lines() if line)
+        return items, int(next_page) if next_page else None
+
+    body = response.json()
+    if next_page is None:
+        next_page = body.get("next_page") or (body.get("meta") or {}).get("next_page")
+    return body.get("data") or [], int(next_page) if next_page else None
+
+
+def row_from_json(item):
+    row = [item.get(field) or "" for field in FIELDS]
+    amount = item.get("amount") or 0
+    row[2] = amount if isinstance(amount, int) else round_rupiah(amount)  # rupiah bulat, sama dengan database
+    row[3] = row[3][:10]  # "2025-03-01T00:00:00Z" -> "2025-03-01"
+    return tuple(row)
+
+
+def row_to_json(row):
+    payload = dict(zip(FIELDS, row))
+    payload["date"] = payload["date"] + "T00:00:00Z"
+    return payload
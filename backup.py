@@ -1,18 +1,24 @@
 import sys
-import requests
 import uuid
 import locale
 import datetime
-from dateutil import parser
 from PyQt6.QtWidgets import QApplication, QHeaderView, QDateEdit, QStyle, QComboBox, QWidget, QVBoxLayout, QPushButton, QTableWidget, QFrame, QTableWidgetItem, QMessageBox, QLineEdit, QLabel, QFormLayout, QHBoxLayout
-from PyQt6.QtCore import QDate, Qt
+from PyQt6.QtCore import QDate, Qt, QThreadPool
 from PyQt6.QtGui import QColor, QBrush, QFont, QIcon
-
-API_URL = "http://127.0.0.1:1323/transaksi"
+from backends import API_URL, RestBackend
+from dates import display_date
+from formatting import format_rupiah
+from workers import BackendLoadTask, BackendWriteTask
 
 class TransactionApp(QWidget):
     def __init__(self):
         super().__init__()
+        # 🔥 Satu klien REST (session keep-alive, timeout & retry) untuk seluruh umur aplikasi
+        self.backend = RestBackend(API_URL)
+        self.load_pool = QThreadPool(self)
+        self.load_task = None
+        self.load_generation = 0
+        self.write_task = None
         self.initUI()
 
     def initUI(self):
@@ -167,6 +173,11 @@ class TransactionApp(QWidget):
             locale.setlocale(locale.LC_TIME, "English_Indonesia.1252")  # Windows
         except locale.Error:
             locale.setlocale(locale.LC_TIME, "")  # Gunakan default OS
+    def closeEvent(self, event):
+        self.load_pool.waitForDone()
+        self.backend.close()
+        super().closeEvent(event)
+
     def toggle_buyer_fields(self):
         is_income = self.type_input.currentText() == "Pemasukan"
         self.buyer_label.setVisible(is_income)
@@ -219,75 +230,101 @@ class TransactionApp(QWidget):
             self.amount_input.setText(new_text)
     
     def load_transactions(self):
-        try:
-            response = requests.get(API_URL)
-            if response.status_code == 200:
-                data = response.json().get("data", [])
-                
-                sorted_data = sorted(data, key=lambda x: x.get("updated_at", ""), reverse=True)
-
-                # Ambil bulan & tahun yang dipilih
-                selected_month = self.month_selector.currentIndex() + 1
-                selected_year = int(self.year_selector.currentText())
-
-                # Filter transaksi berdasarkan bulan & tahun
-                filtered_data = []
-                total_income = 0
-                total_outcome = 0
-
-                for transaction in sorted_data:
-                    transaction_date = parser.parse(transaction['date'])
-                    if transaction_date.month == selected_month and transaction_date.year == selected_year:
-                        filtered_data.append(transaction)
-                        amount = float(transaction['amount'])
-                        if transaction['type'].lower() == "pemasukan":
-                            total_income += amount
-                        else:
-                            total_outcome += amount
-
-                self.table.setRowCount(len(filtered_data))
-
-                for row, transaction in enumerate(filtered_data):
-                    formatted_amount = f"Rp. {transaction['amount']:,.0f}".replace(",", ".")
-                    formatted_date = transaction_date.strftime("%A, %d %B %Y")
-
-                    if transaction['type'].lower() == "pemasukan":
-                        text_color = QColor("green")
-                        bg_color = QColor(220, 255, 220)
-                    else:
-                        text_color = QColor("red")
-                        bg_color = QColor(255, 220, 220)  # Merah muda
-                        
-                    for col, value in enumerate([
-                        transaction['id'], transaction['type'], formatted_amount,
-                        formatted_date, transaction['description'],
-                        transaction['buyer'], transaction['phone'], transaction['address']
-                    ]):
-                        item = QTableWidgetItem(value if value else "-")
-                        item.setForeground(QBrush(text_color))
-                        item.setBackground(QBrush(bg_color))
-                        self.table.setItem(row, col, item)
-                    
-                    # self.table.setItem(row, 0, QTableWidgetItem(transaction['id']))  # ID (disembunyikan)
-                    # self.table.setItem(row, 1, QTableWidgetItem(transaction['type']))
-                    # self.table.setItem(row, 2, QTableWidgetItem(formatted_amount))
-                    # self.table.setItem(row, 3, QTableWidgetItem(transaction['date']))
-                    # self.table.setItem(row, 4, QTableWidgetItem(transaction['description']))
-                    # self.table.setItem(row, 5, QTableWidgetItem(transaction['buyer']))
-                    # self.table.setItem(row, 6, QTableWidgetItem(transaction['phone']))
-                    # self.table.setItem(row, 7, QTableWidgetItem(transaction['address']))
-
-                # Sembunyikan kolom ID
-                self.table.hideColumn(0)
-
-                # Update Label Income & Outcome
-                self.income_label.setText(f"Total Pemasukkan: Rp. {total_income:,.0f}".replace(",", "."))
-                self.outcome_label.setText(f"Total Pengeluaran: Rp. {total_outcome:,.0f}".replace(",", "."))
+        # Ambil bulan & tahun yang dipilih
+        selected_month = self.month_selector.currentIndex() + 1
+        selected_year = int(self.year_selector.currentText())
+
+        # 🔥 Request ke server berjalan di thread pool; load lama dibatalkan jika ada load baru
+        if self.load_task is not None:
+            self.load_task.cancel()
+        self.load_generation += 1
+
+        task = BackendLoadTask(self.backend, selected_year, selected_month, self.load_generation)
+        task.signals.totals.connect(self.on_totals_loaded)
+        task.signals.chunk.connect(self.on_rows_loaded)
+        task.signals.error.connect(self.on_load_error)
+        self.load_task = task
+        self.load_pool.start(task)
+
+    def on_totals_loaded(self, generation, total_income, total_outcome):
+        if generation != self.load_generation:
+            return
+        # Update Label Income & Outcome
+        self.income_label.setText(f"Total Pemasukkan: {format_rupiah(total_income)}")
+        self.outcome_label.setText(f"Total Pengeluaran: {format_rupiah(total_outcome)}")
+
+    def on_rows_loaded(self, generation, filtered_data):
+        if generation != self.load_generation:
+            return
+        self.load_task = None
+        self.table.setRowCount(len(filtered_data))
+
+        for row, transaction in enumerate(filtered_data):
+            trans_id, trans_type, amount, date_str, description, buyer, phone, address = transaction
+            formatted_amount = format_rupiah(amount)
+            formatted_date = display_date(date_str)
 
+            if trans_type.lower() == "pemasukan":
+                text_color = QColor("green")
+                bg_color = QColor(220, 255, 220)
             else:
-                QMessageBox.warning(self, "Error", "Gagal memuat transaksi.")
-        except requests.exceptions.RequestException as e:
-            QMessageBox.critical(self, "Error", f"Gagal menghubungi server: {e}")
+                text_color = QColor("red")
+                bg_color = QColor(255, 220, 220)  # Merah muda
+                
+            for col, value in enumerate([
+                trans_id, trans_type, formatted_amount,
+                formatted_date, description,
+                buyer, phone, address
+            ]):
+                item = QTableWidgetItem(value if value else "-")
+                item.setForeground(QBrush(text_color))
+                item.setBackground(QBrush(bg_color))
+                self.table.setItem(row, col, item)
+
+        # Sembunyikan kolom ID
+        self.table.hideColumn(0)
+
+    def on_load_error(self, generation, message):
+        if generation == self.load_generation:
+            self.load_task = None
+            QMessageBox.critical(self, "Error", message)
+
+    def start_write(self, action, *args):
+        # 🔥 Request tulis berjalan di load_pool seperti load; tombol CRUD dimatikan sampai selesai agar tidak terkirim dua kali
+        task = BackendWriteTask(self.backend, action, *args)
+        task.signals.finished.connect(self.on_write_finished)
+        task.signals.error.connect(self.on_write_error)
+        self.write_task = task
+        self.set_write_buttons_enabled(False)
+        self.load_pool.start(task)
+
+    def set_write_buttons_enabled(self, enabled):
+        self.create_button.setEnabled(enabled)
+        self.update_button.setEnabled(enabled)
+        self.delete_button.setEnabled(enabled)
+
+    def on_write_finished(self, action):
+        self.write_task = None
+        self.set_write_buttons_enabled(True)
+        messages = {
+            "create_transaction": "Transaksi berhasil dibuat.",
+            "update_transaction": "Transaksi berhasil diubah.",
+            "delete_transaction": "Transaksi berhasil dihapus.",
+        }
+        QMessageBox.information(self, "Success", messages[action])
+        self.load_transactions()  # Refresh data setelah perubahan
+        if action != "delete_transaction":
+            self.clear_form()
+
+    def on_write_error(self, action, message):
+        self.write_task = None
+        self.set_write_buttons_enabled(True)
+        labels = {
+            "create_transaction": "membuat",
+            "update_transaction": "mengubah",
+            "delete_transaction": "menghapus",
+        }
+        QMessageBox.warning(self, "Error", f"Gagal {labels[action]} transaksi: {message}")
     
     def create_transaction(self):
         amount_text = self.amount_input.text().replace("Rp. ", "").replace(".", "").strip()
@@ -297,25 +334,18 @@ class TransactionApp(QWidget):
             QMessageBox.warning(self, "Error", "Amount harus berupa angka!")
             return
         
-        data = {
-            "id": str(uuid.uuid4()),
-            "type": self.type_input.currentText(),
-            "amount": float(self.amount_input.text()),
-            "date": self.date_input.date().toString("yyyy-MM-dd") + "T00:00:00Z",
-            "description": self.desc_input.text(),
-            "buyer": self.buyer_input.text(),
-            "phone": self.phone_input.text(),
-            "address": self.address_input.text()
-        }
-        
-        response = requests.post(API_URL, json=data)
+        data = (
+            str(uuid.uuid4()),
+            self.type_input.currentText(),
+            float(self.amount_input.text()),
+            self.date_input.date().toString("yyyy-MM-dd"),
+            self.desc_input.text(),
+            self.buyer_input.text(),
+            self.phone_input.text(),
+            self.address_input.text()
+        )
         
-        if response.status_code == 200:
-            QMessageBox.information(self, "Success", "Transaksi berhasil dibuat.")
-            self.load_transactions()
-            self.clear_form()
-        else:
-            QMessageBox.warning(self, "Error", "Gagal membuat transaksi.")
+        self.start_write("create_transaction", data)
     
     def update_transaction(self):
         if not hasattr(self, 'selected_id') or not self.selected_id:
@@ -327,27 +357,20 @@ class TransactionApp(QWidget):
             amount_text = self.amount_input.text().replace("Rp. ", "").replace(".", "")
             amount_value = float(amount_text)  # Konversi ke float setelah dibersihkan
             
-            data = {
-                "type": self.type_input.currentText(),
-                "amount": amount_value,
-                "date": self.date_input.date().toString("yyyy-MM-dd") + "T00:00:00Z",
-                "description": self.desc_input.text(),
-                "buyer": self.buyer_input.text(),
-                "phone": self.phone_input.text(),
-                "address": self.address_input.text()
-            }
-
-            response = requests.put(f"{API_URL}/{self.selected_id}", json=data)
-
-            if response.status_code == 200:
-                QMessageBox.information(self, "Success", "Transaksi berhasil diubah.")
-                self.load_transactions()  # Refresh data setelah update
-                self.clear_form()  # Hapus isian form saat update selesai  # Reset selected_id saat form dihapus  # Reset form sembunyikan kolom ID saat update selesai  # Tampilkan label Income & Outcome kembali saat update selesai  # Refresh data setelah update selesai  # Reset form sembunyikan kolom ID saat update selesai  #
-            else:
-                QMessageBox.warning(self, "Error", "Gagal mengubah transaksi.")
-        
+            data = (
+                self.type_input.currentText(),
+                amount_value,
+                self.date_input.date().toString("yyyy-MM-dd"),
+                self.desc_input.text(),
+                self.buyer_input.text(),
+                self.phone_input.text(),
+                self.address_input.text()
+            )
         except ValueError:
             QMessageBox.critical(self, "Error", "Format jumlah salah. Harus berupa angka valid.")
+            return
+
+        self.start_write("update_transaction", self.selected_id, data)
     
     def delete_transaction(self):
         if not hasattr(self, 'selected_id') or not self.selected_id:
@@ -363,13 +386,7 @@ class TransactionApp(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            response = requests.delete(f"{API_URL}/{self.selected_id}")
-            
-            if response.status_code == 200:
-                QMessageBox.information(self, "Success", "Transaksi berhasil dihapus.")
-                self.load_transactions()
-            else:
-                QMessageBox.warning(self, "Error", "Gagal menghapus transaksi.")
+            self.start_write("delete_transaction", self.selected_id)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,59 @@
+import sqlite3
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+# Jeda sebelum mencoba lagi kelompok yang gagal disimpan (mis. database terkunci oleh import/arsip),
+# dilipatduakan tiap kegagalan berturut-turut: tiap percobaan bisa menunggu busy_timeout di thread UI
+RETRY_MS = 1000
+MAX_RETRY_MS = 30000
+
+
+class GroupCommitter(QObject):
+    # 🔥 Group commit untuk input cepat: transaksi baru diantre lalu disimpan bersama dalam satu commit,
+    # saat antrean mencapai max_batch atau window_ms sejak transaksi pertama di antrean (mana yang lebih dulu).
+    # window_ms = batas data yang bisa hilang jika aplikasi mati mendadak; 0 = commit tiap transaksi.
+    # Kelompok yang gagal disimpan tidak dibuang: dikembalikan ke depan antrean dan dicoba lagi pada window berikutnya.
+    committed = pyqtSignal(list)
+    failed = pyqtSignal(list, str)
+
+    def __init__(self, db, window_ms=1000, max_batch=20, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.window_ms = window_ms
+        self.max_batch = max_batch
+        self.pending = []
+        self.retry_ms = 0
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+
+    def add(self, row):
+        self.pending.append(row)
+        if self.retry_ms:
+            # Sedang menunggu percobaan ulang: baris baru ikut disimpan bersama kelompok yang gagal
+            return
+        if len(self.pending) >= self.max_batch or self.window_ms <= 0:
+            self.flush()
+        elif not self.timer.isActive():
+            # Timer tidak diulang tiap transaksi, jadi jeda simpan tetap paling lama window_ms
+            self.timer.start(self.window_ms)
+
+    def pending_count(self):
+        return len(self.pending)
+
+    def flush(self):
+        self.timer.stop()
+        if not self.pending:
+            return
+        rows, self.pending = self.pending, []
+        try:
+            self.db.insert_transactions(rows)
+        except sqlite3.Error as e:
+            # Baris yang masuk selama percobaan ini (jika ada) tetap di belakangnya, urutan input terjaga
+            self.pending = rows + self.pending
+            self.retry_ms = min(self.retry_ms * 2, MAX_RETRY_MS) if self.retry_ms else max(self.window_ms, RETRY_MS)
+            self.timer.start(self.retry_ms)
+            self.failed.emit(rows, str(e))
+            return
+        self.retry_ms = 0
+        self.committed.emit(rows)
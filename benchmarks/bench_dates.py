@@ -0,0 +1,52 @@
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from dates import display_date, format_date, parse_date, reset_locale
+
+# Micro-benchmark format tanggal per 100 ribu baris: cara lama (strptime/dateutil + strftime) vs modul dates.
+# Jalankan dari root repo: python -m benchmarks.bench_dates [--rows 100000]
+
+
+def make_dates(rows, days):
+    start = date(2025, 1, 1)
+    return [(start + timedelta(days=random.randrange(days))).isoformat() for _ in range(rows)]
+
+
+def bench(label, func, values):
+    started = time.perf_counter()
+    for value in values:
+        func(value)
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<42} {elapsed * 1000:9.1f} ms")
+    return elapsed
+
+
+def run(rows):
+    try:
+        from dateutil import parser
+    except ImportError:
+        parser = None
+
+    for title, days in (("1 bulan (31 tanggal)", 31), ("1 tahun (365 tanggal)", 365)):
+        values = make_dates(rows, days)
+        print(f"{rows} baris, {title}:")
+        baseline = bench("strptime + strftime", lambda s: datetime.strptime(s, "%Y-%m-%d").strftime("%A, %d %B %Y"), values)
+        if parser is not None:
+            bench("dateutil.parser.parse + strftime", lambda s: parser.parse(s).strftime("%A, %d %B %Y"), values)
+        bench("fromisoformat + nama locale (tanpa cache)", lambda s: format_date(parse_date(s)), values)
+        reset_locale()
+        cached = bench("dates.display_date (cache)", display_date, values)
+        print(f"  -> display_date {baseline / cached:.1f}x lebih cepat dari strptime + strftime")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark format tanggal per baris tabel.")
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args(argv)
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import argparse
+import json
+
+# Bandingkan dua file JSON hasil benchmarks.run (median per metrik); rasio > 1 berarti lebih lambat.
+# python -m benchmarks.compare lama.json baru.json [--threshold 1.2]
+
+
+def flatten(node, prefix=""):
+    if isinstance(node, dict):
+        if "median" in node:
+            yield prefix, node["median"]
+            return
+        for key, value in node.items():
+            yield from flatten(value, f"{prefix}.{key}" if prefix else key)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan dua hasil benchmark.")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=1.2, help="rasio yang dianggap regresi")
+    args = parser.parse_args(argv)
+
+    with open(args.old, encoding="utf-8") as f:
+        old = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+    old_values = dict(flatten(old["results"]))
+    print(f"{old['environment'].get('commit')} -> {new['environment'].get('commit')}")
+
+    regressions = 0
+    for name, value in flatten(new["results"]):
+        before = old_values.get(name)
+        if not before:
+            continue
+        ratio = value / before
+        flag = "  REGRESI" if ratio >= args.threshold else ""
+        regressions += bool(flag)
+        print(f"{name:<45} {before * 1000:10.2f} ms -> {value * 1000:10.2f} ms  x{ratio:5.2f}{flag}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,271 @@
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timezone
+
+from benchmarks.synthetic import cached_database, generate_rows
+from database import MONTH_QUERY, Database, month_range, uses_index
+
+# 🔥 Benchmark penyimpanan transaksi & jalur load UI, hasil dalam JSON agar bisa dibandingkan antar commit.
+# Jalankan dari root repo:
+#   QT_QPA_PLATFORM=offscreen python -m benchmarks.run --sizes 10k 1m --output hasil.json
+#   python -m benchmarks.compare lama.json baru.json
+# Database sintetis disimpan di benchmarks/data/ dan dipakai ulang.
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+BENCH_PREFIX = "bench-"
+
+
+def measure(func, repeat):
+    # Waktu (detik) tiap ulangan; yang dilaporkan min & median
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return {"min": min(times), "median": statistics.median(times), "repeat": repeat}
+
+
+def busiest_month(db):
+    return db.connection().execute(
+        "SELECT year, month FROM monthly_summary GROUP BY year, month ORDER BY SUM(count) DESC LIMIT 1"
+    ).fetchone()
+
+
+def remove_bench_rows(db):
+    conn = db.connection()
+    with conn:
+        conn.execute("DELETE FROM transactions WHERE id >= ? AND id < ?", (BENCH_PREFIX, BENCH_PREFIX[:-1] + "."))
+
+
+def bench_rows(count, prefix):
+    rows = []
+    for batch in generate_rows(count, seed=7, start=date(2025, 6, 1), end=date(2025, 7, 1)):
+        for row in batch:
+            row[0] = f"{BENCH_PREFIX}{prefix}-{row[0]}"
+            rows.append(row)
+    return rows
+
+
+def bench_init_db(path, repeat):
+    # Buka database yang sudah ada (koneksi + pragma + cek migrasi) dan membuat database baru dari nol
+    def open_existing():
+        Database(path).close()
+
+    def create_new():
+        with tempfile.TemporaryDirectory() as directory:
+            Database(os.path.join(directory, "baru.db")).close()
+
+    return {"open_existing": measure(open_existing, repeat), "create_new": measure(create_new, repeat)}
+
+
+def bench_writes(db, single_count, bulk_count, repeat):
+    results = {}
+    single = bench_rows(single_count * repeat, "single")
+    chunks = [single[i:i + single_count] for i in range(0, len(single), single_count)]
+
+    def insert_single():
+        rows = chunks.pop()
+        for row in rows:
+            db.insert_transaction(row)
+
+    timing = measure(insert_single, repeat)
+    timing["per_row_ms"] = timing["median"] / single_count * 1000
+    results["single_insert"] = timing
+
+    # Input cepat: jumlah baris yang sama, disimpan per kelompok 20 (satu commit per kelompok)
+    grouped = bench_rows(single_count * repeat, "group")
+    groups = [grouped[i:i + single_count] for i in range(0, len(grouped), single_count)]
+
+    def insert_grouped():
+        rows = groups.pop()
+        for i in range(0, len(rows), 20):
+            db.insert_transactions(rows[i:i + 20])
+
+    timing = measure(insert_grouped, repeat)
+    timing["per_row_ms"] = timing["median"] / single_count * 1000
+    results["grouped_insert"] = timing
+
+    bulk = [bench_rows(bulk_count, f"bulk{attempt}") for attempt in range(repeat)]
+
+    def insert_bulk():
+        db.bulk_insert([bulk.pop()])
+
+    timing = measure(insert_bulk, repeat)
+    timing["rows_per_s"] = bulk_count / timing["median"]
+    results["bulk_insert"] = timing
+    remove_bench_rows(db)
+    return results
+
+
+def bench_reads(db, year, month, repeat):
+    conn = db.connection()
+    start, end = month_range(year, month)
+    rows = len(db.fetch_month(year, month))
+    return {
+        "month": f"{year:04}-{month:02}",
+        "month_rows": rows,
+        "month_query_uses_index": uses_index(conn, MONTH_QUERY, (start, end)),
+        "month_query": measure(lambda: db.fetch_month(year, month), repeat),
+        "first_page": measure(lambda: db.fetch_page(year, month, None, 500), repeat),
+        "month_totals": measure(lambda: db.month_totals(year, month), repeat),
+        "month_totals_scan": measure(lambda: conn.execute(
+            "SELECT type, SUM(amount) FROM transactions WHERE date >= ? AND date < ? GROUP BY type", (start, end)
+        ).fetchall(), repeat),
+        "period_summary_5y": measure(lambda: db.period_summary(year - 4, year), repeat),
+    }
+
+
+def bench_table_fill(path, year, month, repeat):
+    # Jalur load UI di Qt offscreen: model + QTableView, dan TransactionApp.load_transactions dari awal sampai selesai
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtWidgets import QApplication, QTableView
+    except ImportError:
+        return {"skipped": "PyQt6 tidak tersedia"}
+
+    app = QApplication.instance() or QApplication([])
+    import main
+    from transaction_model import TransactionTableModel
+
+    db = Database(path)
+    rows = db.fetch_month(year, month)
+
+    def fill_model():
+        model = TransactionTableModel()
+        model.set_rows([])
+        model.append_page(rows)
+
+    def render_cells():
+        # Semua sel diformat seperti saat digulir sampai bawah (teks, warna latar & teks)
+        model = TransactionTableModel()
+        model.append_page(rows)
+        for row in range(model.rowCount()):
+            for column in range(model.columnCount()):
+                index = model.index(row, column)
+                model.data(index, Qt.ItemDataRole.DisplayRole)
+                model.data(index, Qt.ItemDataRole.ForegroundRole)
+                model.data(index, Qt.ItemDataRole.BackgroundRole)
+
+    view = QTableView()
+    view.resize(800, 600)
+    view.show()
+
+    def first_page_view():
+        model = TransactionTableModel()
+        view.setModel(model)
+        model.set_rows([], lambda after, limit: db.fetch_page(year, month, after, limit), 500)
+        model.append_page(db.fetch_page(year, month, None, 500))
+        app.processEvents()
+
+    results = {
+        "month_rows": len(rows),
+        "fill_model": measure(fill_model, repeat),
+        "render_all_cells": measure(render_cells, repeat),
+        "first_page_view": measure(first_page_view, repeat),
+    }
+
+    # TransactionApp memakai DB_NAME dari main; diarahkan ke database benchmark
+    main.DB_NAME = path
+    # Tanpa cache bulan: load_transactions mengukur jalur query seperti hasil benchmark sebelum ada cache
+    window = main.TransactionApp(month_cache_mb=0, backup_interval_min=0)
+    window.month_selector.blockSignals(True)
+    window.year_selector.blockSignals(True)
+    window.year_selector.addItem(str(year))
+    window.year_selector.setCurrentText(str(year))
+    window.month_selector.setCurrentIndex(month - 1)
+    window.show()
+    # Load pertama dijadwalkan setelah show(); tunggu selesai agar tidak ikut terukur
+    while "first_load_ms" not in window.startup_times:
+        app.processEvents()
+
+    def load_transactions():
+        window.load_transactions()
+        while window.load_task is not None:
+            app.processEvents()
+        app.processEvents()
+
+    results["load_transactions"] = measure(load_transactions, repeat)
+
+    # Bulan yang sama dari cache (diisi oleh satu load lebih dulu), dilaporkan terpisah
+    window.init_cache(main.MONTH_CACHE_MB)
+    load_transactions()
+    window.load_pool.waitForDone()
+    load_transactions()
+    results["load_transactions_cached"] = measure(load_transactions, repeat)
+    results["load_transactions_cached"]["hits"] = window.month_cache.hits
+    window.close()
+    view.close()
+    db.close()
+    return results
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run(sizes, repeat, single_count, bulk_count, skip_ui):
+    report = {"environment": environment(), "results": {}}
+    for size in sizes:
+        path, rows = cached_database(
+            DATA_DIR, size, progress=lambda done: print(f"\r[{size}] membuat {done} baris", end="", file=sys.stderr),
+        )
+        print(f"\r[{size}] {rows} baris: {path}", file=sys.stderr)
+
+        result = {"rows": rows, "init_db": bench_init_db(path, repeat)}
+        db = Database(path)
+        try:
+            year, month = busiest_month(db)
+            result["reads"] = bench_reads(db, year, month, repeat)
+            result["writes"] = bench_writes(db, single_count, bulk_count, repeat)
+        finally:
+            db.close()
+        if not skip_ui:
+            result["ui"] = bench_table_fill(path, year, month, repeat)
+        report["results"][size] = result
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark database transaksi & jalur load tabel (JSON).")
+    parser.add_argument("--sizes", nargs="+", default=["10k", "1m"], help="ukuran database: 10k, 1m, 10m atau angka")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--single", type=int, default=100, help="jumlah insert satu per satu per ulangan")
+    parser.add_argument("--bulk", type=int, default=20000, help="jumlah baris bulk insert per ulangan")
+    parser.add_argument("--no-ui", action="store_true", help="lewati benchmark Qt")
+    parser.add_argument("--output", help="file JSON hasil (default: stdout)")
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.repeat, args.single, args.bulk, args.no_ui)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
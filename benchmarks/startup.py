@@ -0,0 +1,62 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.run import environment
+
+# 🔥 Waktu startup aplikasi: tiap ulangan menjalankan proses baru `main.py --measure-startup` (Qt offscreen),
+# dari interpreter mulai sampai jendela tergambar & load bulan ini selesai. Target gambar pertama < 300 ms.
+# python -m benchmarks.startup [--repeat 10] [--output startup.json]; bandingkan dengan benchmarks.compare.
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+FIRST_PAINT_TARGET_MS = 300
+
+
+def summarize(values):
+    # Detik, format sama dengan benchmarks.run
+    return {"min": min(values), "median": statistics.median(values), "repeat": len(values)}
+
+
+def run(repeat):
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    stages = {}
+    process_times = []
+    with tempfile.TemporaryDirectory() as directory:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, MAIN, "--measure-startup"], cwd=directory, env=env,
+                capture_output=True, text=True, timeout=60, check=True,
+            ).stdout
+            process_times.append(time.perf_counter() - started)
+            times = json.loads(output.strip().splitlines()[-1])
+            for stage, ms in times.items():
+                stages.setdefault(stage[:-3], []).append(ms / 1000)
+
+    results = {stage: summarize(values) for stage, values in stages.items()}
+    results["process_total"] = summarize(process_times)
+    results["first_paint_under_target"] = results["first_paint"]["median"] * 1000 < FIRST_PAINT_TARGET_MS
+    return {"environment": environment(), "results": {"startup": results}}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ukur waktu startup aplikasi (JSON).")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", help="file JSON hasil (default: stdout)")
+    args = parser.parse_args(argv)
+
+    text = json.dumps(run(args.repeat), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
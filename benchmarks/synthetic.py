@@ -0,0 +1,114 @@
+import argparse
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+from database import Database
+
+# 🔥 Generator database kummiku.db sintetis untuk benchmark.
+# Sebaran dibuat mirip data asli: ~70% pemasukan, transaksi lebih ramai di akhir pekan & bulan Desember/Ramadan,
+# sedikit pembeli langganan yang sangat sering muncul (Zipf), nilai log-normal dibulatkan ke 500 rupiah.
+
+FIRST_NAMES = ["Budi", "Siti", "Agus", "Dewi", "Andi", "Rina", "Joko", "Sri", "Eko", "Nur", "Wahyu", "Fitri",
+               "Hendra", "Yuni", "Rudi", "Lina", "Dedi", "Ani", "Bayu", "Maya"]
+LAST_NAMES = ["Santoso", "Wijaya", "Saputra", "Lestari", "Hidayat", "Kurniawan", "Pratama", "Sari", "Setiawan",
+              "Rahayu", "Nugroho", "Susanti", "Gunawan", "Putri", "Halim"]
+STREETS = ["Jl. Mawar", "Jl. Melati", "Jl. Merdeka", "Jl. Sudirman", "Jl. Diponegoro", "Jl. Ahmad Yani", "Gg. Kenanga"]
+INCOME_DESCRIPTIONS = ["Penjualan kue", "Pesanan nasi kotak", "Penjualan online", "Pesanan catering", "Titip jual"]
+OUTCOME_DESCRIPTIONS = ["Belanja bahan", "Gas elpiji", "Listrik", "Kemasan", "Ongkos kirim", "Gaji karyawan", "Sewa"]
+
+# Bobot per bulan (Jan..Des) dan per hari (Senin..Minggu)
+MONTH_WEIGHTS = [0.9, 0.8, 1.0, 1.3, 1.0, 0.9, 0.9, 1.0, 0.9, 1.0, 1.1, 1.6]
+WEEKDAY_WEIGHTS = [0.8, 0.8, 0.9, 0.9, 1.1, 1.5, 1.4]
+
+SIZES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+
+
+def make_buyers(rng, count=2000):
+    buyers = []
+    for _ in range(count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        phone = f"08{rng.randrange(11, 99)}{rng.randrange(10_000_000, 99_999_999)}"
+        address = f"{rng.choice(STREETS)} No. {rng.randrange(1, 200)}"
+        buyers.append((name, phone, address))
+    # Zipf: pembeli ke-k muncul sebanding 1/k
+    weights = [1 / (rank + 1) for rank in range(count)]
+    return buyers, weights
+
+
+def make_days(start, end):
+    days, weights = [], []
+    current = start
+    while current < end:
+        days.append(current.isoformat())
+        weights.append(MONTH_WEIGHTS[current.month - 1] * WEEKDAY_WEIGHTS[current.weekday()])
+        current += timedelta(days=1)
+    return days, weights
+
+
+def generate_rows(count, seed=42, start=date(2020, 1, 1), end=date(2026, 1, 1), batch_size=50000):
+    # Menghasilkan batch list baris (id, type, amount, date, description, buyer, phone, address)
+    rng = random.Random(seed)
+    buyers, buyer_weights = make_buyers(rng)
+    days, day_weights = make_days(start, end)
+    produced = 0
+    while produced < count:
+        size = min(batch_size, count - produced)
+        dates = rng.choices(days, day_weights, k=size)
+        picked = rng.choices(buyers, buyer_weights, k=size)
+        batch = []
+        for index in range(size):
+            number = produced + index
+            trans_id = f"{rng.getrandbits(128):032x}"
+            trans_id = f"{trans_id[:8]}-{trans_id[8:12]}-{trans_id[12:16]}-{trans_id[16:20]}-{trans_id[20:]}"
+            if rng.random() < 0.7:
+                amount = int(rng.lognormvariate(11.5, 0.9)) // 500 * 500
+                batch.append([trans_id, "Pemasukan", amount, dates[index],
+                              f"{rng.choice(INCOME_DESCRIPTIONS)} #{number}", *picked[index]])
+            else:
+                amount = int(rng.lognormvariate(11.0, 1.1)) // 500 * 500
+                batch.append([trans_id, "Pengeluaran", amount, dates[index],
+                              f"{rng.choice(OUTCOME_DESCRIPTIONS)} #{number}", "", "", ""])
+        produced += size
+        yield batch
+
+
+def build_database(path, rows, seed=42, progress=None):
+    # Database baru berisi `rows` transaksi; file lama (beserta -wal/-shm) ditimpa
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    db = Database(path)
+    try:
+        db.bulk_insert(generate_rows(rows, seed), progress)
+        db.connection().execute("ANALYZE")
+    finally:
+        db.close()
+    return path
+
+
+def cached_database(directory, size, seed=42, progress=None):
+    # Database per ukuran dibuat sekali lalu dipakai ulang (10 juta baris butuh beberapa menit)
+    rows = SIZES.get(size.lower()) or int(size)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"kummiku_{size.lower()}_{seed}.db")
+    if not os.path.exists(path):
+        build_database(path, rows, seed, progress)
+    return path, rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buat database transaksi sintetis untuk benchmark.")
+    parser.add_argument("path", help="file database tujuan (ditimpa)")
+    parser.add_argument("--rows", default="10k", help="jumlah baris: 10k, 1m, 10m atau angka")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    rows = SIZES.get(args.rows.lower()) or int(args.rows)
+    build_database(args.path, rows, args.seed, lambda done: print(f"\r{done}/{rows} baris", end="", file=sys.stderr))
+    print(file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
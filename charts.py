@@ -0,0 +1,106 @@
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QBrush, QColor, QPainter, QPen, QPolygonF
+from PyQt6.QtWidgets import QToolTip, QWidget
+
+from formatting import format_thousands
+
+
+class BarChart(QWidget):
+    # 🔥 Grafik batang ringan (QPainter langsung, tanpa library chart): pemasukan & pengeluaran per periode
+    # berdampingan, garis selisih di atasnya. Geometri batang dihitung sekali per data/ukuran, bukan tiap paint.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.labels = []
+        self.income = []
+        self.outcome = []
+        self._bars = []  # (QRectF, brush, tooltip)
+        self._line = []
+        self._axis = []
+        self._zero = None
+        self._layout_size = None
+        self.income_brush = QBrush(QColor(76, 175, 80))
+        self.outcome_brush = QBrush(QColor(229, 57, 53))
+        self.line_pen = QPen(QColor(30, 136, 229), 2)
+        self.setMinimumHeight(220)
+        self.setMouseTracking(True)
+
+    def set_data(self, labels, income, outcome):
+        self.labels = list(labels)
+        self.income = list(income)
+        self.outcome = list(outcome)
+        self._layout_size = None
+        self.update()
+
+    def _layout(self):
+        width, height = self.width(), self.height()
+        self._layout_size = (width, height)
+        self._bars, self._line, self._axis = [], [], []
+        count = len(self.labels)
+        if not count:
+            return
+
+        left, right, top, bottom = 60, 10, 10, 30
+        plot_width, plot_height = max(width - left - right, 1), max(height - top - bottom, 1)
+        differences = [i - o for i, o in zip(self.income, self.outcome)]
+        high = max(max(self.income), max(self.outcome), max(differences), 1)
+        low = min(min(differences), 0)
+        scale = plot_height / (high - low)
+        zero_y = top + high * scale
+
+        slot = plot_width / count
+        bar = max(slot * 0.35, 1)
+        label_every = max(1, int(60 // slot) + 1)
+        for index, (label, income, outcome, difference) in enumerate(zip(self.labels, self.income, self.outcome, differences)):
+            x = left + index * slot + slot * 0.15
+            self._bars.append((QRectF(x, zero_y - income * scale, bar, income * scale), self.income_brush,
+                               f"{label}\nPemasukan: Rp. {format_thousands(income)}"))
+            self._bars.append((QRectF(x + bar, zero_y - outcome * scale, bar, outcome * scale), self.outcome_brush,
+                               f"{label}\nPengeluaran: Rp. {format_thousands(outcome)}"))
+            self._line.append(QPointF(left + (index + 0.5) * slot, zero_y - difference * scale))
+            if index % label_every == 0:
+                self._axis.append((QRectF(left + index * slot, height - bottom + 4, slot * label_every, bottom - 4), label))
+
+        for step in range(5):
+            value = low + (high - low) * step / 4
+            self._axis.append((QRectF(0, zero_y - value * scale - 8, left - 6, 16), compact_amount(value)))
+        self._zero = (left, zero_y, width - right)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().base())
+        if not self.labels:
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Belum ada data")
+            return
+        if self._layout_size != (self.width(), self.height()):
+            self._layout()
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        for rect, brush, _ in self._bars:
+            painter.fillRect(rect, brush)
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.line_pen)
+        painter.drawPolyline(QPolygonF(self._line))
+
+        painter.setPen(self.palette().text().color())
+        left, zero_y, right = self._zero
+        painter.drawLine(QPointF(left, zero_y), QPointF(right, zero_y))
+        for rect, text in self._axis:
+            align = Qt.AlignmentFlag.AlignRight if rect.left() == 0 else Qt.AlignmentFlag.AlignLeft
+            painter.drawText(rect, align | Qt.AlignmentFlag.AlignVCenter, text)
+
+    def mouseMoveEvent(self, event):
+        position = event.position()
+        for rect, _, tooltip in self._bars:
+            if rect.left() <= position.x() <= rect.right():
+                QToolTip.showText(event.globalPosition().toPoint(), tooltip, self)
+                return
+        QToolTip.hideText()
+
+
+def compact_amount(value):
+    # Label sumbu: 2.811.517.500 -> "2,8 M", 888.437.500 -> "888,4 jt"
+    for limit, suffix in ((1_000_000_000, "M"), (1_000_000, "jt"), (1_000, "rb")):
+        if abs(value) >= limit:
+            return f"{value / limit:.1f}".replace(".", ",") + f" {suffix}"
+    return str(int(value))
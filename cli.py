@@ -0,0 +1,241 @@
+import argparse
+import csv
+import io
+import json
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from database import DB_NAME, Database
+from exporter import HEADERS
+from formatting import format_rupiah
+from reports import load_month_report
+
+# 🔥 Laporan tanpa GUI (PyQt6 tidak pernah diimport), untuk skrip & pembukuan:
+#   python cli.py report --year 2025 --month 3 --format json
+#   python cli.py report --year 2024-2025 --month 1-12 --summary --format csv --jobs 4 --output ringkasan.csv
+#   python cli.py archive --year 2019
+#   python cli.py backup                      (snapshot ke backup/, aman saat aplikasi berjalan)
+#   python cli.py restore backup/kummiku-20250301-120000.db.gz   (aplikasi harus ditutup)
+# Dengan --jobs > 1 tiap bulan dibuat di proses terpisah, masing-masing dengan koneksi SQLite sendiri.
+
+FIELDS = ["id", "type", "amount", "date", "description", "buyer", "phone", "address"]
+SUMMARY_HEADERS = ["Tahun", "Bulan", "Pemasukan", "Pengeluaran", "Selisih", "Jumlah Transaksi"]
+
+
+def parse_numbers(text, low, high):
+    # "3", "1-6", "1,4,7-9" -> [1, 4, 7, 8, 9]
+    numbers = []
+    for part in text.split(","):
+        first, _, last = part.strip().partition("-")
+        start = int(first)
+        end = int(last) if last else start
+        if not low <= start <= end <= high:
+            raise ValueError(f"di luar rentang {low}-{high}: {part.strip()!r}")
+        numbers.extend(range(start, end + 1))
+    return sorted(set(numbers))
+
+
+_worker_db = None
+
+
+def _init_worker(path):
+    global _worker_db
+    _worker_db = Database(path)
+
+
+def _render_job(period, fmt, summary):
+    year, month = period
+    return render_month(load_month_report(_worker_db, year, month, not summary), fmt, summary)
+
+
+def build_reports(path, periods, details=True):
+    # API pustaka: daftar MonthReport untuk (tahun, bulan) yang diminta
+    db = Database(path)
+    try:
+        return [load_month_report(db, year, month, details) for year, month in periods]
+    finally:
+        db.close()
+
+
+def render_reports(path, periods, fmt, summary=False, jobs=1):
+    # 🔥 Query & format per bulan dikerjakan di proses worker; proses utama hanya menyambung teks hasilnya
+    if jobs > 1 and len(periods) > 1:
+        # Migrasi (jika perlu) dijalankan sekali di sini, sebelum worker membuka database bersamaan
+        Database(path).close()
+        count = len(periods)
+        with ProcessPoolExecutor(max_workers=min(jobs, count), initializer=_init_worker, initargs=(path,)) as pool:
+            parts = list(pool.map(_render_job, periods, [fmt] * count, [summary] * count))
+    else:
+        parts = [render_month(report, fmt, summary) for report in build_reports(path, periods, not summary)]
+
+    if fmt == "json":
+        return "[\n" + ",\n".join(parts) + "\n]\n"
+    if fmt == "csv":
+        return csv_text([SUMMARY_HEADERS if summary else HEADERS]) + "".join(parts)
+    return "".join(parts)
+
+
+def report_dict(report):
+    data = {
+        "year": report.year,
+        "month": report.month,
+        "income": report.income,
+        "outcome": report.outcome,
+        "difference": report.difference,
+        "count": report.count,
+    }
+    if report.rows is not None:
+        data["transactions"] = [dict(zip(FIELDS, row)) for row in report.rows]
+    return data
+
+
+def csv_text(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def render_month(report, fmt, summary=False):
+    if fmt == "json":
+        return json.dumps(report_dict(report), ensure_ascii=False, indent=2)
+    if fmt == "csv":
+        # Ringkasan: satu baris per bulan; detail: baris transaksi mentah seperti exporter (bisa diimport kembali)
+        if summary:
+            return csv_text([[report.year, report.month, report.income, report.outcome, report.difference, report.count]])
+        return csv_text(report.rows)
+
+    lines = [
+        report.label,
+        f"  Total Pemasukan  : {format_rupiah(report.income)}",
+        f"  Total Pengeluaran: {format_rupiah(report.outcome)}",
+        f"  Selisih          : {format_rupiah(report.difference)}",
+        f"  Jumlah Transaksi : {report.count}",
+    ]
+    for row in report.rows or ():
+        buyer = f" ({row[5]})" if row[5] else ""
+        lines.append(f"  {row[3]}  {row[1]:<11} {format_rupiah(row[2]):>16}  {row[4] or ''}{buyer}")
+    return "\n".join(lines) + "\n\n"
+
+
+def report_command(args, parser):
+    if not os.path.exists(args.db):
+        print(f"Database tidak ditemukan: {args.db}", file=sys.stderr)
+        return 1
+    try:
+        years = parse_numbers(args.year, 1, 9999)
+        months = parse_numbers(args.month, 1, 12)
+    except ValueError as e:
+        parser.error(f"--year/--month tidak valid: {e}")
+    periods = [(year, month) for year in years for month in months]
+
+    try:
+        text = render_reports(args.db, periods, args.format, args.summary, args.jobs)
+    except (sqlite3.Error, BrokenProcessPool) as e:
+        print(f"Gagal membuat laporan: {e}", file=sys.stderr)
+        return 1
+
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    return 0
+
+
+def archive_command(args):
+    if not os.path.exists(args.db):
+        print(f"Database tidak ditemukan: {args.db}", file=sys.stderr)
+        return 1
+    db = Database(args.db)
+    try:
+        for year in args.year:
+            rows = db.archive_year(year)
+            print(f"{rows} transaksi tahun {year} dipindah ke file arsip")
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Gagal mengarsipkan: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+    return 0
+
+
+def backup_command(args):
+    # Diimport di sini: laporan tidak perlu memuat modul backup
+    import snapshots
+    if not args.verify and not os.path.exists(args.db):
+        print(f"Database tidak ditemukan: {args.db}", file=sys.stderr)
+        return 1
+    if args.keep is None:
+        args.keep = snapshots.KEEP
+    try:
+        if args.verify:
+            for path in args.verify:
+                snapshots.verify_snapshot(path, args.full)
+                print(f"OK: {path}")
+            return 0
+        path = snapshots.create_snapshot(args.db, args.dir, args.keep)
+        print(f"Snapshot: {path}")
+        for archive in snapshots.backup_archives(args.db, args.dir):
+            print(f"Arsip: {archive}")
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Backup gagal: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def restore_command(args):
+    import snapshots
+    try:
+        snapshots.restore_snapshot(args.snapshot, args.db, args.full)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Restore gagal: {e}", file=sys.stderr)
+        return 1
+    print(f"{args.db} dipulihkan dari {args.snapshot} (file lama: {args.db}.sebelum-restore)")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Laporan transaksi Kummiku tanpa GUI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    report = commands.add_parser("report", help="laporan per bulan (total & transaksi)")
+    report.add_argument("--db", default=DB_NAME, help=f"file database (default: {DB_NAME})")
+    report.add_argument("--year", required=True, help="tahun, rentang atau daftar: 2025, 2023-2025")
+    report.add_argument("--month", default="1-12", help="bulan 1-12, rentang atau daftar: 3, 1-6, 1,4,7 (default: semua)")
+    report.add_argument("--format", choices=["json", "csv", "text"], default="text")
+    report.add_argument("--summary", action="store_true", help="hanya total per bulan, tanpa daftar transaksi")
+    report.add_argument("--jobs", type=int, default=1, help="jumlah proses paralel untuk banyak bulan")
+    report.add_argument("--output", help="file hasil (default: stdout)")
+
+    archive = commands.add_parser("archive", help="pindahkan tahun yang sudah lewat ke file arsip per tahun")
+    archive.add_argument("--db", default=DB_NAME, help=f"file database (default: {DB_NAME})")
+    archive.add_argument("--year", type=int, nargs="+", required=True, help="tahun yang diarsipkan")
+
+    backup = commands.add_parser("backup", help="snapshot database terkompresi (aman saat aplikasi berjalan)")
+    backup.add_argument("--db", default=DB_NAME, help=f"file database (default: {DB_NAME})")
+    backup.add_argument("--dir", help="folder snapshot (default: backup/ di samping database)")
+    backup.add_argument("--keep", type=int, help="jumlah snapshot yang disimpan (default: 7)")
+    backup.add_argument("--verify", nargs="+", metavar="SNAPSHOT", help="hanya cek snapshot, tanpa membuat baru")
+    backup.add_argument("--full", action="store_true", help="integrity_check penuh (lebih lambat dari quick_check)")
+
+    restore = commands.add_parser("restore", help="pulihkan database dari snapshot (aplikasi harus ditutup)")
+    restore.add_argument("snapshot")
+    restore.add_argument("--db", default=DB_NAME, help=f"file database (default: {DB_NAME})")
+    restore.add_argument("--full", action="store_true", help="integrity_check penuh (lebih lambat dari quick_check)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "archive":
+        return archive_command(args)
+    if args.command == "backup":
+        return backup_command(args)
+    if args.command == "restore":
+        return restore_command(args)
+    return report_command(args, parser)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+from datetime import datetime
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import (QComboBox, QHBoxLayout, QHeaderView, QLabel, QMessageBox, QSplitter, QTableWidget,
+                             QTableWidgetItem, QVBoxLayout, QWidget)
+
+import instrumentation
+from charts import BarChart
+from formatting import format_rupiah
+from workers import DashboardTask
+
+GRANULARITIES = [("Bulanan", "month"), ("Kuartalan", "quarter"), ("Tahunan", "year")]
+
+
+class DashboardWindow(QWidget):
+    # 🔥 Ringkasan beberapa tahun sekaligus: pemasukan/pengeluaran/selisih per bulan, kuartal atau tahun
+    # dan pembeli teratas. Data dari satu query atas tabel ringkasan, dijalankan di thread pool.
+    def __init__(self, db, pool, parent=None):
+        super().__init__(parent, Qt.WindowType.Window)
+        self.db = db
+        self.pool = pool
+        self.data = None
+        self.generation = 0
+        self.setWindowTitle("Dashboard Transaksi")
+        self.resize(900, 600)
+
+        current_year = datetime.now().year
+        years = [str(year) for year in range(current_year - 10, current_year + 1)]
+        self.start_selector = QComboBox()
+        self.start_selector.addItems(years)
+        self.start_selector.setCurrentText(str(current_year - 4))
+        self.end_selector = QComboBox()
+        self.end_selector.addItems(years)
+        self.end_selector.setCurrentText(str(current_year))
+        self.granularity_selector = QComboBox()
+        for label, _ in GRANULARITIES:
+            self.granularity_selector.addItem(label)
+        self.start_selector.currentIndexChanged.connect(self.reload)
+        self.end_selector.currentIndexChanged.connect(self.reload)
+        self.granularity_selector.currentIndexChanged.connect(self.show_data)
+
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Dari tahun:"))
+        filter_layout.addWidget(self.start_selector)
+        filter_layout.addWidget(QLabel("Sampai:"))
+        filter_layout.addWidget(self.end_selector)
+        filter_layout.addWidget(QLabel("Per:"))
+        filter_layout.addWidget(self.granularity_selector)
+        filter_layout.addStretch()
+
+        self.summary_label = QLabel("")
+        self.summary_label.setStyleSheet("font-weight: bold;")
+        self.chart = BarChart()
+
+        self.period_table = self._make_table(["Periode", "Pemasukan", "Pengeluaran", "Selisih"])
+        self.buyer_table = self._make_table(["Pembeli Teratas", "Total Pembelian", "Transaksi"])
+        tables = QSplitter()
+        tables.addWidget(self.period_table)
+        tables.addWidget(self.buyer_table)
+
+        layout = QVBoxLayout()
+        layout.addLayout(filter_layout)
+        layout.addWidget(self.summary_label)
+        layout.addWidget(self.chart, 3)
+        layout.addWidget(tables, 2)
+        self.setLayout(layout)
+        self.reload()
+
+    def _make_table(self, headers):
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        table.verticalHeader().setVisible(False)
+        table.setWordWrap(False)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        return table
+
+    def reload(self):
+        start_year, end_year = int(self.start_selector.currentText()), int(self.end_selector.currentText())
+        if start_year > end_year:
+            start_year, end_year = end_year, start_year
+        self.generation += 1
+        task = DashboardTask(self.db, start_year, end_year, self.generation)
+        task.signals.finished.connect(self.on_loaded)
+        task.signals.error.connect(self.on_error)
+        self.pool.start(task)
+
+    def on_loaded(self, generation, data):
+        if generation == self.generation:
+            self.data = data
+            self.show_data()
+
+    def on_error(self, generation, message):
+        if generation == self.generation:
+            QMessageBox.critical(self, "Error", f"Gagal memuat dashboard: {message}")
+
+    def show_data(self):
+        if self.data is None:
+            return
+        with instrumentation.span("ui.dashboard_render") as info:
+            periods = self.data.periods(GRANULARITIES[self.granularity_selector.currentIndex()][1])
+            info["periods"] = len(periods)
+            self.chart.set_data(
+                [period.label for period in periods],
+                [period.income for period in periods],
+                [period.outcome for period in periods],
+            )
+
+            self.period_table.setRowCount(len(periods))
+            for row, period in enumerate(periods):
+                self._set_row(self.period_table, row, [
+                    period.label, format_rupiah(period.income), format_rupiah(period.outcome),
+                    format_rupiah(period.difference),
+                ], QColor("red") if period.difference < 0 else None)
+
+            self.buyer_table.setRowCount(len(self.data.top_buyers))
+            for row, (buyer, total, count) in enumerate(self.data.top_buyers):
+                self._set_row(self.buyer_table, row, [buyer, format_rupiah(total), str(count)])
+
+            income = sum(period.income for period in self.data.years)
+            outcome = sum(period.outcome for period in self.data.years)
+            self.summary_label.setText(
+                f"{self.data.start_year}-{self.data.end_year}   Pemasukan: {format_rupiah(income)}   "
+                f"Pengeluaran: {format_rupiah(outcome)}   Selisih: {format_rupiah(income - outcome)}"
+            )
+            self.chart.repaint()
+
+    def _set_row(self, table, row, values, color=None):
+        for column, value in enumerate(values):
+            item = QTableWidgetItem(value)
+            if column:
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            if color is not None and column == len(values) - 1:
+                item.setForeground(color)
+            table.setItem(row, column, item)
@@ -0,0 +1,850 @@
+import os
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+from operator import itemgetter
+from pathlib import Path
+
+from instrumentation import span
+
+DB_NAME = 'kummiku.db'
+
+TRANSACTIONS_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date)",
+    "CREATE INDEX IF NOT EXISTS idx_transactions_type_date ON transactions(type, date)",
+]
+
+# Trigger yang menjaga monthly_summary tetap sama dengan isi tabel transactions
+SUMMARY_TRIGGERS = [
+    '''CREATE TRIGGER IF NOT EXISTS trg_summary_insert AFTER INSERT ON transactions BEGIN
+        INSERT INTO monthly_summary (year, month, type, total, count)
+        VALUES (CAST(substr(NEW.date, 1, 4) AS INTEGER), CAST(substr(NEW.date, 6, 2) AS INTEGER),
+                COALESCE(NEW.type, ''), COALESCE(NEW.amount, 0), 1)
+        ON CONFLICT (year, month, type) DO UPDATE SET total = total + excluded.total, count = count + 1;
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_summary_delete AFTER DELETE ON transactions BEGIN
+        UPDATE monthly_summary SET total = total - COALESCE(OLD.amount, 0), count = count - 1
+        WHERE year = CAST(substr(OLD.date, 1, 4) AS INTEGER) AND month = CAST(substr(OLD.date, 6, 2) AS INTEGER)
+          AND type = COALESCE(OLD.type, '');
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_summary_update AFTER UPDATE OF type, amount, date ON transactions BEGIN
+        UPDATE monthly_summary SET total = total - COALESCE(OLD.amount, 0), count = count - 1
+        WHERE year = CAST(substr(OLD.date, 1, 4) AS INTEGER) AND month = CAST(substr(OLD.date, 6, 2) AS INTEGER)
+          AND type = COALESCE(OLD.type, '');
+        INSERT INTO monthly_summary (year, month, type, total, count)
+        VALUES (CAST(substr(NEW.date, 1, 4) AS INTEGER), CAST(substr(NEW.date, 6, 2) AS INTEGER),
+                COALESCE(NEW.type, ''), COALESCE(NEW.amount, 0), 1)
+        ON CONFLICT (year, month, type) DO UPDATE SET total = total + excluded.total, count = count + 1;
+    END''',
+]
+
+SUMMARY_BACKFILL = '''INSERT OR REPLACE INTO monthly_summary (year, month, type, total, count)
+    SELECT CAST(substr(date, 1, 4) AS INTEGER), CAST(substr(date, 6, 2) AS INTEGER),
+           COALESCE(type, ''), SUM(COALESCE(amount, 0)), COUNT(*)
+    FROM transactions
+    GROUP BY 1, 2, 3'''
+
+# Ringkasan pemasukan per pembeli per bulan (untuk "pembeli teratas" di dashboard); baris tanpa pembeli diabaikan
+BUYER_TRIGGERS = [
+    '''CREATE TRIGGER IF NOT EXISTS trg_buyer_insert AFTER INSERT ON transactions
+        WHEN lower(NEW.type) = 'pemasukan' AND COALESCE(NEW.buyer, '') <> '' BEGIN
+        INSERT INTO buyer_summary (year, month, buyer, total, count)
+        VALUES (CAST(substr(NEW.date, 1, 4) AS INTEGER), CAST(substr(NEW.date, 6, 2) AS INTEGER),
+                NEW.buyer, COALESCE(NEW.amount, 0), 1)
+        ON CONFLICT (year, month, buyer) DO UPDATE SET total = total + excluded.total, count = count + 1;
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_buyer_delete AFTER DELETE ON transactions
+        WHEN lower(OLD.type) = 'pemasukan' AND COALESCE(OLD.buyer, '') <> '' BEGIN
+        UPDATE buyer_summary SET total = total - COALESCE(OLD.amount, 0), count = count - 1
+        WHERE year = CAST(substr(OLD.date, 1, 4) AS INTEGER) AND month = CAST(substr(OLD.date, 6, 2) AS INTEGER)
+          AND buyer = OLD.buyer;
+        DELETE FROM buyer_summary
+        WHERE year = CAST(substr(OLD.date, 1, 4) AS INTEGER) AND month = CAST(substr(OLD.date, 6, 2) AS INTEGER)
+          AND buyer = OLD.buyer AND count <= 0;
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_buyer_update AFTER UPDATE OF type, amount, date, buyer ON transactions BEGIN
+        UPDATE buyer_summary SET total = total - COALESCE(OLD.amount, 0), count = count - 1
+        WHERE lower(OLD.type) = 'pemasukan' AND COALESCE(OLD.buyer, '') <> ''
+          AND year = CAST(substr(OLD.date, 1, 4) AS INTEGER) AND month = CAST(substr(OLD.date, 6, 2) AS INTEGER)
+          AND buyer = OLD.buyer;
+        DELETE FROM buyer_summary
+        WHERE year = CAST(substr(OLD.date, 1, 4) AS INTEGER) AND month = CAST(substr(OLD.date, 6, 2) AS INTEGER)
+          AND buyer = OLD.buyer AND count <= 0;
+        INSERT INTO buyer_summary (year, month, buyer, total, count)
+        SELECT CAST(substr(NEW.date, 1, 4) AS INTEGER), CAST(substr(NEW.date, 6, 2) AS INTEGER),
+               NEW.buyer, COALESCE(NEW.amount, 0), 1
+        WHERE lower(NEW.type) = 'pemasukan' AND COALESCE(NEW.buyer, '') <> ''
+        ON CONFLICT (year, month, buyer) DO UPDATE SET total = total + excluded.total, count = count + 1;
+    END''',
+]
+
+# 🔥 Daftar migrasi skema, urutannya tidak boleh diubah.
+# Versi skema disimpan di PRAGMA user_version (= jumlah migrasi yang sudah jalan).
+MIGRATIONS = [
+    # 1: tabel dasar transaksi
+    [
+        '''CREATE TABLE IF NOT EXISTS transactions (
+            id TEXT PRIMARY KEY,
+            type TEXT,
+            amount REAL,
+            date TEXT,
+            description TEXT,
+            buyer TEXT,
+            phone TEXT,
+            address TEXT
+        )''',
+    ],
+    # 2: index untuk laporan bulanan (filter rentang tanggal & per jenis)
+    TRANSACTIONS_INDEXES,
+    # 3: ringkasan per (tahun, bulan, jenis) yang dijaga trigger, jadi total tidak perlu menjumlah baris
+    [
+        '''CREATE TABLE IF NOT EXISTS monthly_summary (
+            year INTEGER NOT NULL,
+            month INTEGER NOT NULL,
+            type TEXT NOT NULL,
+            total REAL NOT NULL DEFAULT 0,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (year, month, type)
+        ) WITHOUT ROWID''',
+        *SUMMARY_TRIGGERS,
+        SUMMARY_BACKFILL,
+    ],
+    # 4: nilai disimpan sebagai INTEGER rupiah (bukan REAL) agar penjumlahan eksak.
+    # SQLite tidak bisa mengubah tipe kolom, jadi tabel dibangun ulang lalu index, trigger & ringkasan dibuat lagi.
+    [
+        '''CREATE TABLE transactions_new (
+            id TEXT PRIMARY KEY,
+            type TEXT,
+            amount INTEGER,
+            date TEXT,
+            description TEXT,
+            buyer TEXT,
+            phone TEXT,
+            address TEXT
+        )''',
+        '''INSERT INTO transactions_new (id, type, amount, date, description, buyer, phone, address)
+            SELECT id, type, CAST(ROUND(amount) AS INTEGER), date, description, buyer, phone, address
+            FROM transactions''',
+        "DROP TABLE transactions",
+        "ALTER TABLE transactions_new RENAME TO transactions",
+        *TRANSACTIONS_INDEXES,
+        "DROP TABLE monthly_summary",
+        '''CREATE TABLE monthly_summary (
+            year INTEGER NOT NULL,
+            month INTEGER NOT NULL,
+            type TEXT NOT NULL,
+            total INTEGER NOT NULL DEFAULT 0,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (year, month, type)
+        ) WITHOUT ROWID''',
+        *SUMMARY_TRIGGERS,
+        SUMMARY_BACKFILL,
+    ],
+    # 5: index full-text (FTS5) untuk pencarian keterangan/pembeli/nomor HP/alamat.
+    # External content: teks tidak disimpan dua kali, index dijaga trigger memakai rowid transactions.
+    [
+        '''CREATE VIRTUAL TABLE transactions_fts USING fts5(
+            description, buyer, phone, address,
+            content='transactions', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )''',
+        '''CREATE TRIGGER trg_fts_insert AFTER INSERT ON transactions BEGIN
+            INSERT INTO transactions_fts (rowid, description, buyer, phone, address)
+            VALUES (NEW.rowid, NEW.description, NEW.buyer, NEW.phone, NEW.address);
+        END''',
+        '''CREATE TRIGGER trg_fts_delete AFTER DELETE ON transactions BEGIN
+            INSERT INTO transactions_fts (transactions_fts, rowid, description, buyer, phone, address)
+            VALUES ('delete', OLD.rowid, OLD.description, OLD.buyer, OLD.phone, OLD.address);
+        END''',
+        '''CREATE TRIGGER trg_fts_update AFTER UPDATE OF description, buyer, phone, address ON transactions BEGIN
+            INSERT INTO transactions_fts (transactions_fts, rowid, description, buyer, phone, address)
+            VALUES ('delete', OLD.rowid, OLD.description, OLD.buyer, OLD.phone, OLD.address);
+            INSERT INTO transactions_fts (rowid, description, buyer, phone, address)
+            VALUES (NEW.rowid, NEW.description, NEW.buyer, NEW.phone, NEW.address);
+        END''',
+        "INSERT INTO transactions_fts (transactions_fts) VALUES ('rebuild')",
+    ],
+    # 6: index (date DESC, id) untuk keyset pagination; index date lama sudah tercakup olehnya
+    [
+        "CREATE INDEX IF NOT EXISTS idx_transactions_date_id ON transactions(date DESC, id)",
+        "DROP INDEX IF EXISTS idx_transactions_date",
+    ],
+    # 7: sinkronisasi dengan server REST: antrean id yang berubah secara lokal (outbox)
+    # dan status sync (watermark updated_at, ETag, Last-Modified)
+    [
+        '''CREATE TABLE outbox (
+            seq INTEGER PRIMARY KEY,
+            trans_id TEXT NOT NULL,
+            op TEXT NOT NULL
+        )''',
+        "CREATE INDEX idx_outbox_trans_id ON outbox(trans_id)",
+        '''CREATE TABLE sync_state (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        ) WITHOUT ROWID''',
+    ],
+    # 8: ringkasan pemasukan per (tahun, bulan, pembeli) yang dijaga trigger, untuk pembeli teratas di dashboard
+    [
+        '''CREATE TABLE buyer_summary (
+            year INTEGER NOT NULL,
+            month INTEGER NOT NULL,
+            buyer TEXT NOT NULL,
+            total INTEGER NOT NULL DEFAULT 0,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (year, month, buyer)
+        ) WITHOUT ROWID''',
+        *BUYER_TRIGGERS,
+        '''INSERT INTO buyer_summary (year, month, buyer, total, count)
+            SELECT CAST(substr(date, 1, 4) AS INTEGER), CAST(substr(date, 6, 2) AS INTEGER),
+                   buyer, SUM(COALESCE(amount, 0)), COUNT(*)
+            FROM transactions
+            WHERE lower(type) = 'pemasukan' AND COALESCE(buyer, '') <> ''
+            GROUP BY 1, 2, 3''',
+    ],
+    # 9: tahun yang sudah dipindah ke file arsip per tahun (path relatif terhadap folder database)
+    [
+        '''CREATE TABLE archives (
+            year INTEGER PRIMARY KEY,
+            path TEXT NOT NULL,
+            rows INTEGER NOT NULL,
+            archived_at TEXT NOT NULL
+        )''',
+    ],
+]
+
+# Rentang setengah terbuka (date >= awal AND date < awal bulan berikutnya) agar index date terpakai.
+# Urutan tampilan tabel: date DESC, lalu id (urutan yang sama dipakai keyset pagination).
+MONTH_QUERY = """
+    SELECT id, type, amount, date, description, buyer, phone, address
+    FROM transactions
+    WHERE date >= ? AND date < ?
+    ORDER BY date DESC, id
+"""
+
+MONTH_PAGE_QUERY = MONTH_QUERY + " LIMIT ?"
+
+# Keyset: sisa baris pada tanggal yang sama dengan baris terakhir (id lebih besar) ...
+SAME_DATE_PAGE_QUERY = """
+    SELECT id, type, amount, date, description, buyer, phone, address
+    FROM transactions
+    WHERE date = ? AND id > ?
+    ORDER BY id
+    LIMIT ?
+"""
+
+# ... lalu tanggal-tanggal sebelumnya dalam bulan yang sama
+OLDER_DATES_PAGE_QUERY = """
+    SELECT id, type, amount, date, description, buyer, phone, address
+    FROM transactions
+    WHERE date >= ? AND date < ?
+    ORDER BY date DESC, id
+    LIMIT ?
+"""
+
+RANGE_QUERY = """
+    SELECT id, type, amount, date, description, buyer, phone, address
+    FROM transactions
+    WHERE date >= ? AND date < ?
+    ORDER BY date
+"""
+
+INSERT_QUERY = """
+    INSERT INTO transactions (id, type, amount, date, description, buyer, phone, address)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPDATE_QUERY = """
+    UPDATE transactions SET type=?, amount=?, date=?, description=?, buyer=?, phone=?, address=?
+    WHERE id=?
+"""
+
+DELETE_QUERY = "DELETE FROM transactions WHERE id = ?"
+
+# Tanggal lama sebelum update/delete, untuk tahu bulan mana saja yang berubah
+DATE_QUERY = "SELECT date FROM transactions WHERE id = ?"
+
+# Jumlah id per query "id IN (...)", di bawah batas parameter SQLite lama (999)
+ID_CHUNK = 500
+
+# 🔥 Arsip per tahun: tahun yang sudah lewat dipindah ke file sendiri (arsip/<nama db>-<tahun>.db),
+# di-ATTACH hanya-baca saat tahun itu dibuka. Ringkasan bulanan & pembeli tetap di database utama,
+# jadi total, dashboard & laporan lintas tahun tidak perlu membuka file arsip sama sekali.
+# Transaksi yang ditambahkan ke tahun yang sudah diarsipkan tetap masuk database utama; keduanya digabung UNION ALL.
+ARCHIVE_DIR = "arsip"
+MAX_ATTACHED_ARCHIVES = 8  # SQLite default maksimal 10 database ter-ATTACH per koneksi
+
+ARCHIVE_SCHEMA = [
+    '''CREATE TABLE {schema}.transactions (
+        id TEXT PRIMARY KEY,
+        type TEXT,
+        amount INTEGER,
+        date TEXT,
+        description TEXT,
+        buyer TEXT,
+        phone TEXT,
+        address TEXT
+    )''',
+    "CREATE INDEX {schema}.idx_transactions_date_id ON transactions(date DESC, id)",
+]
+
+ARCHIVE_COPY_QUERY = """
+    INSERT INTO {schema}.transactions (id, type, amount, date, description, buyer, phone, address)
+    SELECT id, type, amount, date, description, buyer, phone, address
+    FROM main.transactions
+    WHERE date >= ? AND date < ?
+    ORDER BY date DESC, id
+"""
+
+# Baris tahun arsip: isi file arsip + yang ditambahkan setelah diarsipkan
+ARCHIVE_SOURCE = """(
+        SELECT id, type, amount, date, description, buyer, phone, address FROM {schema}.transactions
+        UNION ALL
+        SELECT id, type, amount, date, description, buyer, phone, address FROM main.transactions
+    ) AS transactions"""
+
+_FROM_TRANSACTIONS_RE = re.compile(r"\bFROM transactions\b")
+
+# Perubahan lokal yang belum terkirim ke server; tahun itu belum boleh diarsipkan
+PENDING_OUTBOX_QUERY = """
+    SELECT COUNT(*) FROM outbox o JOIN transactions t ON t.id = o.trans_id
+    WHERE t.date >= ? AND t.date < ?
+"""
+
+# Saat mengarsipkan, ringkasan tahun itu tetap disimpan: trigger pengurang ringkasan dilepas sementara
+ARCHIVE_DISABLED_TRIGGERS = ("trg_summary_delete", "trg_buyer_delete")
+
+REBUILD_SUMMARY_QUERIES = (
+    "DELETE FROM monthly_summary WHERE year = ? AND month = ?",
+    """
+    INSERT INTO monthly_summary (year, month, type, total, count)
+    SELECT ?, ?, COALESCE(type, ''), SUM(COALESCE(amount, 0)), COUNT(*)
+    FROM transactions
+    WHERE date >= ? AND date < ?
+    GROUP BY 3
+    """,
+    "DELETE FROM buyer_summary WHERE year = ? AND month = ?",
+    """
+    INSERT INTO buyer_summary (year, month, buyer, total, count)
+    SELECT ?, ?, buyer, SUM(COALESCE(amount, 0)), COUNT(*)
+    FROM transactions
+    WHERE date >= ? AND date < ? AND lower(type) = 'pemasukan' AND COALESCE(buyer, '') <> ''
+    GROUP BY 3
+    """,
+)
+
+# Trigger per baris yang dilepas selama bulk_insert (pekerjaannya dikerjakan sekaligus di akhir)
+BULK_DISABLED_TRIGGERS = ("trg_summary_insert", "trg_buyer_insert", "trg_fts_insert")
+
+# rowid baru selalu lebih besar dari MAX(rowid) sebelum import
+BULK_FTS_QUERY = """
+    INSERT INTO transactions_fts (rowid, description, buyer, phone, address)
+    SELECT rowid, description, buyer, phone, address FROM transactions WHERE rowid > ?
+"""
+
+# Hasil pencarian diurutkan dari yang paling relevan (bm25)
+SEARCH_QUERY = """
+    SELECT t.id, t.type, t.amount, t.date, t.description, t.buyer, t.phone, t.address
+    FROM transactions_fts
+    JOIN transactions t ON t.rowid = transactions_fts.rowid
+    WHERE transactions_fts MATCH ?
+    ORDER BY transactions_fts.rank
+    LIMIT ?
+"""
+
+# Jenis selain "Pemasukan" dihitung sebagai pengeluaran, sama seperti pewarnaan tabel
+TOTALS_COLUMNS = """
+    COALESCE(SUM(CASE WHEN lower(type) = 'pemasukan' THEN total END), 0),
+    COALESCE(SUM(CASE WHEN lower(type) <> 'pemasukan' THEN total END), 0)
+"""
+
+MONTH_TOTALS_QUERY = f"SELECT {TOTALS_COLUMNS} FROM monthly_summary WHERE year = ? AND month = ?"
+
+MONTH_SUMMARY_QUERY = f"""
+    SELECT {TOTALS_COLUMNS}, COALESCE(SUM(count), 0)
+    FROM monthly_summary
+    WHERE year = ? AND month = ?
+"""
+
+PERIOD_SUMMARY_QUERY = f"""
+    SELECT year, month, {TOTALS_COLUMNS}
+    FROM monthly_summary
+    WHERE year BETWEEN ? AND ?
+    GROUP BY year, month
+    ORDER BY year, month
+"""
+
+# 🔥 Dashboard dalam satu query: per bulan, per kuartal & per tahun dari monthly_summary,
+# plus pembeli teratas dari buyer_summary. Kolom: (jenis, tahun, periode/peringkat, pemasukan, pengeluaran, pembeli);
+# untuk baris 'buyer': pemasukan = total pembelian, pengeluaran = jumlah transaksi.
+DASHBOARD_QUERY = """
+    WITH months AS (
+        SELECT year, month,
+               COALESCE(SUM(CASE WHEN lower(type) = 'pemasukan' THEN total END), 0) AS income,
+               COALESCE(SUM(CASE WHEN lower(type) <> 'pemasukan' THEN total END), 0) AS outcome
+        FROM monthly_summary
+        WHERE year BETWEEN :start AND :end
+        GROUP BY year, month
+    )
+    SELECT 'month', year, month, income, outcome, NULL FROM months
+    UNION ALL
+    SELECT 'quarter', year, (month + 2) / 3, SUM(income), SUM(outcome), NULL FROM months GROUP BY year, (month + 2) / 3
+    UNION ALL
+    SELECT 'year', year, 0, SUM(income), SUM(outcome), NULL FROM months GROUP BY year
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'buyer', NULL, ROW_NUMBER() OVER (ORDER BY SUM(total) DESC, buyer), SUM(total), SUM(count), buyer
+        FROM buyer_summary
+        WHERE year BETWEEN :start AND :end
+        GROUP BY buyer
+        ORDER BY SUM(total) DESC, buyer
+        LIMIT :top
+    )
+    ORDER BY 1, 2, 3
+"""
+
+
+class Database:
+    # 🔥 Satu koneksi awet per thread (thread UI + worker), bukan connect/close tiap klik.
+    # WAL membuat tiap commit cukup append ke file -wal, dan pembaca tidak memblokir penulis.
+    def __init__(self, path=DB_NAME, synchronous="NORMAL", cache_size=-20000,
+                 mmap_size=256 * 1024 * 1024, cached_statements=256, busy_timeout=5000):
+        self.path = path
+        self.synchronous = synchronous
+        self.cache_size = cache_size
+        self.mmap_size = mmap_size
+        self.cached_statements = cached_statements
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._write_listeners = []
+        # Jumlah commit proses ini yang sudah diumumkan lewat notify_write (lihat MainWindow.load_cached)
+        self.write_count = 0
+        migrate(self.connection())
+        self._archives = self._load_archives()
+
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _connect(self):
+        # check_same_thread=False hanya agar close() bisa menutup koneksi milik worker;
+        # tiap koneksi tetap dipakai oleh satu thread saja
+        # Dibuka sebagai URI agar file arsip bisa di-ATTACH hanya-baca (?mode=ro)
+        conn = sqlite3.connect(
+            Path(self.path).absolute().as_uri(), uri=True,
+            cached_statements=self.cached_statements, check_same_thread=False,
+        )
+        # busy_timeout dulu: pindah ke WAL pun butuh kunci jika proses lain sedang membuka file yang sama
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout)}")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute(f"PRAGMA cache_size={int(self.cache_size)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        return conn
+
+    def data_version(self):
+        # Berubah jika koneksi LAIN (thread worker, proses lain: importer.py, cli.py, aplikasi kedua) melakukan commit
+        # sejak terakhir dibaca di koneksi thread ini; commit koneksi ini sendiri tidak mengubahnya
+        return self.connection().execute("PRAGMA data_version").fetchone()[0]
+
+    def add_write_listener(self, listener):
+        # listener(months) dipanggil setelah commit dengan set "yyyy-mm" yang berubah, dari thread penulis
+        self._write_listeners.append(listener)
+
+    def remove_write_listener(self, listener):
+        if listener in self._write_listeners:
+            self._write_listeners.remove(listener)
+
+    def notify_write(self, months):
+        # Dipanggil setelah SETIAP commit dari proses ini, juga yang tidak mengubah bulan manapun (mis. outbox setelah push)
+        with self._lock:
+            self.write_count += 1
+        months = set(months)
+        if months:
+            for listener in list(self._write_listeners):
+                listener(months)
+
+    def close(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def fetch_month(self, year, month):
+        conn = self.connection()
+        with span("db.fetch_month", year=year, month=month) as info:
+            rows = conn.execute(self._for_year(conn, MONTH_QUERY, year), month_range(year, month)).fetchall()
+            info["rows"] = len(rows)
+        return rows
+
+    def fetch_page(self, year, month, after=None, limit=500):
+        # 🔥 Keyset pagination pada (date DESC, id): after = (date, id) baris terakhir halaman sebelumnya.
+        # Setiap halaman langsung mulai dari posisi di index, tanpa OFFSET yang melewati baris lama.
+        conn = self.connection()
+        start, end = month_range(year, month)
+        with span("db.fetch_page", year=year, month=month, first=after is None) as info:
+            if after is None:
+                rows = conn.execute(self._for_year(conn, MONTH_PAGE_QUERY, year), (start, end, limit)).fetchall()
+            else:
+                last_date, last_id = after
+                rows = conn.execute(
+                    self._for_year(conn, SAME_DATE_PAGE_QUERY, year), (last_date, last_id, limit)
+                ).fetchall()
+                if len(rows) < limit:
+                    rows += conn.execute(
+                        self._for_year(conn, OLDER_DATES_PAGE_QUERY, year), (start, last_date, limit - len(rows))
+                    ).fetchall()
+            info["rows"] = len(rows)
+        return rows
+
+    def iter_month(self, year, month, chunk_size=5000):
+        # 🔥 Baris dikirim per potongan (fetchmany) agar bisa dialirkan ke UI dan dibatalkan di tengah jalan
+        return self._iter_chunks(self._for_year(self.connection(), MONTH_QUERY, year), month_range(year, month), chunk_size)
+
+    def iter_range(self, start, end, chunk_size=5000):
+        # Rentang tanggal setengah terbuka [start, end), urut naik, untuk export
+        if not any(int(start[:4]) <= year <= int(end[:4]) for year in self._archives):
+            return self._iter_chunks(RANGE_QUERY, (start, end), chunk_size)
+        return self._iter_archived_range(start, end, chunk_size)
+
+    def _iter_archived_range(self, start, end, chunk_size):
+        # Rentang yang mencakup tahun arsip dibaca per tahun, masing-masing dari sumbernya sendiri
+        conn = self.connection()
+        for year in range(int(start[:4]), int(end[:4]) + 1):
+            segment_start = max(start, f"{year:04}-01-01")
+            segment_end = min(end, f"{year + 1:04}-01-01")
+            if segment_start < segment_end:
+                query = self._for_year(conn, RANGE_QUERY, year)
+                yield from self._iter_chunks(query, (segment_start, segment_end), chunk_size)
+
+    def _iter_chunks(self, query, params, chunk_size):
+        cursor = self.connection().execute(query, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cursor.close()
+
+    def _load_archives(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        return {
+            year: os.path.join(directory, path)
+            for year, path in self.connection().execute("SELECT year, path FROM archives")
+        }
+
+    def archived_years(self):
+        return sorted(self._archives)
+
+    def years(self):
+        # Tahun yang punya transaksi, termasuk yang sudah diarsipkan (ringkasannya tetap di database utama)
+        return [year for (year,) in self.connection().execute(
+            "SELECT DISTINCT year FROM monthly_summary WHERE count > 0 ORDER BY year"
+        )]
+
+    def _attach_archive(self, conn, year):
+        # ATTACH per koneksi (tiap thread punya koneksi sendiri), baru saat tahun arsip itu dibaca
+        attached = getattr(self._local, "archives", None)
+        if attached is None:
+            attached = self._local.archives = []
+        schema = f"arsip_{year}"
+        if schema not in attached:
+            if len(attached) >= MAX_ATTACHED_ARCHIVES:
+                conn.execute(f"DETACH DATABASE {attached.pop(0)}")
+            uri = Path(self._archives[year]).absolute().as_uri() + "?mode=ro"
+            conn.execute(f"ATTACH DATABASE ? AS {schema}", (uri,))
+            attached.append(schema)
+        return schema
+
+    def _for_year(self, conn, query, year):
+        if year not in self._archives:
+            return query
+        schema = self._attach_archive(conn, year)
+        return _FROM_TRANSACTIONS_RE.sub(f"FROM {ARCHIVE_SOURCE.format(schema=schema)}", query)
+
+    def _check_writable(self, conn, trans_id):
+        # Baris yang tidak ada di database utama mungkin sudah diarsipkan; arsip hanya bisa dibaca
+        if not self._archives or conn.execute(DATE_QUERY, (trans_id,)).fetchone() is not None:
+            return
+        for year in self._archives:
+            schema = self._attach_archive(conn, year)
+            if conn.execute(f"SELECT 1 FROM {schema}.transactions WHERE id = ?", (trans_id,)).fetchone():
+                raise sqlite3.OperationalError(f"Transaksi tahun {year} sudah diarsipkan dan hanya bisa dibaca")
+
+    def existing_ids(self, ids):
+        # Id yang sudah dipakai, di database utama maupun file arsip. File arsip dibuka dengan koneksi terpisah
+        # (hanya-baca): dipanggil di tengah transaksi import, dan ATTACH tidak bisa dijalankan di dalam transaksi
+        ids = list(ids)
+        sources = [self.connection()]
+        for path in self._archives.values():
+            sources.append(sqlite3.connect(Path(path).absolute().as_uri() + "?mode=ro", uri=True))
+        existing = set()
+        try:
+            for i in range(0, len(ids), ID_CHUNK):
+                chunk = ids[i:i + ID_CHUNK]
+                query = f"SELECT id FROM transactions WHERE id IN ({', '.join('?' * len(chunk))})"
+                for conn in sources:
+                    existing.update(trans_id for (trans_id,) in conn.execute(query, chunk))
+        finally:
+            for conn in sources[1:]:
+                conn.close()
+        return existing
+
+    def archive_year(self, year, directory=None):
+        # 🔥 Pindahkan satu tahun yang sudah lewat ke file arsipnya sendiri, lalu padatkan database utama.
+        # Urutan aman: file arsip ditulis & di-commit dulu, baru baris di database utama dihapus (dan tahun dicatat)
+        # dalam satu transaksi. Jika gagal di tengah, data tetap utuh di database utama.
+        if year >= date.today().year:
+            raise ValueError("Hanya tahun yang sudah lewat yang bisa diarsipkan")
+        if year in self._archives:
+            raise ValueError(f"Tahun {year} sudah diarsipkan")
+        db_directory = os.path.dirname(os.path.abspath(self.path))
+        directory = directory or os.path.join(db_directory, ARCHIVE_DIR)
+        path = os.path.join(directory, f"{Path(self.path).stem}-{year}.db")
+        start, end = f"{year:04}-01-01", f"{year + 1:04}-01-01"
+
+        conn = self.connection()
+        if conn.execute(PENDING_OUTBOX_QUERY, (start, end)).fetchone()[0]:
+            # Baris yang hilang dari database utama akan dikirim sebagai penghapusan saat push
+            raise ValueError(f"Masih ada perubahan tahun {year} yang belum tersinkron ke server, sync dulu")
+
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(path):
+            # Sisa percobaan yang gagal (belum tercatat di tabel archives)
+            os.remove(path)
+        with span("db.archive_year", year=year) as info:
+            conn.execute("ATTACH DATABASE ? AS arsip_baru", (Path(path).absolute().as_uri(),))
+            try:
+                with conn:
+                    conn.execute("BEGIN")
+                    for statement in ARCHIVE_SCHEMA:
+                        conn.execute(statement.format(schema="arsip_baru"))
+                    copied = conn.execute(ARCHIVE_COPY_QUERY.format(schema="arsip_baru"), (start, end)).rowcount
+            finally:
+                conn.execute("DETACH DATABASE arsip_baru")
+            if not copied:
+                os.remove(path)
+                raise ValueError(f"Tidak ada transaksi tahun {year}")
+
+            try:
+                with conn:
+                    conn.execute("BEGIN")
+                    # Bukan penghapusan oleh user: outbox diam (sama seperti saat menerapkan data server)
+                    conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES ('applying_remote', '1')")
+                    triggers = conn.execute(
+                        "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name IN "
+                        f"({', '.join('?' * len(ARCHIVE_DISABLED_TRIGGERS))})",
+                        ARCHIVE_DISABLED_TRIGGERS,
+                    ).fetchall()
+                    for name, _ in triggers:
+                        conn.execute(f"DROP TRIGGER {name}")
+                    deleted = conn.execute(
+                        "DELETE FROM transactions WHERE date >= ? AND date < ?", (start, end)
+                    ).rowcount
+                    if deleted != copied:
+                        # Ada transaksi baru di tahun itu selama penyalinan; batalkan & coba lagi
+                        raise sqlite3.IntegrityError(f"{copied} baris disalin tetapi {deleted} baris akan dihapus")
+                    for _, sql in triggers:
+                        conn.execute(sql)
+                    conn.execute("DELETE FROM sync_state WHERE key = 'applying_remote'")
+                    conn.execute(
+                        "INSERT INTO archives (year, path, rows, archived_at) VALUES (?, ?, ?, ?)",
+                        (year, os.path.relpath(path, db_directory), copied, datetime.now().isoformat(timespec="seconds")),
+                    )
+            except sqlite3.Error:
+                os.remove(path)
+                raise
+            self._archives = {**self._archives, year: path}
+
+            # File arsip dipadatkan sekali; database utama dipadatkan lalu index pencarian dibangun ulang (rowid bisa berubah)
+            archive = sqlite3.connect(path)
+            try:
+                archive.execute("VACUUM")
+            finally:
+                archive.close()
+            conn.execute("VACUUM")
+            self.rebuild_search_index()
+            info["rows"] = copied
+        self.notify_write(f"{year:04}-{month:02}" for month in range(1, 13))
+        return copied
+
+    def search(self, text, limit=1000):
+        # Hanya database utama; tahun yang sudah diarsipkan tidak ikut dicari
+        match = fts_query(text)
+        if not match:
+            return []
+        with span("db.search") as info:
+            rows = self.connection().execute(SEARCH_QUERY, (match, limit)).fetchall()
+            info["rows"] = len(rows)
+        return rows
+
+    def rebuild_search_index(self):
+        # Perlu dijalankan setelah VACUUM: rowid tabel tanpa INTEGER PRIMARY KEY bisa berubah
+        conn = self.connection()
+        with conn:
+            conn.execute("INSERT INTO transactions_fts (transactions_fts) VALUES ('rebuild')")
+        self.notify_write(())
+
+    def month_totals(self, year, month):
+        # 🔥 Baca dari monthly_summary: paling banyak beberapa baris, berapapun jumlah transaksinya
+        with span("db.month_totals", year=year, month=month):
+            return self.connection().execute(MONTH_TOTALS_QUERY, (year, month)).fetchone()
+
+    def month_summary(self, year, month):
+        # (pemasukan, pengeluaran, jumlah transaksi) satu bulan
+        with span("db.month_summary", year=year, month=month):
+            return self.connection().execute(MONTH_SUMMARY_QUERY, (year, month)).fetchone()
+
+    def period_summary(self, start_year, end_year):
+        # (tahun, bulan, pemasukan, pengeluaran) untuk rentang beberapa tahun sekaligus
+        return self.connection().execute(PERIOD_SUMMARY_QUERY, (start_year, end_year)).fetchall()
+
+    def dashboard(self, start_year, end_year, top=10):
+        with span("db.dashboard", start_year=start_year, end_year=end_year) as info:
+            rows = self.connection().execute(
+                DASHBOARD_QUERY, {"start": start_year, "end": end_year, "top": top}
+            ).fetchall()
+            info["rows"] = len(rows)
+        return rows
+
+    def insert_transaction(self, data):
+        # Span mencakup commit (fsync WAL), jadi durasinya = latensi simpan yang dirasakan user
+        conn = self.connection()
+        with span("db.insert_transaction"), conn:
+            conn.execute(INSERT_QUERY, data)
+        self.notify_write([data[3][:7]])
+
+    def insert_transactions(self, rows):
+        # Beberapa transaksi dalam satu commit (satu fsync), trigger tetap jalan per baris; untuk grup kecil
+        conn = self.connection()
+        with span("db.insert_transactions", rows=len(rows)), conn:
+            conn.executemany(INSERT_QUERY, rows)
+        self.notify_write(row[3][:7] for row in rows)
+
+    def bulk_insert(self, batches, progress=None):
+        # 🔥 Untuk import besar: semua batch dalam satu transaksi. Trigger ringkasan & full-text dilepas sementara
+        # (ikut di-rollback jika gagal), lalu monthly_summary & buyer_summary dihitung ulang sekali per bulan yang tersentuh
+        # dan index pencarian diisi sekaligus untuk baris baru.
+        conn = self.connection()
+        inserted = 0
+        months = set()
+        # Baris untuk tahun yang sudah diarsipkan disisipkan terakhir dengan trigger aktif: ringkasannya tidak bisa
+        # dihitung ulang dari database utama saja
+        archived_years = {f"{year:04}" for year in self._archives}
+        archived_rows = []
+        with span("db.bulk_insert") as info, conn:
+            conn.execute("BEGIN")
+            triggers = conn.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name IN "
+                f"({', '.join('?' * len(BULK_DISABLED_TRIGGERS))})",
+                BULK_DISABLED_TRIGGERS,
+            ).fetchall()
+            for name, _ in triggers:
+                conn.execute(f"DROP TRIGGER {name}")
+            last_rowid = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM transactions").fetchone()[0]
+
+            for batch in batches:
+                if archived_years:
+                    archived_rows.extend(row for row in batch if row[3][:4] in archived_years)
+                    batch = [row for row in batch if row[3][:4] not in archived_years]
+                # Urutkan per tanggal agar sisipan ke index date saling berdekatan
+                batch.sort(key=itemgetter(3))
+                conn.executemany(INSERT_QUERY, batch)
+                inserted += len(batch)
+                months.update(row[3][:7] for row in batch)
+                if progress:
+                    progress(inserted)
+
+            for year_month in months:
+                year, month = int(year_month[:4]), int(year_month[5:7])
+                start, end = month_range(year, month)
+                conn.execute(REBUILD_SUMMARY_QUERIES[0], (year, month))
+                conn.execute(REBUILD_SUMMARY_QUERIES[1], (year, month, start, end))
+                conn.execute(REBUILD_SUMMARY_QUERIES[2], (year, month))
+                conn.execute(REBUILD_SUMMARY_QUERIES[3], (year, month, start, end))
+            conn.execute(BULK_FTS_QUERY, (last_rowid,))
+
+            for _, sql in triggers:
+                conn.execute(sql)
+            if archived_rows:
+                conn.executemany(INSERT_QUERY, archived_rows)
+                inserted += len(archived_rows)
+                months.update(row[3][:7] for row in archived_rows)
+                if progress:
+                    progress(inserted)
+            info["rows"] = inserted
+        self.notify_write(months)
+        return inserted
+
+    def update_transaction(self, trans_id, data):
+        conn = self.connection()
+        self._check_writable(conn, trans_id)
+        with span("db.update_transaction"), conn:
+            old = conn.execute(DATE_QUERY, (trans_id,)).fetchone()
+            conn.execute(UPDATE_QUERY, (*data, trans_id))
+        self.notify_write([data[2][:7]] + ([old[0][:7]] if old else []))
+
+    def delete_transaction(self, trans_id):
+        conn = self.connection()
+        self._check_writable(conn, trans_id)
+        with span("db.delete_transaction"), conn:
+            old = conn.execute(DATE_QUERY, (trans_id,)).fetchone()
+            conn.execute(DELETE_QUERY, (trans_id,))
+        if old:
+            self.notify_write([old[0][:7]])
+
+
+def migrate(conn):
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= len(MIGRATIONS):
+        return
+    while True:
+        # BEGIN eksplisit: tanpa ini sqlite3 menjalankan DDL dalam mode autocommit,
+        # sehingga migrasi yang gagal di tengah jalan bisa tertinggal setengah jadi.
+        # IMMEDIATE + baca ulang user_version di dalam transaksi: beberapa proses yang membuka database
+        # bersamaan (mis. worker cli.py --jobs) menunggu giliran, bukan menjalankan migrasi yang sama dua kali
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= len(MIGRATIONS):
+                return
+            for statement in MIGRATIONS[version]:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version + 1}")
+
+
+def month_range(year, month):
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start.isoformat(), end.isoformat()
+
+
+def fts_query(text):
+    # 🔥 Input pengguna diubah jadi term FTS5 yang aman (dikutip) dengan pencarian awalan,
+    # mis. "budi jl mawar" -> "budi"* "jl"* "mawar"*, jadi operator/tanda baca tidak membuat query error
+    return " ".join(f'"{term}"*' for term in re.findall(r"\w+", text))
+
+
+def query_plan(conn, sql, params=()):
+    return [row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+
+def uses_index(conn, sql, params=(), table="transactions"):
+    # 🔥 True jika tabel dibaca lewat SEARCH pada index (rentang/kunci), bukan SCAN.
+    # "SCAN ... USING INDEX" juga ditolak: itu membaca seluruh index, mis. filter strftime() + ORDER BY date
+    found = False
+    for detail in query_plan(conn, sql, params):
+        if detail.startswith(f"SCAN {table}"):
+            return False
+        if detail.startswith(f"SEARCH {table} USING") and "INDEX" in detail:
+            found = True
+    return found
@@ -0,0 +1,48 @@
+from datetime import date
+
+# 🔥 Codec tanggal untuk tampilan: tanggal disimpan sebagai teks ISO yyyy-mm-dd, jadi cukup date.fromisoformat
+# (bukan strptime/dateutil). Nama hari & bulan diambil dari locale sekali saja, dan teks tampilan per tanggal
+# disimpan (satu bulan paling banyak 31 tanggal berbeda).
+
+DISPLAY_CACHE_SIZE = 4096
+
+_names = None
+_display_cache = {}
+
+
+def parse_date(text):
+    # "2025-03-01" atau "2025-03-01T00:00:00Z" -> date(2025, 3, 1)
+    return date.fromisoformat(text[:10])
+
+
+def locale_names():
+    # (nama hari Senin..Minggu, nama bulan Januari..Desember) sesuai LC_TIME saat pertama dipanggil
+    global _names
+    if _names is None:
+        days = tuple(date(2024, 1, day).strftime("%A") for day in range(1, 8))  # 1 Jan 2024 = Senin
+        months = tuple(date(2024, month, 1).strftime("%B") for month in range(1, 13))
+        _names = (days, months)
+    return _names
+
+
+def format_date(value):
+    # Sama dengan strftime("%A, %d %B %Y"), tanpa strftime per baris
+    days, months = locale_names()
+    return f"{days[value.weekday()]}, {value.day:02} {months[value.month - 1]} {value.year}"
+
+
+def display_date(text):
+    formatted = _display_cache.get(text)
+    if formatted is None:
+        formatted = format_date(parse_date(text))
+        if len(_display_cache) >= DISPLAY_CACHE_SIZE:
+            _display_cache.clear()
+        _display_cache[text] = formatted
+    return formatted
+
+
+def reset_locale():
+    # Panggil setelah locale.setlocale(LC_TIME, ...) diganti saat aplikasi berjalan
+    global _names
+    _names = None
+    _display_cache.clear()
@@ -0,0 +1,111 @@
+import argparse
+import csv
+import sqlite3
+import sys
+from datetime import date, timedelta
+
+from database import DB_NAME, Database, month_range
+from formatting import format_rupiah
+from reports import is_income
+
+HEADERS = ["ID", "Jenis Transaksi", "Nilai", "Tanggal", "Keterangan", "Pembeli", "Nomor HP", "Alamat"]
+
+
+class ExportResult:
+    def __init__(self):
+        self.rows = 0
+        self.total_income = 0
+        self.total_outcome = 0
+
+
+def export_file(db, path, start, end, chunk_size=5000):
+    # 🔥 Baris ditulis per potongan langsung dari cursor (memori tetap datar berapapun rentangnya),
+    # total pemasukan/pengeluaran dihitung di putaran yang sama.
+    # Nilai & tanggal ditulis mentah agar file bisa diimport kembali.
+    result = ExportResult()
+    writer = _XlsxWriter(path) if str(path).lower().endswith(".xlsx") else _CsvWriter(path)
+    with writer as write_rows:
+        write_rows([HEADERS])
+        for rows in db.iter_range(start, end, chunk_size):
+            for row in rows:
+                if is_income(row[1]):
+                    result.total_income += row[2] or 0
+                else:
+                    result.total_outcome += row[2] or 0
+            write_rows(rows)
+            result.rows += len(rows)
+    return result
+
+
+class _CsvWriter:
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        self.file = open(self.path, "w", newline="", encoding="utf-8")
+        return csv.writer(self.file).writerows
+
+    def __exit__(self, *exc):
+        self.file.close()
+
+
+class _XlsxWriter:
+    def __init__(self, path):
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ValueError("Export Excel membutuhkan paket openpyxl") from None
+        self.path = path
+        # write_only: baris langsung di-stream ke file sementara, tidak disimpan di memori
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet("Transaksi")
+
+    def __enter__(self):
+        def write_rows(rows):
+            for row in rows:
+                self.sheet.append(row)
+        return write_rows
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.workbook.save(self.path)
+        else:
+            self.workbook.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export transaksi ke file CSV/XLSX.")
+    parser.add_argument("path", help="file tujuan .csv atau .xlsx")
+    parser.add_argument("--db", default=DB_NAME, help=f"file database (default: {DB_NAME})")
+    parser.add_argument("--month", type=int, help="bulan (1-12), dipakai bersama --year")
+    parser.add_argument("--year", type=int, help="tahun; tanpa --month berarti satu tahun penuh")
+    parser.add_argument("--start", type=date.fromisoformat, help="tanggal awal (yyyy-mm-dd)")
+    parser.add_argument("--end", type=date.fromisoformat, help="tanggal akhir, ikut diexport (yyyy-mm-dd)")
+    args = parser.parse_args(argv)
+
+    if args.year and args.month:
+        start, end = month_range(args.year, args.month)
+    elif args.year:
+        start, end = f"{args.year:04}-01-01", f"{args.year + 1:04}-01-01"
+    elif args.start and args.end:
+        start, end = args.start.isoformat(), (args.end + timedelta(days=1)).isoformat()
+    else:
+        parser.error("isi --year [--month] atau --start dan --end")
+
+    db = Database(args.db)
+    try:
+        result = export_file(db, args.path, start, end)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Gagal export: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    print(f"{result.rows} transaksi diexport ke {args.path}")
+    print(f"Total Pemasukan: {format_rupiah(result.total_income)}")
+    print(f"Total Pengeluaran: {format_rupiah(result.total_outcome)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
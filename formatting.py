@@ -0,0 +1,55 @@
+import re
+from decimal import ROUND_HALF_UP, Decimal
+
+_NON_AMOUNT_RE = re.compile(r"[^0-9.]")
+
+# Nilai dengan satu titik dan 1-2 digit di belakangnya dianggap desimal (mis. "15000.5" dari spreadsheet),
+# selain itu titik adalah pemisah ribuan seperti di form ("1.250.000")
+_DECIMAL_RE = re.compile(r"^\d+\.\d{1,2}$")
+
+
+def clean_amount_input(text):
+    # 🔥 Hanya izinkan angka dan titik (dipakai oleh form dan import)
+    return _NON_AMOUNT_RE.sub("", text)
+
+
+def round_rupiah(value):
+    # Setengah dibulatkan menjauhi nol (1000.5 -> 1001, -12.5 -> -13), sama dengan CAST(ROUND(amount) AS INTEGER)
+    # di migrasi 4; round() Python membulatkan ke genap (1000.5 -> 1000)
+    return int(Decimal(str(value)).quantize(Decimal(1), ROUND_HALF_UP))
+
+
+def parse_amount(text):
+    # Hasilnya rupiah bulat (int), sesuai kolom amount INTEGER
+    text = str(text)
+    digits = text.replace(".", "")
+    # Jalur cepat untuk "1.250.000" / "1250000" yang paling sering muncul
+    if digits.isdigit() and digits.isascii() and not _DECIMAL_RE.match(text):
+        return int(digits)
+
+    cleaned = clean_amount_input(text.replace("Rp. ", ""))
+    if _DECIMAL_RE.match(cleaned):
+        return round_rupiah(cleaned)
+    digits = cleaned.replace(".", "")
+    if not digits:
+        raise ValueError(f"Nilai tidak valid: {text!r}")
+    return int(digits)
+
+
+_rupiah_cache = {}
+
+
+def format_thousands(amount):
+    # 🔥 Hasil format disimpan per nilai; nominal transaksi banyak yang berulang,
+    # jadi sebagian besar panggilan cukup satu lookup dict tanpa format().replace()
+    text = _rupiah_cache.get(amount)
+    if text is None:
+        if len(_rupiah_cache) >= 100000:
+            _rupiah_cache.clear()
+        text = f"{amount:,.0f}".replace(",", ".")
+        _rupiah_cache[amount] = text
+    return text
+
+
+def format_rupiah(amount):
+    return "Rp. " + format_thousands(amount or 0)
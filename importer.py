@@ -0,0 +1,213 @@
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+from datetime import date, datetime
+from operator import itemgetter
+
+from database import DB_NAME, Database
+from formatting import parse_amount
+
+# Nama kolom yang dikenali di baris header (huruf kecil), termasuk judul kolom di tabel aplikasi
+HEADER_ALIASES = {
+    "id": "id",
+    "type": "type", "jenis": "type", "jenis transaksi": "type",
+    "amount": "amount", "nilai": "amount", "jumlah": "amount",
+    "date": "date", "tanggal": "date",
+    "description": "description", "keterangan": "description",
+    "buyer": "buyer", "pembeli": "buyer",
+    "phone": "phone", "nomor hp": "phone", "no.hp": "phone",
+    "address": "address", "alamat": "address",
+}
+
+FIELDS = ("id", "type", "amount", "date", "description", "buyer", "phone", "address")
+
+TRANSACTION_TYPES = {
+    "pemasukan": "Pemasukan", "pengeluaran": "Pengeluaran",
+    "Pemasukan": "Pemasukan", "Pengeluaran": "Pengeluaran",
+}
+
+
+class ImportResult:
+    def __init__(self):
+        self.inserted = 0
+        self.rejected = []  # (nomor baris, alasan, isi baris)
+
+
+def import_file(db, path, batch_size=50000, progress=None):
+    # 🔥 Baris dibaca & divalidasi secara streaming, lalu masuk per batch (executemany) dalam SATU transaksi.
+    # progress(inserted, rejected) dipanggil setiap satu batch selesai.
+    result = ImportResult()
+    records = _iter_records(path)
+    columns = _map_header(next(records, None))
+
+    def batches():
+        batch = []
+        sources = []  # (nomor baris, isi baris) untuk tiap baris di batch
+        seen = set()
+        for line_no, raw in enumerate(records, start=2):
+            try:
+                row = _normalize_row(raw, columns)
+                if row[0]:
+                    if row[0] in seen:
+                        raise ValueError(f"ID ganda dalam file: {row[0]}")
+                    seen.add(row[0])
+            except ValueError as e:
+                result.rejected.append((line_no, str(e), raw))
+                continue
+            batch.append(row)
+            sources.append((line_no, raw))
+            if len(batch) >= batch_size:
+                yield _assign_ids(_drop_existing(db, batch, sources, result))
+                batch = []
+                sources = []
+        if batch:
+            yield _assign_ids(_drop_existing(db, batch, sources, result))
+
+    def report(inserted):
+        result.inserted = inserted
+        if progress:
+            progress(inserted, len(result.rejected))
+
+    # Nilai kembalian, bukan progress terakhir: baris tahun arsip disisipkan setelah semua batch
+    result.inserted = db.bulk_insert(batches(), report)
+    result.rejected.sort(key=itemgetter(0))
+    return result
+
+
+def _iter_records(path):
+    if str(path).lower().endswith(".xlsx"):
+        yield from _iter_xlsx(path)
+        return
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        yield from csv.reader(f)
+
+
+def _iter_xlsx(path):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("Import Excel membutuhkan paket openpyxl") from None
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for values in workbook.active.iter_rows(values_only=True):
+            yield [_cell_text(value) for value in values]
+    finally:
+        workbook.close()
+
+
+def _cell_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()[:10]
+    return str(value)
+
+
+def _map_header(header):
+    if not header:
+        raise ValueError("File kosong atau tidak memiliki header")
+
+    columns = {}
+    for index, name in enumerate(header):
+        field = HEADER_ALIASES.get(name.strip().lower())
+        if field and field not in columns:
+            columns[field] = index
+
+    missing = [field for field in ("type", "amount", "date") if field not in columns]
+    if missing:
+        raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(missing)}")
+    return [columns.get(field) for field in FIELDS]
+
+
+def _normalize_row(raw, columns):
+    size = len(raw)
+    values = [raw[index].strip() if index is not None and index < size else "" for index in columns]
+    trans_type = values[1]
+
+    normalized_type = TRANSACTION_TYPES.get(trans_type) or TRANSACTION_TYPES.get(trans_type.lower())
+    if normalized_type is None:
+        raise ValueError(f"Jenis transaksi tidak dikenal: {trans_type!r}")
+
+    values[1] = normalized_type
+    values[2] = parse_amount(values[2])
+    values[3] = normalize_date(values[3])
+    return values
+
+
+def _drop_existing(db, batch, sources, result):
+    # Id yang sudah ada di database (mis. file hasil export diimport ulang) ditolak per baris,
+    # bukan menggagalkan seluruh import dengan UNIQUE constraint
+    existing = db.existing_ids(row[0] for row in batch if row[0])
+    if not existing:
+        return batch
+    kept = []
+    for row, (line_no, raw) in zip(batch, sources):
+        if row[0] in existing:
+            result.rejected.append((line_no, f"ID sudah ada di database: {row[0]}", raw))
+        else:
+            kept.append(row)
+    return kept
+
+
+def _assign_ids(batch):
+    # Baris tanpa id diberi uuid4 baru; dibuat sekaligus per batch
+    missing = [row for row in batch if not row[0]]
+    for row, new_id in zip(missing, _random_ids(len(missing))):
+        row[0] = new_id
+    return batch
+
+
+_UUID_VARIANT = {char: "89ab"[int(char, 16) & 3] for char in "0123456789abcdef"}
+
+
+def _random_ids(count):
+    # 🔥 Setara str(uuid.uuid4()), tapi satu panggilan os.urandom untuk seluruh batch (uuid4 per baris jauh lebih lambat)
+    raw = os.urandom(16 * count).hex()
+    for i in range(0, 32 * count, 32):
+        s = raw[i:i + 32]
+        yield f"{s[:8]}-{s[8:12]}-4{s[13:16]}-{_UUID_VARIANT[s[16]]}{s[17:20]}-{s[20:32]}"
+
+
+def normalize_date(text):
+    # Format penyimpanan: yyyy-MM-dd; juga menerima dd/mm/yyyy dan dd-mm-yyyy
+    if len(text) >= 10 and text[4] == "-":
+        return date.fromisoformat(text[:10]).isoformat()
+    for fmt in ("%d/%m/%Y", "%d-%m-%Y"):
+        try:
+            return datetime.strptime(text, fmt).date().isoformat()
+        except ValueError:
+            pass
+    raise ValueError(f"Tanggal tidak valid: {text!r}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import transaksi dari file CSV/XLSX ke database.")
+    parser.add_argument("path", help="file .csv atau .xlsx dengan baris header")
+    parser.add_argument("--db", default=DB_NAME, help=f"file database (default: {DB_NAME})")
+    parser.add_argument("--batch-size", type=int, default=50000)
+    args = parser.parse_args(argv)
+
+    db = Database(args.db)
+    try:
+        result = import_file(
+            db, args.path, args.batch_size,
+            progress=lambda inserted, rejected: print(f"\r{inserted} baris masuk, {rejected} ditolak", end="", file=sys.stderr),
+        )
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Gagal import: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    print(file=sys.stderr)
+    for line_no, reason, raw in result.rejected:
+        print(f"Baris {line_no} ditolak: {reason} {raw}")
+    print(f"Selesai: {result.inserted} baris masuk, {len(result.rejected)} ditolak")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
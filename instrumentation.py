@@ -0,0 +1,133 @@
+import json
+import logging
+import os
+import threading
+import time
+
+# 🔥 Instrumentasi opt-in (KUMMIKU_PERF=1 [KUMMIKU_PERF_LOG=file] atau main.py --perf):
+# durasi query, jumlah baris, isi tabel, gambar tabel, latensi commit, dll.
+# Tiap kejadian ditulis sebagai satu baris JSON ke logger "kummiku.perf" dan dikirim ke listener (overlay UI).
+# Saat tidak aktif, span() mengembalikan objek kosong yang sama, jadi biaya di jalur panas hampir nol.
+# Modul ini tidak bergantung pada Qt.
+
+ENV_VAR = "KUMMIKU_PERF"
+LOG_ENV_VAR = "KUMMIKU_PERF_LOG"
+
+logger = logging.getLogger("kummiku.perf")
+
+_enabled = False
+_listeners = []
+
+
+def enabled():
+    return _enabled
+
+
+def enable(log_file=None):
+    global _enabled
+    _enabled = True
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    handler = logging.FileHandler(log_file, encoding="utf-8") if log_file else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def add_listener(listener):
+    # listener(event) dipanggil dari thread tempat kejadian terjadi (bisa thread worker)
+    _listeners.append(listener)
+
+
+def remove_listener(listener):
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+class _NoSpan:
+    def __enter__(self):
+        return {}
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _Span:
+    __slots__ = ("name", "fields", "started")
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self.fields
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.fields["error"] = exc_type.__name__
+        emit(self.name, (time.perf_counter() - self.started) * 1000, **self.fields)
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name, **fields):
+    # with span("db.fetch_page", year=2025) as info: ...; info["rows"] = len(rows)
+    if not _enabled:
+        return _NO_SPAN
+    return _Span(name, fields)
+
+
+def emit(name, ms, **fields):
+    if not _enabled:
+        return
+    event = {"event": name, "ms": round(ms, 3), "thread": threading.current_thread().name, **fields}
+    logger.info(json.dumps(event, ensure_ascii=False, default=str))
+    for listener in list(_listeners):
+        listener(event)
+
+
+def profile_call(name, func, *args, directory="profiles", **kwargs):
+    # Rekam satu aksi dengan pyinstrument (HTML) jika terpasang, selain itu cProfile (.prof, buka dengan pstats/snakeviz).
+    # Hanya thread pemanggil yang terekam; jalankan aksinya secara sinkron agar query ikut terlihat.
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}")
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        Profiler = None
+
+    if Profiler is not None:
+        profiler = Profiler()
+        profiler.start()
+        try:
+            func(*args, **kwargs)
+        finally:
+            profiler.stop()
+            path = base + ".html"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(profiler.output_html())
+    else:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            path = base + ".prof"
+            profiler.dump_stats(path)
+
+    emit("profile.saved", 0, action=name, path=path)
+    return path
+
+
+if os.environ.get(ENV_VAR, "") not in ("", "0"):
+    enable(os.environ.get(LOG_ENV_VAR))
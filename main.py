@@ -1,37 +1,143 @@
+import time
+# 🔥 Dicatat sebelum import lain: waktu startup diukur dari sini sampai jendela pertama kali tergambar
+STARTUP_STARTED = time.perf_counter()
+
+import os
 import sys
-import requests
-import uuid
+import json
+import argparse
 import sqlite3
 import locale
 from datetime import datetime
-from dateutil import parser
-from PyQt6.QtWidgets import QApplication, QHeaderView, QDateEdit, QStyle, QComboBox, QWidget, QVBoxLayout, QPushButton, QTableWidget, QFrame, QTableWidgetItem, QMessageBox, QLineEdit, QLabel, QFormLayout, QHBoxLayout
-from PyQt6.QtCore import QDate, Qt
-from PyQt6.QtGui import QColor, QBrush, QFont, QIcon
+from PyQt6.QtWidgets import QApplication, QHeaderView, QDateEdit, QStyle, QComboBox, QWidget, QVBoxLayout, QPushButton, QTableView, QFrame, QMessageBox, QLineEdit, QLabel, QFormLayout, QHBoxLayout, QFileDialog, QCheckBox, QInputDialog
+from PyQt6.QtCore import QDate, Qt, QThreadPool, QTimer
+from PyQt6.QtGui import QFont, QIcon, QKeySequence, QShortcut
+import instrumentation
+from batching import GroupCommitter
+from month_cache import MonthCache
+from perf_overlay import PerfOverlay, TimedTableView
+from toast import Toast
+from transaction_model import COL_BUYER, COL_DATE, COL_DESCRIPTION, COL_TYPE, TransactionTableModel
+from database import DB_NAME, Database, month_range
+from formatting import clean_amount_input, format_rupiah, parse_amount
+from workers import LoadTransactionsTask, LoadRestTask, ImportTask, ExportTask, SearchTask, SyncTask, ArchiveTask, BackupTask
+
+IMPORTS_DONE = time.perf_counter()
+
+# Jumlah baris per halaman tabel; halaman berikutnya dimuat saat tabel digulir ke bawah
+PAGE_SIZE = 500
+
+# Jeda sync setelah perubahan lokal (beberapa perubahan beruntun dikirim sekaligus) & interval sync berkala
+SYNC_DELAY_MS = 2000
+SYNC_INTERVAL_MS = 60000
+
+# Mode input cepat: transaksi baru disimpan berkelompok, paling lama ENTRY_WINDOW_MS setelah diinput
+# atau segera setelah ENTRY_BATCH transaksi terkumpul
+ENTRY_WINDOW_MS = 1000
+ENTRY_BATCH = 20
+
+# Batas memori cache bulan yang baru dibuka (MB); 0 = tanpa cache
+MONTH_CACHE_MB = 64
+
+# Snapshot database berkala di latar belakang (menit); 0 = mati
+BACKUP_INTERVAL_MIN = 30
+
+def setup_locale():
+    # Set locale untuk menampilkan nama hari & bulan dalam bahasa Indonesia
+    try:
+        locale.setlocale(locale.LC_TIME, "id_ID.UTF-8")  # Linux/Mac
+    except locale.Error:
+        try:
+            locale.setlocale(locale.LC_TIME, "English_Indonesia.1252")  # Windows
+        except locale.Error:
+            locale.setlocale(locale.LC_TIME, "")  # Gunakan default OS
 
-DB_NAME = 'kummiku.db'
 
 class TransactionApp(QWidget):
-    def __init__(self):
+    def __init__(self, sync_url=None, measure_startup=False, entry_window_ms=ENTRY_WINDOW_MS, entry_batch=ENTRY_BATCH,
+                 month_cache_mb=MONTH_CACHE_MB, backup_interval_min=BACKUP_INTERVAL_MIN, backup_dir=None):
         super().__init__()
+        # 🔥 Tahap startup (ms sejak proses mulai): import, gambar pertama, load pertama selesai
+        self.measure_startup = measure_startup
+        self.startup_times = {"imports_ms": round((IMPORTS_DONE - STARTUP_STARTED) * 1000, 1)}
+        setup_locale()
         self.init_db()
+        self.init_cache(month_cache_mb)
+        self.init_sync(sync_url)
+        self.init_backup(backup_interval_min, backup_dir)
+        self.committer = GroupCommitter(self.db, entry_window_ms, entry_batch, self)
+        self.committer.committed.connect(self.on_entries_committed)
+        self.committer.failed.connect(self.on_entries_failed)
+
+        # 🔥 Pool khusus untuk load data; thread tidak kedaluwarsa agar koneksi per-thread tetap awet
+        self.load_pool = QThreadPool(self)
+        self.load_pool.setMaxThreadCount(2)
+        self.load_pool.setExpiryTimeout(-1)
+        # Tugas panjang tidak memakai load_pool, agar load bulan & pencarian selalu dapat thread:
+        # sync (bisa menunggu timeout + retry saat offline) punya thread sendiri, import/export/arsip/backup di task_pool
+        self.sync_pool = QThreadPool(self)
+        self.sync_pool.setMaxThreadCount(1)
+        self.sync_pool.setExpiryTimeout(-1)
+        self.task_pool = QThreadPool(self)
+        self.task_pool.setMaxThreadCount(2)
+        self.task_pool.setExpiryTimeout(-1)
+        self.load_task = None
+        self.load_generation = 0
+        self.import_task = None
+        self.export_task = None
+        self.archive_task = None
+        self.loaded_period = None
+        self.search_active = False
+        self.load_started = None
+        self.profiling = False
+        self.perf_overlay = None
+        self.dashboard = None
+        self.total_income = 0
+        self.total_outcome = 0
         self.initUI()
 
     def init_db(self):
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute('''CREATE TABLE IF NOT EXISTS transactions (
-            id TEXT PRIMARY KEY,
-            type TEXT,
-            amount REAL,
-            date TEXT,
-            description TEXT,
-            buyer TEXT,
-            phone TEXT,
-            address TEXT
-        )''')
-        conn.commit()
-        conn.close()
+        # 🔥 Koneksi dibuka sekali dan dipakai selama aplikasi berjalan
+        self.db = Database(DB_NAME)
+
+    def init_cache(self, month_cache_mb):
+        # 🔥 Bulan yang baru dibuka disimpan di memori; tiap tulisan ke database membuang bulan yang berubah saja
+        self.month_cache = None
+        self.cache_data_version = None
+        self.cache_write_count = None
+        if month_cache_mb > 0:
+            self.month_cache = MonthCache(month_cache_mb * 1024 * 1024)
+            self.db.add_write_listener(self.month_cache.invalidate)
+
+    def init_backup(self, interval_min, directory):
+        # 🔥 Snapshot berkala memakai backup API SQLite (per beberapa halaman), tidak memblokir UI maupun penulisan
+        self.backup_task = None
+        self.backup_dir = directory
+        self.backup_timer = QTimer(self)
+        self.backup_timer.setInterval(interval_min * 60 * 1000)
+        self.backup_timer.timeout.connect(self.start_backup)
+        if interval_min > 0:
+            self.backup_timer.start()
+
+    def init_sync(self, sync_url):
+        # 🔥 Mode offline-first: data tetap dibaca & ditulis ke SQLite lokal, server REST hanya diajak sync
+        self.replica = None
+        self.sync_task = None
+        if not sync_url:
+            return
+        from backends import RestBackend
+        from sync import Replica
+        self.replica = Replica(self.db, RestBackend(sync_url))
+
+        self.sync_timer = QTimer(self)
+        self.sync_timer.setSingleShot(True)
+        self.sync_timer.setInterval(SYNC_DELAY_MS)
+        self.sync_timer.timeout.connect(self.start_sync)
+        self.sync_interval = QTimer(self)
+        self.sync_interval.setInterval(SYNC_INTERVAL_MS)
+        self.sync_interval.timeout.connect(self.start_sync)
+        self.sync_interval.start()
+        QTimer.singleShot(0, self.start_sync)
 
     def initUI(self):
         self.setWindowTitle("Transaksi Manager Kummiku")
@@ -40,17 +146,90 @@ class TransactionApp(QWidget):
         layout = QVBoxLayout()
 
         # 🔥 Tabel Transaksi
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels(["ID", "Jenis Transaksi", "Nilai", "Tanggal", "Keterangan", "Pembeli", "Nomor HP", "Alamat"])
+        self.model = TransactionTableModel(self)
+        self.model.rest_needed.connect(self.load_rest)
+        self.table = TimedTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        # Sembunyikan kolom ID
+        self.table.hideColumn(0)
         # 🔥 Pengaturan ukuran kolom
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # 🔥 Klik header untuk mengurutkan (di memori, tanpa query); Tanggal menurun = urutan bawaan
+        self.table.horizontalHeader().setSortIndicator(COL_DATE, Qt.SortOrder.DescendingOrder)
+        self.table.setSortingEnabled(True)
         
         self.loat_data = QPushButton("Loat Data")
         self.loat_data.clicked.connect(self.load_transactions)
         self.loat_data.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload))
-        layout.addWidget(self.loat_data)
+
+        # 🔥 Import massal dari CSV/XLSX
+        self.import_button = QPushButton("Import CSV")
+        self.import_button.clicked.connect(self.import_transactions)
+        self.import_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOpenButton))
+
+        # 🔥 Export laporan bulan yang dipilih ke CSV/XLSX
+        self.export_button = QPushButton("Export")
+        self.export_button.clicked.connect(self.export_transactions)
+        self.export_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton))
+
+        # 🔥 Dashboard beberapa tahun (per bulan/kuartal/tahun + pembeli teratas)
+        self.dashboard_button = QPushButton("Dashboard")
+        self.dashboard_button.clicked.connect(self.open_dashboard)
+        self.dashboard_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
+
+        toolbar_layout = QHBoxLayout()
+        toolbar_layout.addWidget(self.loat_data)
+        toolbar_layout.addWidget(self.import_button)
+        toolbar_layout.addWidget(self.export_button)
+        toolbar_layout.addWidget(self.dashboard_button)
+
+        # 🔥 Pindahkan tahun yang sudah lewat ke file arsip per tahun agar database utama tetap kecil
+        self.archive_button = QPushButton("Arsipkan Tahun")
+        self.archive_button.clicked.connect(self.archive_year)
+        self.archive_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DirClosedIcon))
+        toolbar_layout.addWidget(self.archive_button)
+
+        # 🔥 Pencarian seluruh riwayat (FTS5); query baru dijalankan setelah user berhenti mengetik
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Cari keterangan, pembeli, nomor HP, alamat...")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(300)
+        self.search_timer.timeout.connect(self.run_search)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        toolbar_layout.addWidget(self.search_input)
+        self.sync_label = QLabel("")
+        self.sync_label.setVisible(self.replica is not None)
+        toolbar_layout.addWidget(self.sync_label)
+        layout.addLayout(toolbar_layout)
+
+        # 🔥 Saring cepat baris bulan yang sedang tampil (jenis, pembeli, keterangan), tanpa query ulang
+        quick_filter_layout = QHBoxLayout()
+        self.type_filter = QComboBox()
+        self.type_filter.addItems(["Semua Jenis", "Pemasukan", "Pengeluaran"])
+        self.type_filter.currentIndexChanged.connect(self.apply_quick_filters)
+        self.buyer_filter = QLineEdit()
+        self.buyer_filter.setPlaceholderText("Saring pembeli...")
+        self.buyer_filter.setClearButtonEnabled(True)
+        self.desc_filter = QLineEdit()
+        self.desc_filter.setPlaceholderText("Saring keterangan...")
+        self.desc_filter.setClearButtonEnabled(True)
+        self.quick_filter_timer = QTimer(self)
+        self.quick_filter_timer.setSingleShot(True)
+        self.quick_filter_timer.setInterval(150)
+        self.quick_filter_timer.timeout.connect(self.apply_quick_filters)
+        self.buyer_filter.textChanged.connect(self.quick_filter_timer.start)
+        self.desc_filter.textChanged.connect(self.quick_filter_timer.start)
+        self.filter_count_label = QLabel("")
+        quick_filter_layout.addWidget(self.type_filter)
+        quick_filter_layout.addWidget(self.buyer_filter)
+        quick_filter_layout.addWidget(self.desc_filter)
+        quick_filter_layout.addWidget(self.filter_count_label)
+        layout.addLayout(quick_filter_layout)
         layout.addWidget(self.table)
+        self.model.modelReset.connect(self.update_filter_count)
 
         # 🔥 Filter Bulan & Tahun
         filter_layout = QHBoxLayout()
@@ -58,11 +237,12 @@ class TransactionApp(QWidget):
         self.month_selector.addItems(["Januari", "Februari", "Maret", "April", "Mei", "Juni", "Juli", "Agustus", "September", "Oktober", "November", "Desember"])
         self.month_selector.setCurrentIndex(datetime.now().month - 1)
         self.year_selector = QComboBox()
-        current_year = datetime.now().year
-        self.year_selector.addItems([str(year) for year in range(current_year - 5, current_year + 1)])
-        self.year_selector.setCurrentText(str(current_year))
+        self.fill_year_selector(datetime.now().year)
         self.load_report_button = QPushButton("Lihat Laporan")
         self.load_report_button.clicked.connect(self.load_transactions)
+        # Ganti bulan/tahun langsung memuat ulang (load sebelumnya dibatalkan)
+        self.month_selector.currentIndexChanged.connect(self.load_transactions)
+        self.year_selector.currentIndexChanged.connect(self.load_transactions)
         filter_layout.addWidget(QLabel("Bulan:"))
         filter_layout.addWidget(self.month_selector)
         filter_layout.addWidget(QLabel("Tahun:"))
@@ -116,10 +296,12 @@ class TransactionApp(QWidget):
         self.type_input.currentIndexChanged.connect(self.toggle_buyer_fields) # Event untuk hide/show
         self.amount_input = QLineEdit()
         self.amount_input.textChanged.connect(self.validate_amount_input)
+        self.amount_input.returnPressed.connect(self.on_entry_return)
         self.date_input = QDateEdit()
         self.date_input.setCalendarPopup(True)
         self.date_input.setDate(QDate.currentDate())
         self.desc_input = QLineEdit()
+        self.desc_input.returnPressed.connect(self.on_entry_return)
         self.buyer_input = QLineEdit()
         self.phone_input = QLineEdit()
         self.address_input = QLineEdit()
@@ -162,24 +344,75 @@ class TransactionApp(QWidget):
         self.reset_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogResetButton))
         button_layout.addWidget(self.reset_button)
 
+        # 🔥 Input cepat (kasir): Enter di kolom keterangan/amount langsung menyimpan, tanpa dialog konfirmasi
+        self.rapid_entry = QCheckBox("Input Cepat")
+        self.rapid_entry.setToolTip("Transaksi baru disimpan berkelompok; Enter untuk menyimpan")
+        button_layout.addWidget(self.rapid_entry)
+
         layout.addLayout(button_layout)
 
         self.setLayout(layout)
+        self.toast = Toast(self)
 
-        # 🔥 Load data saat aplikasi pertama kali dijalankan
-        self.load_transactions()
+        # 🔥 Instrumentasi (opt-in): Ctrl+Shift+P tampilkan/sembunyikan overlay, Ctrl+Shift+R profil satu kali load
+        if instrumentation.enabled():
+            self.perf_overlay = PerfOverlay(self)
+            QShortcut(QKeySequence("Ctrl+Shift+P"), self, self.perf_overlay.toggle)
+            QShortcut(QKeySequence("Ctrl+Shift+R"), self, self.profile_load)
+
+        # 🔥 Load data pertama dijadwalkan setelah jendela tampil (event loop berjalan), bukan sebelum show()
+        QTimer.singleShot(0, self.load_transactions)
 
         # 🔥 Klik tabel untuk isi form
-        self.table.cellClicked.connect(self.fill_form)
-    
-    # Set locale untuk menampilkan nama hari & bulan dalam bahasa Indonesia
-    try:
-        locale.setlocale(locale.LC_TIME, "id_ID.UTF-8")  # Linux/Mac
-    except locale.Error:
-        try:
-            locale.setlocale(locale.LC_TIME, "English_Indonesia.1252")  # Windows
-        except locale.Error:
-            locale.setlocale(locale.LC_TIME, "")  # Gunakan default OS
+        self.table.clicked.connect(self.fill_form)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if "first_paint_ms" not in self.startup_times:
+            self.record_startup("first_paint_ms")
+
+    def record_startup(self, stage):
+        elapsed = (time.perf_counter() - STARTUP_STARTED) * 1000
+        self.startup_times[stage] = round(elapsed, 1)
+        instrumentation.emit("ui.startup", elapsed, stage=stage)
+        if self.measure_startup and "first_paint_ms" in self.startup_times and "first_load_ms" in self.startup_times:
+            # --measure-startup: cetak hasil (JSON) lalu keluar, dipakai benchmarks/startup.py
+            print(json.dumps(self.startup_times), flush=True)
+            QTimer.singleShot(0, QApplication.quit)
+
+    def closeEvent(self, event):
+        # Simpan transaksi yang masih antre sebelum koneksi ditutup
+        self.committer.flush()
+        if self.committer.pending_count():
+            reply = QMessageBox.question(
+                self,
+                "Transaksi Belum Tersimpan",
+                f"{self.committer.pending_count()} transaksi belum bisa disimpan (database sedang dipakai). "
+                "Tutup aplikasi tanpa menyimpannya?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No,
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+        if self.month_cache is not None:
+            self.db.remove_write_listener(self.month_cache.invalidate)
+        if self.load_task is not None:
+            self.load_task.cancel()
+        self.backup_timer.stop()
+        if self.replica is not None:
+            self.sync_interval.stop()
+            self.sync_timer.stop()
+        self.load_pool.waitForDone()
+        self.sync_pool.waitForDone()
+        self.task_pool.waitForDone()
+        if self.perf_overlay is not None:
+            self.perf_overlay.close_overlay()
+        if self.replica is not None:
+            self.replica.backend.close()
+        self.db.close()
+        super().closeEvent(event)
+
     def toggle_buyer_fields(self):
         is_income = self.type_input.currentText() == "Pemasukan"
         self.buyer_label.setVisible(is_income)
@@ -190,26 +423,25 @@ class TransactionApp(QWidget):
         self.address_input.setVisible(is_income)
     
     
-    def fill_form(self, row, column):
-        self.selected_id = self.table.item(row, 0).text()
+    def fill_form(self, index):
+        row = self.model.row_data(index.row())
+        self.selected_id = row[0]
+        self.selected_row = row
 
         # 🔥 Set pilihan yang sesuai di ComboBox
-        type_text = self.table.item(row, 1).text()
-        index = self.type_input.findText(type_text)  # Cari index sesuai text
-        if index != -1:
-            self.type_input.setCurrentIndex(index)
+        type_index = self.type_input.findText(row[1])  # Cari index sesuai text
+        if type_index != -1:
+            self.type_input.setCurrentIndex(type_index)
 
-        self.amount_input.setText(self.table.item(row, 2).text())
+        self.amount_input.setText(self.model.display_text(row, 2))
 
-        # 🔥 Ubah format date agar sesuai dengan QDate
-        date_text = self.table.item(row, 3).text()
-        date_obj = QDate.fromString(date_text, "dddd, dd MMMM yyyy")  # Format yang sudah digunakan di tabel
-        self.date_input.setDate(date_obj)
+        # 🔥 Tanggal diambil dari nilai mentah (yyyy-MM-dd), bukan teks yang sudah dilokalkan
+        self.date_input.setDate(QDate.fromString(row[3], "yyyy-MM-dd"))
 
-        self.desc_input.setText(self.table.item(row, 4).text())
-        self.buyer_input.setText(self.table.item(row, 5).text())
-        self.phone_input.setText(self.table.item(row, 6).text())
-        self.address_input.setText(self.table.item(row, 7).text())
+        self.desc_input.setText(self.model.display_text(row, 4))
+        self.buyer_input.setText(self.model.display_text(row, 5))
+        self.phone_input.setText(self.model.display_text(row, 6))
+        self.address_input.setText(self.model.display_text(row, 7))
 
     def clear_form(self):
         self.type_input.setCurrentIndex(0)
@@ -220,84 +452,441 @@ class TransactionApp(QWidget):
         self.phone_input.clear()
         self.address_input.clear()
         self.selected_id = None  # Reset selected_id saat form dihapus
+        self.selected_row = None
         
     def validate_amount_input(self):
         text = self.amount_input.text()
 
         # 🔥 Hanya izinkan angka dan titik
-        new_text = "".join([char for char in text if char.isdigit() or char == "."])
+        new_text = clean_amount_input(text)
 
         # Jika terjadi perubahan, update input
         if text != new_text:
             self.amount_input.setText(new_text)
     
     def load_transactions(self):
+        # Transaksi yang masih antre disimpan dulu agar ikut terbaca
+        self.committer.flush()
+        # Ambil bulan & tahun yang dipilih
+        selected_month = self.month_selector.currentIndex() + 1
+        selected_year = int(self.year_selector.currentText())
+
+        # 🔥 Batalkan load yang masih berjalan, hasilnya sudah tidak relevan
+        if self.load_task is not None:
+            self.load_task.cancel()
+            self.load_task = None
+        self.load_generation += 1
+
+        # Saat tabel diurut/disaring seluruh bulan harus dimuat: dibaca worker, bukan lewat cache di thread UI
+        fetch_all = self.model.view_active()
+        if not fetch_all and self.load_cached(selected_year, selected_month):
+            return
+
+        # Query data transaksi berdasarkan bulan & tahun (di thread pool, bukan di thread UI)
+        task = LoadTransactionsTask(
+            self.db, selected_year, selected_month, self.load_generation, PAGE_SIZE, self.month_cache, fetch_all
+        )
+        task.signals.totals.connect(self.on_totals_loaded)
+        task.signals.chunk.connect(self.on_rows_loaded)
+        task.signals.rest.connect(self.on_rest_loaded)
+        task.signals.finished.connect(self.on_load_finished)
+        task.signals.error.connect(self.on_load_error)
+        self.load_task = task
+
+        self.search_active = False
+        self.loaded_period = f"{selected_year:04}-{selected_month:02}"
+        self.model.set_rows(
+            [], lambda after, limit: self.db.fetch_page(selected_year, selected_month, after, limit), PAGE_SIZE,
+            rest_pending=fetch_all,
+        )
+        self.start_load_task(task)
+
+    def load_cached(self, year, month):
+        # Bulan yang ada di cache ditampilkan langsung di thread UI, tanpa query
+        period = f"{year:04}-{month:02}"
+        if self.month_cache is None:
+            return False
+        # notify_write hanya terlihat di proses ini; tulisan proses lain (importer.py, cli.py archive, aplikasi kedua)
+        # terdeteksi lewat data_version. data_version juga berubah karena commit thread worker & sync proses ini,
+        # yang bulannya sudah dibuang notify_write: cache hanya dikosongkan jika write_count tidak ikut naik.
+        # write_count dibaca dulu, jadi commit yang belum sempat diumumkan dianggap tulisan proses lain
+        writes = self.db.write_count
+        version = self.db.data_version()
+        changed = version != self.cache_data_version
+        external = changed and writes == self.cache_write_count
+        self.cache_data_version, self.cache_write_count = version, writes
+        if external:
+            self.month_cache.clear()
+            return False
+        entry = self.month_cache.get(period)
+        if entry is None:
+            return False
+        if changed and tuple(self.db.month_totals(year, month)) != (entry.income, entry.outcome):
+            # Tulisan proses lain bersamaan dengan tulisan proses ini: minimal total bulan yang dibuka dicek ulang
+            self.month_cache.invalidate([period])
+            return False
+
+        def load_page(after, limit):
+            # Jika bulan ini berubah setelah ditampilkan, halaman berikutnya dibaca dari database (kursor keyset sama)
+            if self.month_cache.peek(period) is entry:
+                return entry.page(after, limit)
+            return self.db.fetch_page(year, month, after, limit)
+
+        with instrumentation.span("ui.load_cached", period=period, rows=len(entry)):
+            self.search_active = False
+            self.loaded_period = period
+            self.model.set_rows([], load_page, PAGE_SIZE)
+            self.model.append_page(entry.page(None, PAGE_SIZE))
+            self.update_summary(entry.income, entry.outcome)
+        return True
+
+    def apply_quick_filters(self):
+        self.quick_filter_timer.stop()
+        type_text = self.type_filter.currentText() if self.type_filter.currentIndex() > 0 else ""
+        with instrumentation.span("ui.quick_filter") as info:
+            self.model.set_filters({
+                COL_TYPE: type_text, COL_BUYER: self.buyer_filter.text(), COL_DESCRIPTION: self.desc_filter.text(),
+            })
+            info["rows"] = self.model.rowCount()
+
+    def update_filter_count(self):
+        if self.model.view_active() and self.model.rowCount() != self.model.loaded_count():
+            self.filter_count_label.setText(f"{self.model.rowCount()} dari {self.model.loaded_count()} transaksi")
+        else:
+            self.filter_count_label.setText("")
+
+    def start_load_task(self, task):
+        self.load_started = time.perf_counter()
+        if self.profiling:
+            # Saat diprofil, load berjalan di thread UI agar query ikut terekam profiler
+            task.run()
+            self.table.viewport().repaint()
+        else:
+            self.load_pool.start(task)
+
+    def profile_load(self):
+        self.profiling = True
         try:
-            conn = sqlite3.connect(DB_NAME)
-            cursor = conn.cursor()
-            
-            # Ambil bulan & tahun yang dipilih
-            selected_month = self.month_selector.currentIndex() + 1
-            selected_year = int(self.year_selector.currentText())
-            
-            # Query data transaksi berdasarkan bulan & tahun
-            cursor.execute("""
-                SELECT id, type, amount, date, description, buyer, phone, address 
-                FROM transactions 
-                WHERE strftime('%m', date) = ? AND strftime('%Y', date) = ?
-                ORDER BY date DESC
-            """, (f"{selected_month:02}", str(selected_year)))
-            
-            transactions = cursor.fetchall()
-            conn.close()
-            
-            total_income = 0
-            total_outcome = 0
-            
-            self.table.setRowCount(len(transactions))
-            
-            for row, transaction in enumerate(transactions):
-                trans_id, trans_type, amount, date_str, description, buyer, phone, address = transaction
-                
-                amount = float(amount)
-                formatted_amount = f"Rp. {amount:,.0f}".replace(",", ".")
-                formatted_date = datetime.strptime(date_str, "%Y-%m-%d").strftime("%A, %d %B %Y")
-                
-                if trans_type.lower() == "pemasukan":
-                    text_color = QColor("green")
-                    bg_color = QColor(220, 255, 220)
-                    total_income += amount
+            instrumentation.profile_call("load_transactions", self.load_transactions)
+        finally:
+            self.profiling = False
+
+    def run_search(self):
+        self.committer.flush()
+        text = self.search_input.text().strip()
+        if not text:
+            # Kotak pencarian dikosongkan: kembali ke laporan bulan yang dipilih
+            self.load_transactions()
+            return
+
+        if self.load_task is not None:
+            self.load_task.cancel()
+        self.load_generation += 1
+
+        task = SearchTask(self.db, text, self.load_generation)
+        task.signals.totals.connect(self.on_totals_loaded)
+        task.signals.chunk.connect(self.on_rows_loaded)
+        task.signals.finished.connect(self.on_load_finished)
+        task.signals.error.connect(self.on_load_error)
+        self.load_task = task
+
+        # Hasil pencarian diurutkan menurut relevansi, bukan bulan tertentu
+        self.search_active = True
+        self.loaded_period = None
+        self.model.set_rows([])
+        self.start_load_task(task)
+
+    def on_rows_loaded(self, generation, rows):
+        # 🔥 Model hanya menyimpan baris mentah, teks & warna dibuat saat sel tampil di layar
+        if generation != self.load_generation:
+            return
+        with instrumentation.span("ui.table_fill", rows=len(rows)):
+            self.model.append_page(rows)
+        if self.load_started is not None:
+            # Dari klik sampai halaman pertama masuk tabel (query di worker + antre sinyal + isi model)
+            instrumentation.emit(
+                "ui.load_transactions", (time.perf_counter() - self.load_started) * 1000,
+                period=self.loaded_period or "pencarian", rows=len(rows),
+            )
+            self.load_started = None
+
+    def load_rest(self, after):
+        # Header diklik / saringan diubah sebelum bulan termuat semua: sisa bulan dibaca di worker (generasi load yang
+        # sama), urut/saring diterapkan ulang di on_rest_loaded
+        if self.loaded_period is None:
+            self.model.cancel_rest()
+            return
+        task = LoadRestTask(self.db, int(self.loaded_period[:4]), int(self.loaded_period[5:7]), after, self.load_generation)
+        task.signals.rest.connect(self.on_rest_loaded)
+        task.signals.finished.connect(self.on_load_finished)
+        task.signals.error.connect(self.on_load_error)
+        self.load_task = task
+        self.load_pool.start(task)
+
+    def on_rest_loaded(self, generation, rows):
+        if generation != self.load_generation:
+            return
+        with instrumentation.span("ui.table_fill", rows=len(rows)):
+            self.model.append_rest(rows)
+
+    def on_totals_loaded(self, generation, total_income, total_outcome):
+        if generation == self.load_generation:
+            self.update_summary(total_income, total_outcome)
+
+    def on_load_finished(self, generation):
+        if generation == self.load_generation:
+            self.load_task = None
+            if "first_load_ms" not in self.startup_times:
+                self.record_startup("first_load_ms")
+
+    def on_load_error(self, generation, message):
+        if generation == self.load_generation:
+            self.load_task = None
+            self.model.cancel_rest()
+            QMessageBox.critical(self, "Error", f"Gagal memuat transaksi: {message}")
+
+    def update_summary(self, total_income, total_outcome):
+        self.total_income = total_income
+        self.total_outcome = total_outcome
+        total_selisih = total_income - total_outcome
+
+        # Update Label Income & Outcome
+        self.income_label.setText(f"Total Pemasukkan: {format_rupiah(total_income)}")
+        self.outcome_label.setText(f"Total Pengeluaran: {format_rupiah(total_outcome)}")
+        self.selisih_label.setText(f"Selisih Pendapatan: {format_rupiah(total_selisih)}")
+
+        if total_selisih < 0:
+            self.selisih_label.setStyleSheet("color: red; font-weight: bold;")
+        else:
+            self.selisih_label.setStyleSheet("color: green; font-weight: bold;")
+    
+    def apply_change(self, old_row, new_row):
+        with instrumentation.span("ui.apply_change"):
+            self._apply_change(old_row, new_row)
+
+    def _apply_change(self, old_row, new_row):
+        # 🔥 Terapkan satu perubahan langsung ke tabel & total, tanpa query ulang satu bulan.
+        # Jika load masih berjalan (data belum lengkap) atau baris tidak ditemukan, muat ulang seperti biasa.
+        if self.search_active:
+            self.run_search()
+            return
+        if self.load_task is not None:
+            self.load_transactions()
+            return
+
+        in_view = lambda row: row is not None and row[3][:7] == self.loaded_period
+        total_income, total_outcome = self.total_income, self.total_outcome
+        for row, sign in ((old_row, -1), (new_row, 1)):
+            if in_view(row):
+                if row[1].lower() == "pemasukan":
+                    total_income += sign * row[2]
                 else:
-                    text_color = QColor("red")
-                    bg_color = QColor(255, 220, 220)
-                    total_outcome += amount
-                
-                for col, value in enumerate([trans_id, trans_type, formatted_amount, formatted_date, description, buyer, phone, address]):
-                    item = QTableWidgetItem(value if value else "-")
-                    item.setForeground(QBrush(text_color))
-                    item.setBackground(QBrush(bg_color))
-                    self.table.setItem(row, col, item)
-            
-            total_selisih = total_income - total_outcome
-            # Sembunyikan kolom ID
-            self.table.hideColumn(0)
-            
-            # Update Label Income & Outcome
-            self.income_label.setText(f"Total Pemasukkan: Rp. {total_income:,.0f}".replace(",", "."))
-            self.outcome_label.setText(f"Total Pengeluaran: Rp. {total_outcome:,.0f}".replace(",", "."))
-            self.selisih_label.setText(f"Selisih Pendapatan: Rp. {total_selisih:,.0f}".replace(",", "."))
-            
-            if total_selisih < 0:
-                self.selisih_label.setStyleSheet("color: red; font-weight: bold;")
+                    total_outcome += sign * row[2]
+
+        if in_view(old_row) and in_view(new_row):
+            applied = self.model.replace_row(old_row, new_row)
+        elif in_view(old_row):
+            applied = self.model.remove_row(old_row)
+        elif in_view(new_row):
+            self.model.insert_row(new_row)
+            applied = True
+        else:
+            applied = True
+
+        if applied:
+            self.update_summary(total_income, total_outcome)
+        else:
+            self.load_transactions()
+
+    def schedule_sync(self):
+        if self.replica is not None:
+            self.sync_timer.start()
+
+    def start_sync(self):
+        # Paling banyak satu sync berjalan; perubahan berikutnya ikut di putaran setelahnya
+        if self.replica is None or self.sync_task is not None:
+            return
+        task = SyncTask(self.replica)
+        task.signals.finished.connect(self.on_sync_finished)
+        task.signals.error.connect(self.on_sync_error)
+        self.sync_task = task
+        self.sync_label.setText("Sinkronisasi...")
+        self.sync_pool.start(task)
+
+    def on_sync_finished(self, result):
+        self.sync_task = None
+        if result.pending:
+            self.sync_label.setText(f"{result.pending} perubahan menunggu sync")
+        else:
+            self.sync_label.setText(f"Tersinkron {datetime.now():%H:%M}")
+        # Ada data baru dari server: tampilan saat ini dimuat ulang dari database lokal
+        if result.changed():
+            if self.search_active:
+                self.run_search()
             else:
-                self.selisih_label.setStyleSheet("color: green; font-weight: bold;")
-        
-        except sqlite3.Error as e:
-            QMessageBox.critical(self, "Error", f"Gagal memuat transaksi: {e}")
-        except requests.exceptions.RequestException as e:
-            QMessageBox.critical(self, "Error", f"Gagal menghubungi server: {e}")
-    
+                self.load_transactions()
+
+    def on_sync_error(self, message, pending):
+        # Tanpa koneksi aplikasi tetap jalan normal; perubahan tetap antre di outbox
+        self.sync_task = None
+        self.sync_label.setText(f"Offline ({pending} perubahan menunggu)" if pending >= 0 else "Offline")
+        self.sync_label.setToolTip(message)
+
+    def start_backup(self):
+        if self.backup_task is not None:
+            return
+        task = BackupTask(DB_NAME, self.backup_dir)
+        task.signals.finished.connect(self.on_backup_finished)
+        task.signals.error.connect(self.on_backup_error)
+        self.backup_task = task
+        self.task_pool.start(task)
+
+    def on_backup_finished(self, path):
+        self.backup_task = None
+
+    def on_backup_error(self, message):
+        self.backup_task = None
+        self.toast.show_message(f"Backup gagal: {message}", error=True)
+
+    def archive_year(self):
+        self.committer.flush()
+        current_year = datetime.now().year
+        archived = set(self.db.archived_years())
+        years = [str(year) for year in self.db.years() if year < current_year and year not in archived]
+        if not years:
+            QMessageBox.information(self, "Arsip", "Tidak ada tahun yang bisa diarsipkan.")
+            return
+        year, ok = QInputDialog.getItem(
+            self, "Arsipkan Tahun", "Pindahkan transaksi tahun ini ke file arsip (hanya-baca):", years, 0, False
+        )
+        if not ok:
+            return
+        answer = QMessageBox.question(
+            self, "Arsipkan Tahun",
+            f"Transaksi tahun {year} akan dipindah ke file arsip dan tidak bisa diubah lagi. Lanjutkan?",
+        )
+        if answer != QMessageBox.StandardButton.Yes:
+            return
+
+        task = ArchiveTask(self.db, int(year))
+        task.signals.finished.connect(self.on_archive_finished)
+        task.signals.error.connect(self.on_archive_error)
+        self.archive_task = task
+        self.archive_button.setEnabled(False)
+        self.archive_button.setText("Mengarsipkan...")
+        self.task_pool.start(task)
+
+    def fill_year_selector(self, selected_year):
+        current_year = datetime.now().year
+        # Tahun yang sudah diarsipkan tetap bisa dipilih (file arsipnya di-ATTACH saat dibuka)
+        years = set(range(current_year - 5, current_year + 1)) | set(self.db.archived_years())
+        self.year_selector.blockSignals(True)
+        self.year_selector.clear()
+        self.year_selector.addItems([str(year) for year in sorted(years)])
+        self.year_selector.setCurrentText(str(selected_year))
+        self.year_selector.blockSignals(False)
+
+    def on_archive_finished(self, year, rows):
+        self.reset_archive_button()
+        # Tahun arsip di luar lima tahun terakhir langsung muncul di pilihan tahun
+        self.fill_year_selector(self.year_selector.currentText())
+        QMessageBox.information(self, "Arsip", f"{rows} transaksi tahun {year} dipindah ke file arsip.")
+        self.load_transactions()
+
+    def on_archive_error(self, message):
+        self.reset_archive_button()
+        QMessageBox.warning(self, "Error", f"Gagal mengarsipkan: {message}")
+
+    def reset_archive_button(self):
+        self.archive_task = None
+        self.archive_button.setEnabled(True)
+        self.archive_button.setText("Arsipkan Tahun")
+
+    def open_dashboard(self):
+        if self.dashboard is None:
+            from dashboard import DashboardWindow
+            self.dashboard = DashboardWindow(self.db, self.load_pool, self)
+        else:
+            self.dashboard.reload()
+        self.dashboard.show()
+        self.dashboard.raise_()
+
+    def import_transactions(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import Transaksi", "", "Data Transaksi (*.csv *.xlsx)")
+        if not path:
+            return
+
+        # Import berjalan di thread pool; tombol dikunci sampai selesai
+        task = ImportTask(self.db, path)
+        task.signals.progress.connect(self.on_import_progress)
+        task.signals.finished.connect(self.on_import_finished)
+        task.signals.error.connect(self.on_import_error)
+        self.import_task = task
+
+        self.import_button.setEnabled(False)
+        self.import_button.setText("Import... 0")
+        self.task_pool.start(task)
+
+    def on_import_progress(self, inserted, rejected):
+        self.import_button.setText(f"Import... {inserted} ({rejected} ditolak)")
+
+    def on_import_finished(self, result):
+        self.reset_import_button()
+
+        message = f"{result.inserted} transaksi berhasil diimport, {len(result.rejected)} baris ditolak."
+        if result.rejected:
+            lines = [f"Baris {line_no}: {reason}" for line_no, reason, _ in result.rejected[:20]]
+            if len(result.rejected) > 20:
+                lines.append(f"... dan {len(result.rejected) - 20} baris lainnya")
+            message += "\n\n" + "\n".join(lines)
+        QMessageBox.information(self, "Import Selesai", message)
+        self.load_transactions()
+        self.schedule_sync()
+
+    def on_import_error(self, message):
+        self.reset_import_button()
+        QMessageBox.warning(self, "Error", f"Gagal import transaksi: {message}")
+
+    def reset_import_button(self):
+        self.import_task = None
+        self.import_button.setEnabled(True)
+        self.import_button.setText("Import CSV")
+
+    def export_transactions(self):
+        self.committer.flush()
+        selected_month = self.month_selector.currentIndex() + 1
+        selected_year = int(self.year_selector.currentText())
+        default_name = f"transaksi_{selected_year}_{selected_month:02}.csv"
+        path, _ = QFileDialog.getSaveFileName(self, "Export Transaksi", default_name, "CSV (*.csv);;Excel (*.xlsx)")
+        if not path:
+            return
+
+        start, end = month_range(selected_year, selected_month)
+        task = ExportTask(self.db, path, start, end)
+        task.signals.finished.connect(self.on_export_finished)
+        task.signals.error.connect(self.on_export_error)
+        self.export_task = task
+
+        self.export_button.setEnabled(False)
+        self.task_pool.start(task)
+
+    def on_export_finished(self, result):
+        self.export_task = None
+        self.export_button.setEnabled(True)
+        message = (
+            f"{result.rows} transaksi berhasil diexport.\n\n"
+            f"Total Pemasukan: {format_rupiah(result.total_income)}\n"
+            f"Total Pengeluaran: {format_rupiah(result.total_outcome)}"
+        )
+        QMessageBox.information(self, "Export Selesai", message)
+
+    def on_export_error(self, message):
+        self.export_task = None
+        self.export_button.setEnabled(True)
+        QMessageBox.warning(self, "Error", f"Gagal export transaksi: {message}")
+
     def create_transaction(self):
+        import uuid
         amount_text = self.amount_input.text().replace("Rp. ", "").replace(".", "").strip()
     
         # 🔥 Cek apakah amount kosong atau bukan angka
@@ -306,33 +895,58 @@ class TransactionApp(QWidget):
             return
         
         try:
-            conn = sqlite3.connect(DB_NAME)
-            cursor = conn.cursor()
-            
             data = (
                 str(uuid.uuid4()),
                 self.type_input.currentText(),
-                float(amount_text.replace(",", ".")),
+                parse_amount(amount_text.replace(",", ".")),
                 self.date_input.date().toString("yyyy-MM-dd"),
                 self.desc_input.text(),
                 self.buyer_input.text(),
                 self.phone_input.text(),
                 self.address_input.text()
             )
-            cursor.execute("""
-            INSERT INTO transactions (id, type, amount, date, description, buyer, phone, address)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, data)
-
-            conn.commit()
-            conn.close()
+            if self.rapid_entry.isChecked():
+                # Disimpan bersama transaksi berikutnya; tabel diperbarui di on_entries_committed
+                self.committer.add(data)
+                self.clear_entry_fields()
+                return
+            self.db.insert_transaction(data)
 
             QMessageBox.information(self, "Success", "Transaksi berhasil dibuat.")
-            self.load_transactions()
+            self.apply_change(None, data)
+            self.schedule_sync()
             self.clear_form()
         except sqlite3.Error as e:
             QMessageBox.warning(self, "Error", f"Gagal membuat transaksi: {e}")
     
+    def on_entry_return(self):
+        if self.rapid_entry.isChecked():
+            self.create_transaction()
+
+    def clear_entry_fields(self):
+        # Jenis & tanggal dipertahankan untuk transaksi berikutnya
+        self.amount_input.clear()
+        self.desc_input.clear()
+        self.buyer_input.clear()
+        self.phone_input.clear()
+        self.address_input.clear()
+        self.amount_input.setFocus()
+
+    def on_entries_committed(self, rows):
+        if self.search_active or self.load_task is not None:
+            # Tabel akan dimuat ulang; cukup sekali untuk seluruh kelompok
+            self.apply_change(None, rows[-1])
+        else:
+            for row in rows:
+                self.apply_change(None, row)
+        self.schedule_sync()
+        total = sum(row[2] for row in rows)
+        self.toast.show_message(f"{len(rows)} transaksi tersimpan ({format_rupiah(total)})")
+
+    def on_entries_failed(self, rows, message):
+        # Baris tetap di antrean committer dan dicoba lagi otomatis; cukup toast, tanpa dialog yang menghentikan input
+        self.toast.show_message(f"{len(rows)} transaksi belum tersimpan ({message}), dicoba lagi...", error=True)
+
     def update_transaction(self):
         if not hasattr(self, 'selected_id') or not self.selected_id:
             QMessageBox.warning(self, "Error", "Pilih transaksi yang akan diubah.")
@@ -341,30 +955,22 @@ class TransactionApp(QWidget):
         try:
             # 🔥 Bersihkan format amount sebelum dikonversi
             amount_text = self.amount_input.text().replace("Rp. ", "").replace(".", "")
-            amount_value = float(amount_text)  # Konversi ke float setelah dibersihkan
+            amount_value = parse_amount(amount_text)  # Konversi ke rupiah bulat setelah dibersihkan
             
-            conn = sqlite3.connect(DB_NAME)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                UPDATE transactions SET type=?, amount=?, date=?, description=?, buyer=?, phone=?, address=?
-                WHERE id=?
-            """, (
+            data = (
                 self.type_input.currentText(),
                 amount_value,
                 self.date_input.date().toString("yyyy-MM-dd"),
                 self.desc_input.text(),
                 self.buyer_input.text(),
                 self.phone_input.text(),
-                self.address_input.text(),
-                self.selected_id
-            ))
-
-            conn.commit()
-            conn.close()
+                self.address_input.text()
+            )
+            self.db.update_transaction(self.selected_id, data)
 
             QMessageBox.information(self, "Success", "Transaksi berhasil diubah.")
-            self.load_transactions()
+            self.apply_change(self.selected_row, (self.selected_id, *data))
+            self.schedule_sync()
             self.clear_form()
         except sqlite3.Error as e:
             QMessageBox.warning(self, "Error", f"Gagal mengubah transaksi: {e}")
@@ -386,19 +992,48 @@ class TransactionApp(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                conn = sqlite3.connect(DB_NAME)
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM transactions WHERE id = ?", (self.selected_id,))
-                conn.commit()
-                conn.close()
+                self.db.delete_transaction(self.selected_id)
                 
                 QMessageBox.information(self, "Success", "Transaksi berhasil dihapus.")
-                self.load_transactions()
+                self.apply_change(self.selected_row, None)
+                self.schedule_sync()
+                self.clear_form()
             except sqlite3.Error as e:
                 QMessageBox.warning(self, "Error", f"Gagal menghapus transaksi: {e}")
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = TransactionApp()
+    arg_parser = argparse.ArgumentParser(description="Transaksi Manager Kummiku")
+    arg_parser.add_argument(
+        "--sync", metavar="URL", default=os.environ.get("KUMMIKU_SYNC_URL"),
+        help="URL API /transaksi untuk sinkronisasi (default: env KUMMIKU_SYNC_URL, kosong = lokal saja)",
+    )
+    arg_parser.add_argument("--perf", action="store_true", help="aktifkan instrumentasi & overlay (Ctrl+Shift+P)")
+    arg_parser.add_argument("--perf-log", metavar="FILE", help="tulis log instrumentasi (JSON per baris) ke file")
+    arg_parser.add_argument(
+        "--entry-window", metavar="MS", type=int, default=ENTRY_WINDOW_MS,
+        help="mode input cepat: jeda maksimal sebelum transaksi disimpan (ms, 0 = langsung)",
+    )
+    arg_parser.add_argument(
+        "--entry-batch", metavar="N", type=int, default=ENTRY_BATCH,
+        help="mode input cepat: simpan segera setelah N transaksi terkumpul",
+    )
+    arg_parser.add_argument(
+        "--month-cache-mb", metavar="MB", type=int, default=MONTH_CACHE_MB,
+        help="batas memori cache bulan yang baru dibuka (0 = tanpa cache)",
+    )
+    arg_parser.add_argument(
+        "--backup-interval", metavar="MENIT", type=int, default=BACKUP_INTERVAL_MIN,
+        help="snapshot database berkala ke folder backup (0 = mati)",
+    )
+    arg_parser.add_argument("--backup-dir", metavar="DIR", help="folder snapshot (default: backup/ di samping database)")
+    arg_parser.add_argument("--measure-startup", action="store_true", help="cetak waktu startup (JSON) lalu keluar")
+    args, qt_args = arg_parser.parse_known_args()
+    if (args.perf or args.perf_log) and not instrumentation.enabled():
+        instrumentation.enable(args.perf_log)
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = TransactionApp(
+        args.sync, args.measure_startup, args.entry_window, args.entry_batch, args.month_cache_mb,
+        args.backup_interval, args.backup_dir,
+    )
     window.show()
     sys.exit(app.exec())
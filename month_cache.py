@@ -0,0 +1,176 @@
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from datetime import date
+
+# 🔥 Cache bulan yang baru dibuka, agar berpindah bolak-balik antar bulan tidak query & memuat ulang.
+# Satu bulan disimpan per kolom: nilai di array int64, tanggal sebagai ordinal di array int32, teks jenis/pembeli/HP/alamat
+# di-intern (banyak yang berulang). Total memori dibatasi budget (byte), bulan yang paling lama tidak dibuka dibuang dulu.
+# Database.notify_write membuang bulan yang berubah; tiap bulan punya nomor versi, jadi hasil load yang sudah
+# kedaluwarsa (ada tulisan ke bulan itu selama load berjalan) tidak pernah masuk cache.
+# Modul ini tidak bergantung pada Qt; get/put/invalidate aman dipanggil dari thread manapun.
+
+# Batas bawah memori per baris (array + 6 pointer list + teks id): bulan dengan jumlah baris x ini di atas budget
+# pasti tidak muat, jadi tidak dibaca sama sekali untuk cache
+MIN_ROW_BYTES = 100
+
+_iso_dates = {}
+
+
+def _iso(ordinal):
+    text = _iso_dates.get(ordinal)
+    if text is None:
+        if len(_iso_dates) >= 4096:
+            _iso_dates.clear()
+        text = date.fromordinal(ordinal).isoformat()
+        _iso_dates[ordinal] = text
+    return text
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class MonthColumns:
+    __slots__ = ("ids", "types", "amounts", "ordinals", "descriptions", "buyers", "phones", "addresses",
+                 "income", "outcome", "nbytes")
+
+    def __init__(self, income, outcome):
+        self.ids = []
+        self.types = []
+        self.amounts = array("q")
+        self.ordinals = array("i")
+        self.descriptions = []
+        self.buyers = []
+        self.phones = []
+        self.addresses = []
+        self.income = income
+        self.outcome = outcome
+        self.nbytes = 0
+
+    @classmethod
+    def from_rows(cls, rows, income, outcome, budget=None):
+        # rows urut date DESC, id seperti fetch_month (boleh iterator, mis. dari iter_month). None jika ada nilai yang
+        # tidak muat di kolom (amount kosong/pecahan, tanggal bukan ISO), atau jika ukurannya melewati budget:
+        # berhenti membaca saat itu juga, bulan itu tetap dibaca dari database.
+        columns = cls(income, outcome)
+        ordinals = {}
+        seen = set()
+        size = sys.getsizeof(columns)
+        try:
+            for trans_id, trans_type, amount, date_text, description, buyer, phone, address in rows:
+                ordinal = ordinals.get(date_text)
+                if ordinal is None:
+                    ordinal = ordinals[date_text] = date.fromisoformat(date_text).toordinal()
+                    if _iso(ordinal) != date_text:
+                        return None
+                columns.amounts.append(amount)
+                columns.ordinals.append(ordinal)
+                columns.ids.append(trans_id)
+                columns.types.append(_intern(trans_type))
+                columns.descriptions.append(description)
+                columns.buyers.append(_intern(buyer))
+                columns.phones.append(_intern(phone))
+                columns.addresses.append(_intern(address))
+                # Perkiraan memori berjalan: 8 + 4 byte array, 6 pointer list, tiap objek teks (yang di-intern sekali)
+                size += 60
+                for value in (trans_id, description, columns.types[-1], columns.buyers[-1], columns.phones[-1],
+                              columns.addresses[-1]):
+                    if value is not None and id(value) not in seen:
+                        seen.add(id(value))
+                        size += sys.getsizeof(value)
+                if budget is not None and size > budget:
+                    return None
+        except (TypeError, ValueError, OverflowError):
+            return None
+        columns.nbytes = size
+        return columns
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row(self, i):
+        return (self.ids[i], self.types[i], self.amounts[i], _iso(self.ordinals[i]), self.descriptions[i],
+                self.buyers[i], self.phones[i], self.addresses[i])
+
+    def page(self, after=None, limit=500):
+        # Sama dengan Database.fetch_page: after = (date, id) baris terakhir halaman sebelumnya
+        start = 0 if after is None else self._position_after(*after)
+        return [self.row(i) for i in range(start, min(start + limit, len(self.ids)))]
+
+    def _position_after(self, date_text, trans_id):
+        # Indeks pertama setelah (date_text, trans_id) pada urutan date DESC, id ASC
+        ordinal = date.fromisoformat(date_text).toordinal()
+        low, high = 0, len(self.ids)
+        while low < high:
+            middle = (low + high) // 2
+            current = self.ordinals[middle]
+            if current > ordinal or (current == ordinal and self.ids[middle] <= trans_id):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+class MonthCache:
+    def __init__(self, budget_bytes):
+        self.budget = budget_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # "yyyy-mm" -> MonthColumns, yang paling lama tidak dibuka di depan
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def version(self, key):
+        # Dibaca sebelum query; put() dengan versi lama ditolak
+        with self._lock:
+            return self._versions.get(key, 0)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def peek(self, key):
+        # Tanpa mengubah urutan LRU & statistik: untuk cek apakah entry yang sedang dipakai masih berlaku
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key, entry, version):
+        with self._lock:
+            if self._versions.get(key, 0) != version or entry.nbytes > self.budget:
+                return False
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old.nbytes
+            self._entries[key] = entry
+            self.size += entry.nbytes
+            while self.size > self.budget:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.nbytes
+            return True
+
+    def invalidate(self, keys):
+        with self._lock:
+            for key in keys:
+                self._versions[key] = self._versions.get(key, 0) + 1
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self.size -= entry.nbytes
+
+    def clear(self):
+        with self._lock:
+            for key in self._entries:
+                self._versions[key] = self._versions.get(key, 0) + 1
+            self._entries.clear()
+            self.size = 0
@@ -0,0 +1,65 @@
+import time
+from collections import deque
+
+from PyQt6.QtCore import QEvent, Qt, pyqtSignal
+from PyQt6.QtWidgets import QLabel, QTableView
+
+import instrumentation
+
+
+class PerfOverlay(QLabel):
+    # 🔥 Panel kecil transparan di pojok kanan bawah jendela: kejadian instrumentasi terbaru.
+    # Kejadian dari thread worker diteruskan lewat sinyal (queued) ke thread UI.
+    event_received = pyqtSignal(object)
+
+    def __init__(self, parent, max_lines=8):
+        super().__init__(parent)
+        self.lines = deque(maxlen=max_lines)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        # Ukuran tetap & latar tidak transparan: memperbarui overlay tidak memicu gambar ulang tabel di bawahnya
+        self.setStyleSheet("background-color: #202020; color: #9f9; font-family: monospace; font-size: 11px; padding: 4px;")
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.ensurePolished()
+        self.setFixedSize(520, self.fontMetrics().lineSpacing() * max_lines + 12)
+        self.event_received.connect(self.show_event)
+        instrumentation.add_listener(self.event_received.emit)
+        parent.installEventFilter(self)
+        self.hide()
+
+    def toggle(self):
+        self.setVisible(not self.isVisible())
+        if self.isVisible():
+            self.reposition()
+            self.raise_()
+
+    def show_event(self, event):
+        fields = {key: value for key, value in event.items() if key not in ("event", "ms", "thread")}
+        details = " ".join(f"{key}={value}" for key, value in fields.items())
+        self.lines.append(f"{event['event']:<24} {event['ms']:8.1f} ms  {details}")
+        self.setText("\n".join(self.lines))
+
+    def reposition(self):
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - 8, parent.height() - self.height() - 8)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Resize and self.isVisible():
+            self.reposition()
+        return False
+
+    def close_overlay(self):
+        instrumentation.remove_listener(self.event_received.emit)
+
+
+class TimedTableView(QTableView):
+    # Waktu gambar viewport tabel: format teks sel (display_text) + brush + render Qt, hanya saat instrumentasi aktif
+    def paintEvent(self, event):
+        if not instrumentation.enabled():
+            return super().paintEvent(event)
+        started = time.perf_counter()
+        super().paintEvent(event)
+        model = self.model()
+        instrumentation.emit(
+            "ui.table_paint", (time.perf_counter() - started) * 1000,
+            rows=model.rowCount() if model is not None else 0,
+        )
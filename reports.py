@@ -0,0 +1,85 @@
+# 🔥 Logika laporan tanpa Qt: dipakai aplikasi (dashboard, total hasil pencarian) dan cli.py
+
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "Mei", "Jun", "Jul", "Agu", "Sep", "Okt", "Nov", "Des"]
+
+
+class Period:
+    __slots__ = ("label", "year", "number", "income", "outcome")
+
+    def __init__(self, label, year, number, income, outcome):
+        self.label = label
+        self.year = year
+        self.number = number  # bulan 1-12, kuartal 1-4, atau 0 untuk satu tahun
+        self.income = income
+        self.outcome = outcome
+
+    @property
+    def difference(self):
+        return self.income - self.outcome
+
+
+class DashboardData:
+    # Hasil Database.dashboard() yang sudah dipilah: periode per bulan/kuartal/tahun & pembeli teratas
+    def __init__(self, start_year, end_year):
+        self.start_year = start_year
+        self.end_year = end_year
+        self.months = []
+        self.quarters = []
+        self.years = []
+        self.top_buyers = []  # (pembeli, total pembelian, jumlah transaksi)
+
+    def periods(self, granularity):
+        return {"month": self.months, "quarter": self.quarters, "year": self.years}[granularity]
+
+
+def load_dashboard(db, start_year, end_year, top=10):
+    # 🔥 Satu query (GROUP BY di SQLite atas tabel ringkasan), berapapun jumlah transaksinya
+    data = DashboardData(start_year, end_year)
+    for kind, year, number, income, outcome, buyer in db.dashboard(start_year, end_year, top):
+        if kind == "month":
+            data.months.append(Period(f"{MONTH_NAMES[number - 1]} {year}", year, number, income, outcome))
+        elif kind == "quarter":
+            data.quarters.append(Period(f"Q{number} {year}", year, number, income, outcome))
+        elif kind == "year":
+            data.years.append(Period(str(year), year, number, income, outcome))
+        else:
+            data.top_buyers.append((buyer, income, outcome))
+    return data
+
+
+def is_income(trans_type):
+    return bool(trans_type) and trans_type.lower() == "pemasukan"
+
+
+def row_totals(rows):
+    # (pemasukan, pengeluaran) dari baris transaksi yang sudah dimuat
+    total_income = sum(row[2] or 0 for row in rows if is_income(row[1]))
+    total_outcome = sum(row[2] or 0 for row in rows) - total_income
+    return total_income, total_outcome
+
+
+class MonthReport:
+    __slots__ = ("year", "month", "income", "outcome", "count", "rows")
+
+    def __init__(self, year, month, income, outcome, count, rows=None):
+        self.year = year
+        self.month = month
+        self.income = income
+        self.outcome = outcome
+        self.count = count
+        self.rows = rows  # None jika hanya ringkasan
+
+    @property
+    def label(self):
+        return f"{MONTH_NAMES[self.month - 1]} {self.year}"
+
+    @property
+    def difference(self):
+        return self.income - self.outcome
+
+
+def load_month_report(db, year, month, details=True):
+    # Total & jumlah transaksi dari monthly_summary; baris transaksi hanya dibaca jika diminta
+    income, outcome, count = db.month_summary(year, month)
+    rows = db.fetch_month(year, month) if details else None
+    return MonthReport(year, month, income, outcome, count, rows)
@@ -0,0 +1,226 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from instrumentation import span
+
+# 🔥 Backup data (bukan kode) saat aplikasi berjalan, tanpa menyalin file database yang sedang ditulis:
+# sqlite3 backup API menyalin beberapa halaman per langkah dan jeda di antaranya, jadi penulis lain tidak terkunci lama.
+# Salinan dicek (PRAGMA quick_check), dikompres zstd (jika paket zstandard ada) atau gzip secara streaming,
+# lalu di-rename ke nama akhirnya: file yang setengah jadi tidak pernah terlihat sebagai snapshot.
+# Tiap snapshot punya file .json berisi sha256 isi database, jadi restore cukup mencocokkan hash sambil dekompresi
+# + quick_check. File arsip tahunan (hanya-baca) cukup dibackup sekali.
+# Modul ini tidak bergantung pada Qt.
+
+SNAPSHOT_DIR = "backup"
+PAGES_PER_STEP = 256
+STEP_PAUSE = 0.01
+KEEP = 7
+CHUNK_SIZE = 1024 * 1024
+
+
+def default_directory(db_path):
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), SNAPSHOT_DIR)
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _open_compressed(path, mode):
+    # mode "rb" / "wb"; jenis kompresi dari ekstensi file
+    if path.endswith(".zst"):
+        zstandard = _zstandard()
+        if zstandard is None:
+            raise ValueError("Snapshot .zst membutuhkan paket zstandard")
+        raw = open(path, mode)
+        if mode == "wb":
+            return zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=True)
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    return gzip.open(path, mode, compresslevel=6)
+
+
+def _compress(source, target):
+    # Streaming per potongan, sha256 isi asli dihitung di putaran yang sama
+    digest = hashlib.sha256()
+    with open(source, "rb") as src, _open_compressed(target, "wb") as dst:
+        while True:
+            chunk = src.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            dst.write(chunk)
+    return digest.hexdigest()
+
+
+def _check(path, full=False):
+    conn = sqlite3.connect(path)
+    try:
+        result = conn.execute("PRAGMA integrity_check" if full else "PRAGMA quick_check").fetchone()[0]
+    finally:
+        conn.close()
+    if result != "ok":
+        raise ValueError(f"Database rusak: {result}")
+
+
+def create_snapshot(db_path, directory=None, keep=KEEP, pages=PAGES_PER_STEP, pause=STEP_PAUSE,
+                    compression=None, progress=None):
+    # compression: "zstd", "gzip" atau None (zstd jika tersedia). progress(sisa halaman, total halaman)
+    directory = directory or default_directory(db_path)
+    os.makedirs(directory, exist_ok=True)
+    if compression is None:
+        compression = "zstd" if _zstandard() is not None else "gzip"
+    extension = ".zst" if compression == "zstd" else ".gz"
+    name = f"{Path(db_path).stem}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.db{extension}"
+    path = os.path.join(directory, name)
+
+    with span("backup.snapshot", compression=compression) as info:
+        fd, copy_path = tempfile.mkstemp(suffix=".db", dir=directory)
+        os.close(fd)
+        try:
+            source = sqlite3.connect(db_path)
+            target = sqlite3.connect(copy_path)
+            try:
+                source.execute("PRAGMA busy_timeout=5000")
+                source.backup(
+                    target, pages=pages, sleep=pause,
+                    progress=(lambda status, remaining, total: progress(remaining, total)) if progress else None,
+                )
+                # Salinan berdiri sendiri (satu file), bukan mode WAL seperti database aslinya
+                target.execute("PRAGMA journal_mode=DELETE")
+                user_version = target.execute("PRAGMA user_version").fetchone()[0]
+            finally:
+                target.close()
+                source.close()
+            _check(copy_path)
+
+            size = os.path.getsize(copy_path)
+            partial = path + ".part"
+            sha256 = _compress(copy_path, partial)
+            with open(path + ".json", "w", encoding="utf-8") as f:
+                json.dump({"sha256": sha256, "size": size, "user_version": user_version,
+                           "source": os.path.abspath(db_path), "created": datetime.now().isoformat(timespec="seconds")},
+                          f, indent=2)
+            os.replace(partial, path)
+        finally:
+            for leftover in (copy_path, path + ".part"):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+        info["bytes"] = size
+        info["compressed"] = os.path.getsize(path)
+
+    rotate(directory, Path(db_path).stem, keep)
+    return path
+
+
+def backup_archives(db_path, directory=None):
+    # File arsip tahunan tidak pernah ditulis lagi: dikompres sekali ke backup/arsip/, yang sudah ada dilewati
+    directory = os.path.join(directory or default_directory(db_path), "arsip")
+    conn = sqlite3.connect(db_path)
+    try:
+        try:
+            paths = [path for (path,) in conn.execute("SELECT path FROM archives ORDER BY year")]
+        except sqlite3.OperationalError:
+            # Database lama tanpa tabel archives
+            return []
+    finally:
+        conn.close()
+
+    created = []
+    base = os.path.dirname(os.path.abspath(db_path))
+    for path in paths:
+        source = os.path.join(base, path)
+        target = os.path.join(directory, os.path.basename(source) + ".gz")
+        if os.path.exists(target) or not os.path.exists(source):
+            continue
+        os.makedirs(directory, exist_ok=True)
+        sha256 = _compress(source, target + ".part")
+        with open(target + ".json", "w", encoding="utf-8") as f:
+            json.dump({"sha256": sha256, "size": os.path.getsize(source)}, f, indent=2)
+        os.replace(target + ".part", target)
+        created.append(target)
+    return created
+
+
+def list_snapshots(directory, stem):
+    # Terbaru di depan; nama berisi waktu, jadi urut nama = urut waktu
+    names = [
+        name for name in os.listdir(directory)
+        if name.startswith(stem + "-") and name.endswith((".db.gz", ".db.zst"))
+    ] if os.path.isdir(directory) else []
+    return [os.path.join(directory, name) for name in sorted(names, reverse=True)]
+
+
+def rotate(directory, stem, keep=KEEP):
+    for path in list_snapshots(directory, stem)[keep:]:
+        os.remove(path)
+        if os.path.exists(path + ".json"):
+            os.remove(path + ".json")
+
+
+def _decompress(snapshot, target):
+    digest = hashlib.sha256()
+    with _open_compressed(snapshot, "rb") as src, open(target, "wb") as dst:
+        while True:
+            chunk = src.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            dst.write(chunk)
+    return digest.hexdigest()
+
+
+def _verified_copy(snapshot, target, full=False):
+    # Dekompresi + cocokkan sha256 dengan file .json, lalu quick_check (integrity_check jika full)
+    sha256 = _decompress(snapshot, target)
+    manifest = snapshot + ".json"
+    if os.path.exists(manifest):
+        with open(manifest, encoding="utf-8") as f:
+            expected = json.load(f).get("sha256")
+        if expected and expected != sha256:
+            raise ValueError(f"Checksum snapshot tidak cocok: {os.path.basename(snapshot)}")
+    _check(target, full)
+
+
+def verify_snapshot(snapshot, full=False):
+    fd, temp = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        _verified_copy(snapshot, temp, full)
+    finally:
+        os.remove(temp)
+
+
+def restore_snapshot(snapshot, db_path, full=False):
+    # Aplikasi harus ditutup dulu. File lama disimpan sebagai <db>.sebelum-restore, -wal/-shm lama dibuang
+    # (WAL lama yang tertinggal akan diterapkan ke file hasil restore dan merusaknya).
+    temp = db_path + ".restore"
+    try:
+        with span("backup.restore"):
+            _verified_copy(snapshot, temp, full)
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+    if os.path.exists(db_path):
+        # Checkpoint dulu agar salinan cadangan berisi data lengkap, bukan hanya file utama tanpa WAL-nya
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+        shutil.copyfile(db_path, db_path + ".sebelum-restore")
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+    os.replace(temp, db_path)
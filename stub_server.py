@@ -0,0 +1,214 @@
+import argparse
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# 🔥 Server REST tiruan (in-memory) dengan API yang sama seperti backend /transaksi,
+# untuk mencoba mode remote & RestBackend secara lokal tanpa server asli.
+# GET mendukung ?start=&end=&sort=-date&page=&per_page= dan balasan NDJSON (Accept: application/x-ndjson);
+# GET ?updated_since= mengirim record yang berubah (termasuk tombstone data terhapus), dengan ETag/Last-Modified.
+# Dengan honor_params=False server berperilaku seperti backend lama yang selalu mengirim semua data;
+# dengan ndjson=False balasan selalu JSON biasa {"data": [...], "meta": {...}} walau klien meminta NDJSON.
+
+
+class StubStore:
+    # Data yang dihapus disimpan sebagai tombstone {"id", "deleted": true, "updated_at"} agar ikut terkirim ke delta sync.
+    # version naik setiap perubahan dan dipakai sebagai ETag.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.items = {}
+        self.version = 0
+        self.modified = datetime.now(timezone.utc)
+
+    def list(self):
+        with self.lock:
+            return [item for item in self.items.values() if not item.get("deleted")]
+
+    def changed_since(self, since):
+        with self.lock:
+            items = [item for item in self.items.values() if item["updated_at"] >= since]
+        items.sort(key=lambda item: item["updated_at"])
+        return items
+
+    def put(self, trans_id, data):
+        with self.lock:
+            item = {**self.items.get(trans_id, {}), **data, "id": trans_id}
+            item.pop("deleted", None)
+            item["updated_at"] = self._touch()
+            self.items[trans_id] = item
+            return item
+
+    def delete(self, trans_id):
+        with self.lock:
+            item = self.items.get(trans_id)
+            if item is None or item.get("deleted"):
+                return False
+            self.items[trans_id] = {"id": trans_id, "deleted": True, "updated_at": self._touch()}
+            return True
+
+    def _touch(self):
+        # updated_at selalu naik (format tetap, bisa dibandingkan sebagai string)
+        now = datetime.now(timezone.utc)
+        if now <= self.modified:
+            now = self.modified + timedelta(microseconds=1)
+        self.modified = now
+        self.version += 1
+        return now.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 agar koneksi keep-alive dari klien benar-benar dipakai ulang
+    protocol_version = "HTTP/1.1"
+    # Header & body ditulis terpisah; tanpa TCP_NODELAY tiap balasan tertahan delayed-ACK ~40 ms
+    disable_nagle_algorithm = True
+    store = None
+    honor_params = True
+    ndjson = True
+    prefix = "/transaksi"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload, headers=()):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_modified(self, etag, modified):
+        # If-None-Match lebih diutamakan daripada If-Modified-Since (RFC 9110)
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            return if_none_match == etag
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                return modified.replace(microsecond=0) <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _item_id(self):
+        path = urlsplit(self.path).path
+        if not path.startswith(self.prefix):
+            return None, False
+        rest = path[len(self.prefix):].strip("/")
+        return rest or None, True
+
+    def do_GET(self):
+        trans_id, ok = self._item_id()
+        if not ok or trans_id:
+            return self._send(404, {"message": "not found"})
+        if not self.honor_params:
+            return self._send(200, {"data": self.store.list()})
+
+        with self.store.lock:
+            etag, modified = f'"{self.store.version}"', self.store.modified
+        if self._not_modified(etag, modified):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            return self.end_headers()
+        headers = [("ETag", etag), ("Last-Modified", format_datetime(modified, usegmt=True))]
+
+        query = {key: values[-1] for key, values in parse_qs(urlsplit(self.path).query).items()}
+        since = query.get("updated_since")
+        if since:
+            items = self.store.changed_since(since)
+            headers.append(("X-Updated-Since", since))
+        else:
+            items = self.store.list()
+        start, end = query.get("start"), query.get("end")
+        if start:
+            items = [item for item in items if item.get("date", "")[:10] >= start]
+        if end:
+            items = [item for item in items if item.get("date", "")[:10] < end]
+        if query.get("sort") == "-date":
+            items.sort(key=lambda item: item.get("id", ""))
+            items.sort(key=lambda item: item.get("date", ""), reverse=True)
+
+        page, per_page = int(query.get("page", 1)), int(query.get("per_page", 0))
+        next_page = None
+        if per_page:
+            if page * per_page < len(items):
+                next_page = page + 1
+            items = items[(page - 1) * per_page:page * per_page]
+
+        if self.ndjson and "application/x-ndjson" in self.headers.get("Accept", ""):
+            return self._send_ndjson(items, next_page, headers)
+        self._send(200, {"data": items, "meta": {"page": page, "next_page": next_page}}, headers)
+
+    def _send_ndjson(self, items, next_page, headers=()):
+        # Chunked transfer: tiap item dikirim sebagai satu baris JSON begitu siap
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        if next_page:
+            self.send_header("X-Next-Page", str(next_page))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        for item in items:
+            line = json.dumps(item).encode("utf-8") + b"\n"
+            self.wfile.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_POST(self):
+        _, ok = self._item_id()
+        if not ok:
+            return self._send(404, {"message": "not found"})
+        data = self._read_json()
+        if not data.get("id"):
+            return self._send(400, {"message": "id wajib diisi"})
+        self._send(200, {"data": self.store.put(data["id"], data)})
+
+    def do_PUT(self):
+        trans_id, ok = self._item_id()
+        if not ok or not trans_id:
+            return self._send(404, {"message": "not found"})
+        self._send(200, {"data": self.store.put(trans_id, self._read_json())})
+
+    def do_DELETE(self):
+        trans_id, ok = self._item_id()
+        if not ok or not trans_id or not self.store.delete(trans_id):
+            return self._send(404, {"message": "not found"})
+        self._send(200, {"message": "deleted"})
+
+
+def start_stub_server(host="127.0.0.1", port=0, honor_params=True, ndjson=True):
+    # Jalan di thread daemon; port=0 memilih port bebas. Mengembalikan (server, url API).
+    handler = type("Handler", (StubHandler,), {"store": StubStore(), "honor_params": honor_params, "ndjson": ndjson})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}{StubHandler.prefix}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server REST tiruan untuk /transaksi (data di memori).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1323)
+    parser.add_argument("--legacy", action="store_true", help="abaikan filter & pagination (seperti server lama)")
+    args = parser.parse_args(argv)
+
+    server, url = start_stub_server(args.host, args.port, honor_params=not args.legacy)
+    print(f"Stub server berjalan di {url} (Ctrl+C untuk berhenti)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+from backends import BackendError, row_from_json
+from database import DATE_QUERY
+
+# 🔥 Replika lokal (offline-first): aplikasi selalu membaca & menulis ke SQLite lokal,
+# perubahan lokal dicatat trigger ke outbox lalu dikirim ke server, dan dari server hanya diambil
+# record yang berubah sejak watermark updated_at terakhir (dengan ETag/If-Modified-Since).
+# Selama menerapkan data dari server, baris 'applying_remote' di sync_state membuat trigger outbox diam;
+# baris itu hanya terlihat di dalam transaksi sync sendiri, jadi tulisan dari koneksi lain tetap tercatat.
+OUTBOX_TRIGGERS = [
+    '''CREATE TRIGGER IF NOT EXISTS trg_outbox_insert AFTER INSERT ON transactions
+        WHEN NOT EXISTS (SELECT 1 FROM sync_state WHERE key = 'applying_remote') BEGIN
+        INSERT INTO outbox (trans_id, op) VALUES (NEW.id, 'insert');
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_outbox_update AFTER UPDATE ON transactions
+        WHEN NOT EXISTS (SELECT 1 FROM sync_state WHERE key = 'applying_remote') BEGIN
+        INSERT INTO outbox (trans_id, op) VALUES (NEW.id, 'update');
+    END''',
+    '''CREATE TRIGGER IF NOT EXISTS trg_outbox_delete AFTER DELETE ON transactions
+        WHEN NOT EXISTS (SELECT 1 FROM sync_state WHERE key = 'applying_remote') BEGIN
+        INSERT INTO outbox (trans_id, op) VALUES (OLD.id, 'delete');
+    END''',
+]
+
+# Beberapa perubahan pada id yang sama digabung: yang dikirim hanya isi baris terakhir
+PENDING_QUERY = """
+    SELECT trans_id, MAX(seq), MAX(op = 'insert')
+    FROM outbox
+    GROUP BY trans_id
+    ORDER BY MAX(seq)
+"""
+
+ROW_QUERY = """
+    SELECT id, type, amount, date, description, buyer, phone, address
+    FROM transactions
+    WHERE id = ?
+"""
+
+# Baris yang isinya tidak berubah tidak ditulis ulang (trigger ringkasan & full-text tidak ikut jalan)
+UPSERT_QUERY = """
+    INSERT INTO transactions (id, type, amount, date, description, buyer, phone, address)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        type = excluded.type, amount = excluded.amount, date = excluded.date, description = excluded.description,
+        buyer = excluded.buyer, phone = excluded.phone, address = excluded.address
+    WHERE (type, amount, date, description, buyer, phone, address)
+        IS NOT (excluded.type, excluded.amount, excluded.date, excluded.description,
+                excluded.buyer, excluded.phone, excluded.address)
+"""
+
+STATE_KEYS = ("watermark", "etag", "last_modified")
+
+
+class SyncResult:
+    def __init__(self):
+        self.pushed = 0
+        self.pulled = 0
+        self.deleted = 0
+        self.pending = 0
+        self.not_modified = False
+
+    def changed(self):
+        return bool(self.pulled or self.deleted)
+
+
+class Replica:
+    def __init__(self, db, backend):
+        self.db = db
+        self.backend = backend
+
+        conn = db.connection()
+        with conn:
+            conn.execute("BEGIN")
+            for statement in OUTBOX_TRIGGERS:
+                conn.execute(statement)
+            # Sync pertama: semua data lokal yang sudah ada ikut dikirim ke server
+            if conn.execute("SELECT 1 FROM sync_state WHERE key = 'seeded'").fetchone() is None:
+                conn.execute("INSERT INTO outbox (trans_id, op) SELECT id, 'insert' FROM transactions")
+                conn.execute("INSERT INTO sync_state (key, value) VALUES ('seeded', '1')")
+        self.db.notify_write(())
+
+    def pending_count(self):
+        return self.db.connection().execute("SELECT COUNT(DISTINCT trans_id) FROM outbox").fetchone()[0]
+
+    def sync(self):
+        # Kirim dulu perubahan lokal, baru tarik perubahan dari server
+        result = SyncResult()
+        try:
+            result.pushed = self.push()
+            self.pull(result)
+        finally:
+            result.pending = self.pending_count()
+        return result
+
+    def push(self):
+        conn = self.db.connection()
+        pending = conn.execute(PENDING_QUERY).fetchall()
+        if not pending:
+            return 0
+
+        jobs = [
+            (trans_id, seq, self.backend.executor.submit(self._push_one, trans_id, conn.execute(ROW_QUERY, (trans_id,)).fetchone(), created))
+            for trans_id, seq, created in pending
+        ]
+        done, error = [], None
+        for trans_id, seq, future in jobs:
+            try:
+                future.result()
+                done.append((trans_id, seq))
+            except BackendError as e:
+                error = error or e
+
+        # Hanya entri yang sudah terkirim; perubahan yang masuk selama push (seq lebih besar) tetap antre
+        with conn:
+            conn.executemany("DELETE FROM outbox WHERE trans_id = ? AND seq <= ?", done)
+        # Data transaksi tidak berubah, tapi commit ini harus tercatat sebagai tulisan proses sendiri
+        self.db.notify_write(())
+        if error is not None:
+            raise error
+        return len(done)
+
+    def _push_one(self, trans_id, row, created):
+        if row is None:
+            if not created:
+                self.backend.delete_transaction(trans_id, missing_ok=True)
+        elif created:
+            self.backend.create_transaction(row)
+        else:
+            self.backend.update_transaction(trans_id, row[1:])
+
+    def pull(self, result):
+        conn = self.db.connection()
+        state = dict(conn.execute("SELECT key, value FROM sync_state WHERE key IN (?, ?, ?)", STATE_KEYS))
+        changes = self.backend.changes_since(state.get("watermark"), state.get("etag"), state.get("last_modified"))
+        if changes is None:
+            result.not_modified = True
+            return
+
+        # Diunduh penuh dulu, agar transaksi tulis tidak terbuka selama menunggu jaringan
+        items = list(changes.items)
+        watermark = state.get("watermark") or ""
+        seen = set()
+        months = set()
+        # Tahun yang sudah diarsipkan sudah ditutup; perubahan server untuk tahun itu tidak diterapkan
+        archived_years = {f"{year:04}" for year in self.db.archived_years()}
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES ('applying_remote', '1')")
+            # Perubahan lokal yang belum terkirim menang atas data server sampai berhasil di-push
+            local_pending = {row[0] for row in conn.execute("SELECT DISTINCT trans_id FROM outbox")}
+
+            for item in items:
+                watermark = max(watermark, item.get("updated_at") or "")
+                trans_id = item.get("id")
+                if not trans_id:
+                    continue
+                seen.add(trans_id)
+                if trans_id in local_pending or (item.get("date") or "")[:4] in archived_years:
+                    continue
+                old = conn.execute(DATE_QUERY, (trans_id,)).fetchone()
+                if item.get("deleted"):
+                    if old:
+                        result.deleted += conn.execute("DELETE FROM transactions WHERE id = ?", (trans_id,)).rowcount
+                        months.add(old[0][:7])
+                else:
+                    row = row_from_json(item)
+                    if conn.execute(UPSERT_QUERY, row).rowcount:
+                        result.pulled += 1
+                        months.add(row[3][:7])
+                        if old:
+                            months.add(old[0][:7])
+
+            if changes.full:
+                # Data penuh tanpa tombstone: yang tidak ada lagi di server berarti sudah dihapus di sana
+                missing = [
+                    (trans_id, date) for trans_id, date in conn.execute("SELECT id, date FROM transactions")
+                    if trans_id not in seen and trans_id not in local_pending
+                ]
+                conn.executemany("DELETE FROM transactions WHERE id = ?", [(trans_id,) for trans_id, _ in missing])
+                months.update(date[:7] for _, date in missing)
+                result.deleted += len(missing)
+
+            new_state = {"watermark": watermark or None, "etag": changes.etag, "last_modified": changes.last_modified}
+            conn.executemany("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", new_state.items())
+            conn.execute("DELETE FROM sync_state WHERE key = 'applying_remote'")
+        # Cache bulan di aplikasi ikut dibuang untuk bulan yang berubah karena data server
+        self.db.notify_write(months)
@@ -0,0 +1,42 @@
+import sqlite3
+import unittest
+
+from backends import row_from_json
+from formatting import parse_amount, round_rupiah
+
+# Nilai .5 harus jadi rupiah bulat yang sama, dari manapun asalnya: data lama yang dimigrasi (SQLite ROUND),
+# input form/import (parse_amount) dan server REST (row_from_json).
+
+HALVES = [0.5, 12.5, 1000.5, 2500.5, -12.5, -1000.5, 15000.49, 15000.51]
+
+
+def sqlite_round(value):
+    # Rumus migrasi 4
+    return sqlite3.connect(":memory:").execute("SELECT CAST(ROUND(?) AS INTEGER)", (value,)).fetchone()[0]
+
+
+class RoundingTest(unittest.TestCase):
+    def test_round_rupiah_matches_migration(self):
+        for value in HALVES:
+            self.assertEqual(round_rupiah(value), sqlite_round(value), value)
+
+    def test_half_rounds_away_from_zero(self):
+        self.assertEqual(round_rupiah(1000.5), 1001)
+        self.assertEqual(round_rupiah(12.5), 13)
+        self.assertEqual(round_rupiah(-12.5), -13)
+
+    def test_parse_amount(self):
+        self.assertEqual(parse_amount("1000.5"), 1001)
+        self.assertEqual(parse_amount("12.5"), 13)
+        self.assertEqual(parse_amount("15000.49"), 15000)
+        self.assertEqual(parse_amount("1.250.000"), 1250000)
+
+    def test_row_from_json(self):
+        item = {"id": "a", "type": "Pemasukan", "amount": 1000.5, "date": "2025-03-01T00:00:00Z"}
+        self.assertEqual(row_from_json(item)[2], sqlite_round(1000.5))
+        self.assertEqual(row_from_json({**item, "amount": 12.5})[2], 13)
+        self.assertEqual(row_from_json({**item, "amount": 1250000})[2], 1250000)
+
+
+if __name__ == "__main__":
+    unittest.main()
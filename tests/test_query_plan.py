@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+from database import (
+    MONTH_PAGE_QUERY, MONTH_QUERY, OLDER_DATES_PAGE_QUERY, RANGE_QUERY, SAME_DATE_PAGE_QUERY, Database, month_range,
+    query_plan, uses_index,
+)
+
+# Query bulan & halaman harus SEARCH lewat index date; jika filter kembali ke strftime() (full scan), test ini gagal.
+# python -m pytest tests   atau   python -m unittest discover tests
+
+# Query lama sebelum migrasi index: membaca seluruh tabel/index walau hanya satu bulan yang diminta
+STRFTIME_MONTH_QUERY = """
+    SELECT id, type, amount, date, description, buyer, phone, address
+    FROM transactions
+    WHERE strftime('%m', date) = ? AND strftime('%Y', date) = ?
+    ORDER BY date DESC
+"""
+
+
+class QueryPlanTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directory.name, "test.db"))
+        self.conn = self.db.connection()
+        rows = [
+            (f"id-{i}", "Pemasukan" if i % 2 else "Pengeluaran", 1000 + i, f"2024-{i % 12 + 1:02}-{i % 28 + 1:02}",
+             "", "", "", "")
+            for i in range(500)
+        ]
+        self.db.insert_transactions(rows)
+        self.conn.execute("ANALYZE")
+
+    def tearDown(self):
+        self.db.close()
+        self.directory.cleanup()
+
+    def assert_search(self, sql, params):
+        self.assertTrue(uses_index(self.conn, sql, params), query_plan(self.conn, sql, params))
+
+    def test_month_queries_search_date_index(self):
+        start, end = month_range(2024, 3)
+        self.assert_search(MONTH_QUERY, (start, end))
+        self.assert_search(MONTH_PAGE_QUERY, (start, end, 500))
+        self.assert_search(OLDER_DATES_PAGE_QUERY, (start, "2024-03-15", 500))
+        self.assert_search(SAME_DATE_PAGE_QUERY, ("2024-03-15", "id-0", 500))
+        self.assert_search(RANGE_QUERY, (start, end))
+
+    def test_strftime_filter_is_rejected(self):
+        # Full scan pada index date ("SCAN ... USING COVERING INDEX") tidak boleh dianggap memakai index
+        self.assertFalse(uses_index(self.conn, STRFTIME_MONTH_QUERY, ("03", "2024")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,359 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backends import BackendError, RestBackend
+from database import Database
+from stub_server import start_stub_server
+from sync import Replica
+
+# RestBackend & Replica diuji terhadap stub_server: server baru (filter, halaman, NDJSON),
+# server yang hanya membalas JSON biasa per halaman, dan server lama yang mengabaikan semua parameter.
+
+ROWS = [
+    ("a-01", "Pemasukan", 10000, "2025-02-28", "Februari", "Andi", "0811", "Jl. Satu"),
+    ("a-02", "Pengeluaran", 2500, "2025-03-01", "Awal bulan", "", "", ""),
+    ("a-03", "Pemasukan", 15000, "2025-03-15", "Tengah", "Budi", "0812", "Jl. Dua"),
+    ("a-04", "Pemasukan", 7000, "2025-03-15", "Tengah juga", "Citra", "", ""),
+    ("a-05", "Pengeluaran", 1200, "2025-03-15", "Tengah lagi", "", "", ""),
+    ("a-06", "Pemasukan", 50000, "2025-03-31", "Akhir bulan", "Dewi", "0813", ""),
+    ("a-07", "Pemasukan", 3000, "2025-03-20", "", "", "", ""),
+    ("a-08", "Pengeluaran", 900, "2025-04-01", "April", "", "", ""),
+]
+
+# Urutan mode lokal: date DESC, id
+MARCH = sorted(sorted((row for row in ROWS if row[3][:7] == "2025-03"), key=lambda row: row[0]),
+               key=lambda row: row[3], reverse=True)
+
+
+def start_server(handler):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/transaksi"
+
+
+class StubTestCase(unittest.TestCase):
+    honor_params = True
+    ndjson = True
+
+    def setUp(self):
+        self.server, self.url = start_stub_server(honor_params=self.honor_params, ndjson=self.ndjson)
+        self.backend = RestBackend(self.url, timeout=(1, 2))
+        self.requests = []
+        request = self.backend.session.request
+
+        def counting_request(method, url, **kwargs):
+            response = request(method, url, **kwargs)
+            self.requests.append((method, kwargs.get("params"), response.headers.get("Content-Type")))
+            return response
+
+        self.backend.session.request = counting_request
+        for row in ROWS:
+            self.backend.create_transaction(row)
+        self.requests.clear()
+
+    def tearDown(self):
+        self.backend.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def get_requests(self):
+        return [request for request in self.requests if request[0] == "GET"]
+
+
+class PagedNdjsonTest(StubTestCase):
+    def test_iter_range_reads_all_pages(self):
+        rows = list(self.backend.iter_range("2025-03-01", "2025-04-01", page_size=2))
+        self.assertEqual(rows, MARCH)
+        # 6 baris Maret, 2 per halaman
+        self.assertEqual([params["page"] for _, params, _ in self.get_requests()], [1, 2, 3])
+        self.assertTrue(all(kind.startswith("application/x-ndjson") for _, _, kind in self.get_requests()))
+
+    def test_list_month(self):
+        self.assertEqual(self.backend.list_month(2025, 3), MARCH)
+        self.assertEqual(self.backend.list_month(2025, 2), [ROWS[0]])
+        self.assertEqual(self.backend.list_month(2025, 5), [])
+
+    def test_update_and_delete(self):
+        self.backend.update_transaction("a-03", ("Pemasukan", 16000, "2025-04-02", "Pindah", "Budi", "0812", "Jl. Dua"))
+        self.backend.delete_transaction("a-04")
+        self.assertEqual([row[0] for row in self.backend.list_month(2025, 3)], ["a-06", "a-07", "a-05", "a-02"])
+        self.assertEqual([row[0] for row in self.backend.list_month(2025, 4)], ["a-03", "a-08"])
+        with self.assertRaises(BackendError):
+            self.backend.delete_transaction("a-04")
+        self.backend.delete_transaction("a-04", missing_ok=True)
+
+
+class PagedJsonTest(StubTestCase):
+    ndjson = False
+
+    def test_iter_range_reads_all_pages(self):
+        rows = list(self.backend.iter_range("2025-03-01", "2025-04-01", page_size=4))
+        self.assertEqual(rows, MARCH)
+        self.assertEqual([params["page"] for _, params, _ in self.get_requests()], [1, 2])
+        self.assertTrue(all(kind == "application/json" for _, _, kind in self.get_requests()))
+
+    def test_list_month(self):
+        self.assertEqual(self.backend.list_month(2025, 3), MARCH)
+
+
+class LegacyServerTest(StubTestCase):
+    honor_params = False
+
+    def test_iter_range_filters_on_client(self):
+        # Server lama mengirim semua data dalam satu halaman tanpa urutan; rentang tetap disaring di klien
+        rows = list(self.backend.iter_range("2025-03-01", "2025-04-01", page_size=2))
+        self.assertEqual(sorted(rows), sorted(MARCH))
+        self.assertEqual(len(self.get_requests()), 1)
+
+    def test_list_month_is_sorted(self):
+        self.assertEqual(self.backend.list_month(2025, 3), MARCH)
+        self.assertEqual(self.backend.list_month(2025, 4), [ROWS[-1]])
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    # Membalas 503 sebanyak `failures` kali, setelah itu 200 dengan data kosong
+    protocol_version = "HTTP/1.1"
+    failures = 0
+    calls = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self):
+        self.calls.append(self.command)
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        status, body = (503, b"{}") if len(self.calls) <= self.failures else (200, b'{"data": []}')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    # Koneksi diterima tapi balasan tidak pernah datang dalam batas timeout klien
+    protocol_version = "HTTP/1.1"
+    calls = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.calls.append(self.command)
+        time.sleep(2)
+
+
+class RetryTimeoutTest(unittest.TestCase):
+    def setUp(self):
+        self.servers = []
+        self.backends = []
+
+    def tearDown(self):
+        for backend in self.backends:
+            backend.close()
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+    def start(self, base, **attributes):
+        calls = []
+        handler = type("Handler", (base,), {"calls": calls, **attributes})
+        server, url = start_server(handler)
+        self.servers.append(server)
+        return url, calls
+
+    def backend(self, url, **kwargs):
+        backend = RestBackend(url, **{"backoff": 0, **kwargs})
+        self.backends.append(backend)
+        return backend
+
+    def test_get_is_retried_on_503(self):
+        url, calls = self.start(FlakyHandler, failures=2)
+        self.assertEqual(self.backend(url, retries=3).list_month(2025, 3), [])
+        self.assertEqual(calls, ["GET"] * 3)
+
+    def test_put_and_delete_are_retried(self):
+        url, calls = self.start(FlakyHandler, failures=1)
+        backend = self.backend(url, retries=3)
+        backend.update_transaction("a-01", ROWS[0][1:])
+        backend.delete_transaction("a-01")
+        self.assertEqual(calls, ["PUT", "PUT", "DELETE"])
+
+    def test_retries_exhausted(self):
+        url, calls = self.start(FlakyHandler, failures=100)
+        with self.assertRaisesRegex(BackendError, "503"):
+            self.backend(url, retries=2).list_month(2025, 3)
+        self.assertEqual(len(calls), 3)
+
+    def test_post_is_not_retried(self):
+        # POST yang sudah terkirim tidak diulang agar tidak membuat data ganda
+        url, calls = self.start(FlakyHandler, failures=1)
+        with self.assertRaisesRegex(BackendError, "503"):
+            self.backend(url, retries=3).create_transaction(ROWS[0])
+        self.assertEqual(calls, ["POST"])
+
+    def test_read_timeout(self):
+        url, calls = self.start(SlowHandler)
+        started = time.perf_counter()
+        with self.assertRaisesRegex(BackendError, "Gagal menghubungi server"):
+            self.backend(url, timeout=(1, 0.2), retries=1).list_month(2025, 3)
+        self.assertLess(time.perf_counter() - started, 1.5)
+        self.assertEqual(calls, ["GET"] * 2)
+
+    def test_connection_refused(self):
+        server, url = start_server(FlakyHandler)
+        server.server_close()
+        with self.assertRaisesRegex(BackendError, "Gagal menghubungi server"):
+            self.backend(url, timeout=(0.5, 0.5), retries=1).list_month(2025, 3)
+
+
+class ReplicaSyncTest(unittest.TestCase):
+    honor_params = True
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directory.name, "test.db"))
+        self.server, url = start_stub_server(honor_params=self.honor_params)
+        self.backend = RestBackend(url, timeout=(1, 2), backoff=0)
+        # Klien lain yang mengubah data langsung di server
+        self.other = RestBackend(url, timeout=(1, 2), backoff=0)
+        self.months = []
+        self.db.add_write_listener(self.months.append)
+
+    def tearDown(self):
+        self.backend.close()
+        self.other.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.db.close()
+        self.directory.cleanup()
+
+    def local_ids(self, year, month):
+        return [row[0] for row in self.db.fetch_month(year, month)]
+
+    def test_existing_rows_are_seeded(self):
+        self.db.insert_transactions(ROWS[:3])
+        replica = Replica(self.db, self.backend)
+        self.assertEqual(replica.pending_count(), 3)
+        result = replica.sync()
+        self.assertEqual((result.pushed, result.pending), (3, 0))
+        self.assertEqual(self.other.list_month(2025, 3), [ROWS[2], ROWS[1]])
+
+    def test_push_local_changes(self):
+        replica = Replica(self.db, self.backend)
+        self.db.insert_transaction(ROWS[1])
+        self.db.insert_transaction(ROWS[2])
+        self.assertEqual(replica.sync().pushed, 2)
+
+        self.db.update_transaction("a-02", ("Pengeluaran", 2600, "2025-03-02", "Diubah", "", "", ""))
+        self.db.delete_transaction("a-03")
+        result = replica.sync()
+        self.assertEqual((result.pushed, result.pending), (2, 0))
+        self.assertEqual(self.other.list_month(2025, 3), [("a-02", "Pengeluaran", 2600, "2025-03-02", "Diubah", "", "", "")])
+
+    def test_pull_remote_changes(self):
+        replica = Replica(self.db, self.backend)
+        for row in ROWS[1:4]:
+            self.other.create_transaction(row)
+        result = replica.sync()
+        self.assertEqual((result.pulled, result.deleted), (3, 0))
+        self.assertEqual(self.local_ids(2025, 3), ["a-03", "a-04", "a-02"])
+        self.assertIn({"2025-03"}, self.months)
+
+        # Delta berikutnya: satu diubah, satu dihapus (tombstone), tanpa mengunduh ulang yang lain
+        self.other.update_transaction("a-03", ("Pemasukan", 16000, "2025-04-02", "Pindah", "Budi", "0812", "Jl. Dua"))
+        self.other.delete_transaction("a-04")
+        result = replica.sync()
+        self.assertEqual((result.pulled, result.deleted), (1, 1))
+        self.assertEqual(self.local_ids(2025, 3), ["a-02"])
+        self.assertEqual(self.local_ids(2025, 4), ["a-03"])
+        self.assertEqual(self.months[-1], {"2025-03", "2025-04"})
+        # Tidak ada push: perubahan dari server tidak masuk outbox
+        self.assertEqual(replica.pending_count(), 0)
+
+    def test_not_modified(self):
+        replica = Replica(self.db, self.backend)
+        self.other.create_transaction(ROWS[2])
+        self.assertFalse(replica.sync().not_modified)
+        result = replica.sync()
+        self.assertTrue(result.not_modified)
+        self.assertFalse(result.changed())
+
+    def test_local_pending_wins(self):
+        replica = Replica(self.db, self.backend)
+        self.other.create_transaction(ROWS[2])
+        replica.sync()
+        self.other.update_transaction("a-03", ("Pemasukan", 20000, *ROWS[2][3:]))
+        self.db.update_transaction("a-03", ("Pemasukan", 30000, *ROWS[2][3:]))
+        replica.sync()
+        self.assertEqual(self.db.fetch_month(2025, 3)[0][2], 30000)
+        self.assertEqual(self.other.list_month(2025, 3)[0][2], 30000)
+
+    def test_sync_commits_are_announced(self):
+        # MainWindow.load_cached: data_version yang berubah karena sync proses ini harus disertai write_count yang naik,
+        # sedangkan tulisan proses lain (Database terpisah) hanya mengubah data_version
+        replica = Replica(self.db, self.backend)
+        self.db.insert_transaction(ROWS[2])
+        self.other.create_transaction(ROWS[3])
+        writes, version = self.db.write_count, self.db.data_version()
+        thread = threading.Thread(target=replica.sync)
+        thread.start()
+        thread.join()
+        self.assertNotEqual(self.db.data_version(), version)
+        self.assertNotEqual(self.db.write_count, writes)
+
+        writes, version = self.db.write_count, self.db.data_version()
+        other_process = Database(self.db.path)
+        try:
+            other_process.insert_transaction(ROWS[4])
+        finally:
+            other_process.close()
+        self.assertNotEqual(self.db.data_version(), version)
+        self.assertEqual(self.db.write_count, writes)
+
+    def test_offline_keeps_outbox(self):
+        replica = Replica(self.db, self.backend)
+        self.db.insert_transaction(ROWS[2])
+        self.server.shutdown()
+        self.server.server_close()
+        self.backend.timeout = (0.5, 0.5)
+        with self.assertRaises(BackendError):
+            replica.sync()
+        self.assertEqual(replica.pending_count(), 1)
+        self.assertEqual(self.local_ids(2025, 3), ["a-03"])
+
+
+class LegacyReplicaSyncTest(ReplicaSyncTest):
+    honor_params = False
+
+    def test_pull_remote_changes(self):
+        # Tanpa updated_since setiap sync menerima data penuh; yang tidak ada lagi di server dihapus lokal
+        replica = Replica(self.db, self.backend)
+        for row in ROWS[1:4]:
+            self.other.create_transaction(row)
+        self.assertEqual(replica.sync().pulled, 3)
+        self.other.delete_transaction("a-04")
+        result = replica.sync()
+        self.assertEqual((result.pulled, result.deleted), (0, 1))
+        self.assertEqual(self.local_ids(2025, 3), ["a-03", "a-02"])
+
+    def test_not_modified(self):
+        # Server lama tidak mengirim ETag: tidak pernah 304, tapi data yang sama tidak ditulis ulang
+        replica = Replica(self.db, self.backend)
+        self.other.create_transaction(ROWS[2])
+        replica.sync()
+        result = replica.sync()
+        self.assertFalse(result.not_modified)
+        self.assertFalse(result.changed())
+
+
+if __name__ == "__main__":
+    unittest.main()
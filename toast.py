@@ -0,0 +1,37 @@
+from PyQt6.QtCore import QEvent, Qt, QTimer
+from PyQt6.QtWidgets import QLabel
+
+
+class Toast(QLabel):
+    # Notifikasi kecil di atas jendela yang hilang sendiri, pengganti QMessageBox modal saat input cepat
+    def __init__(self, parent, duration_ms=2000):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(duration_ms)
+        self.timer.timeout.connect(self.hide)
+        parent.installEventFilter(self)
+        self.hide()
+
+    def show_message(self, text, error=False):
+        color = "#c62828" if error else "#2e7d32"
+        self.setStyleSheet(
+            f"background-color: {color}; color: white; font-weight: bold; padding: 6px 14px; border-radius: 6px;"
+        )
+        self.setText(text)
+        self.adjustSize()
+        self.reposition()
+        self.show()
+        self.raise_()
+        self.timer.start()
+
+    def reposition(self):
+        parent = self.parentWidget()
+        self.move((parent.width() - self.width()) // 2, 12)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Resize and self.isVisible():
+            self.reposition()
+        return False
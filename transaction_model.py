@@ -0,0 +1,308 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QColor, QBrush
+from dates import display_date
+from formatting import format_rupiah
+
+HEADERS = ["ID", "Jenis Transaksi", "Nilai", "Tanggal", "Keterangan", "Pembeli", "Nomor HP", "Alamat"]
+
+COL_ID, COL_TYPE, COL_AMOUNT, COL_DATE, COL_DESCRIPTION, COL_BUYER = 0, 1, 2, 3, 4, 5
+
+# Potongan saat seluruh bulan dimuat sekaligus untuk diurutkan/disaring
+FETCH_ALL_CHUNK = 20000
+
+
+class TransactionTableModel(QAbstractTableModel):
+    # Urut/saring butuh seluruh bulan: sisa bulan setelah kursor (date, id) ini harus dibaca di worker, lalu append_rest
+    rest_needed = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 🔥 Simpan baris mentah dari database (tuple), teks sel dibuat saat dibutuhkan saja
+        self._rows = []
+
+        # 🔥 Infinite scroll: halaman berikutnya diambil lewat page_loader(after, limit) saat tabel digulir ke bawah.
+        # _last_key = (date, id) baris terakhir dari halaman terakhir, kursor keyset berikutnya.
+        self._page_loader = None
+        self._page_size = 500
+        self._has_more = False
+        self._last_key = None
+        # Sisa bulan sedang dibaca worker (fetch_all / rest_needed): jangan ambil halaman sendiri
+        self._rest_pending = False
+
+        # 🔥 Urut & saring di memori atas baris yang sudah dimuat, tanpa query ulang.
+        # _view = indeks ke _rows yang tampil (None = semua baris dengan urutan bawaan date DESC, id).
+        # Kunci urut/saring per kolom dibuat sekali dari nilai mentah (int, tanggal ISO, teks casefold),
+        # bukan dari teks tampilan ("Rp. 1.000", nama hari).
+        self._sort_column = None
+        self._sort_descending = False
+        self._filters = {}  # kolom -> teks casefold; kolom jenis harus sama persis, kolom lain cukup memuat
+        self._view = None
+        self._keys = {}
+
+        # 🔥 Brush dipakai bersama per jenis transaksi, bukan dibuat per sel
+        self._income_brushes = (QBrush(QColor("green")), QBrush(QColor(220, 255, 220)))
+        self._outcome_brushes = (QBrush(QColor("red")), QBrush(QColor(255, 220, 220)))
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows) if self._view is None else len(self._view)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self.row_data(index.row())
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_text(row, index.column())
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._brushes(row[COL_TYPE])[0]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._brushes(row[COL_TYPE])[1]
+        return None
+
+    def set_rows(self, rows, page_loader=None, page_size=500, rest_pending=False):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._page_loader = page_loader
+        self._page_size = page_size
+        self._has_more = page_loader is not None
+        self._last_key = None
+        self._rest_pending = rest_pending
+        self._keys.clear()
+        self._rebuild_view()
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        if not rows:
+            return
+        if self._view is not None:
+            self._rows.extend(rows)
+            self._refresh_view()
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def append_page(self, rows):
+        # Halaman yang lebih pendek dari page_size berarti data bulan ini sudah habis
+        self._has_more = self._page_loader is not None and len(rows) >= self._page_size
+        if rows:
+            self._last_key = (rows[-1][COL_DATE], rows[-1][COL_ID])
+        self.append_rows(rows)
+        if self.view_active():
+            self.request_rest()
+
+    def append_rest(self, rows):
+        # Sisa bulan dari worker: setelah ini semua baris bulan sudah dimuat
+        self._rest_pending = False
+        self._has_more = False
+        if rows:
+            self._last_key = (rows[-1][COL_DATE], rows[-1][COL_ID])
+        self.append_rows(rows)
+
+    def cancel_rest(self):
+        # Worker gagal membaca sisa bulan: kembali ke infinite scroll biasa
+        self._rest_pending = False
+
+    def request_rest(self):
+        # 🔥 Urutan/saringan harus mencakup semua baris, bukan halaman yang sudah dimuat saja. Sisa bulan tidak dibaca
+        # di thread UI: rest_needed meminta worker, sementara itu urut/saring berlaku atas baris yang sudah ada.
+        # Tanpa kursor (halaman pertama belum masuk) permintaan menunggu append_page.
+        if self._rest_pending or not self._has_more or self._last_key is None:
+            return
+        self._rest_pending = True
+        self.rest_needed.emit(self._last_key)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and self._last_key is not None and not self._rest_pending
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            self.append_page(self._page_loader(self._last_key, self._page_size))
+
+    def has_more(self):
+        return self._has_more
+
+    def insert_row(self, row):
+        # 🔥 Cari posisi dengan binary search (urutan date DESC, id), lalu sisipkan satu baris saja.
+        # Baris yang jatuh setelah halaman terakhir tidak disisipkan: ia akan ikut terambil di halaman berikutnya.
+        if not self._before_last_key(row):
+            return
+        position = self._position(row[COL_DATE], row[COL_ID])
+        if self._view is not None:
+            self._rows.insert(position, row)
+            self._refresh_view()
+            return
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        position = self.find_row(row)
+        if position < 0:
+            # Baris yang belum termuat (ada di halaman berikutnya) tidak perlu dihapus dari tabel
+            return not self._before_last_key(row)
+        if self._view is not None:
+            del self._rows[position]
+            self._refresh_view()
+            return True
+        self.beginRemoveRows(QModelIndex(), position, position)
+        del self._rows[position]
+        self.endRemoveRows()
+        return True
+
+    def replace_row(self, old_row, new_row):
+        position = self.find_row(old_row)
+        if position < 0:
+            if self._before_last_key(old_row):
+                return False
+            self.insert_row(new_row)
+            return True
+        if self._view is not None:
+            del self._rows[position]
+            self._rows.insert(self._position(new_row[COL_DATE], new_row[COL_ID]), new_row)
+            self._refresh_view()
+            return True
+        if old_row[COL_DATE] == new_row[COL_DATE]:
+            # Tanggal (dan id) sama berarti posisi urut tidak berubah, cukup gambar ulang barisnya
+            self._rows[position] = new_row
+            self.dataChanged.emit(self.index(position, 0), self.index(position, len(HEADERS) - 1))
+        else:
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self._rows[position]
+            self.endRemoveRows()
+            self.insert_row(new_row)
+        return True
+
+    def find_row(self, row):
+        position = self._position(row[COL_DATE], row[COL_ID])
+        if position < len(self._rows) and self._rows[position][COL_ID] == row[COL_ID]:
+            return position
+        return -1
+
+    def _position(self, date_str, trans_id):
+        # Indeks pertama yang tidak mendahului (date_str, trans_id) pada urutan date DESC, id ASC
+        low, high = 0, len(self._rows)
+        while low < high:
+            middle = (low + high) // 2
+            current = self._rows[middle]
+            if current[COL_DATE] > date_str or (current[COL_DATE] == date_str and current[COL_ID] < trans_id):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _before_last_key(self, row):
+        if not self._has_more or self._last_key is None:
+            return True
+        last_date, last_id = self._last_key
+        return row[COL_DATE] > last_date or (row[COL_DATE] == last_date and row[COL_ID] < last_id)
+
+    def row_data(self, row):
+        # row = baris tabel yang tampil (sesudah diurut/disaring)
+        return self._rows[row if self._view is None else self._view[row]]
+
+    def view_active(self):
+        return self._sort_column is not None or bool(self._filters)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        # Dipanggil QTableView saat header diklik. Tanggal menurun = urutan bawaan, tetap dengan infinite scroll
+        descending = order == Qt.SortOrder.DescendingOrder
+        if column < 0 or (column == COL_DATE and descending):
+            column = None
+        if column == self._sort_column and descending == self._sort_descending:
+            return
+        if column is not None:
+            self.request_rest()
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        sources = [self._source_row(index.row()) for index in persistent]
+        self._sort_column = column
+        self._sort_descending = descending
+        self._rebuild_view()
+        if persistent:
+            # Baris yang dipilih tetap terpilih di posisi barunya
+            positions = {source: row for row, source in enumerate(self._view)} if self._view is not None else None
+            self.changePersistentIndexList(persistent, [
+                self.index(source if positions is None else positions[source], index.column())
+                for index, source in zip(persistent, sources)
+            ])
+        self.layoutChanged.emit()
+
+    def set_filters(self, filters):
+        # filters = {kolom: teks}; teks kosong berarti kolom itu tidak disaring
+        filters = {column: text.strip().casefold() for column, text in filters.items() if text.strip()}
+        if filters == self._filters:
+            return
+        self._filters = filters
+        if filters:
+            self.request_rest()
+        self.beginResetModel()
+        self._rebuild_view()
+        self.endResetModel()
+
+    def loaded_count(self):
+        return len(self._rows)
+
+    def _source_row(self, row):
+        return row if self._view is None else self._view[row]
+
+    def _refresh_view(self):
+        # Baris berubah saat urut/saring aktif: kunci dibuat ulang dan tampilan disusun ulang
+        self.beginResetModel()
+        self._keys.clear()
+        self._rebuild_view()
+        self.endResetModel()
+
+    def _rebuild_view(self):
+        if not self.view_active():
+            self._view = None
+            return
+        indices = range(len(self._rows))
+        for column, needle in self._filters.items():
+            keys = self._column_keys(column)
+            if column == COL_TYPE:
+                indices = [i for i in indices if keys[i] == needle]
+            else:
+                indices = [i for i in indices if needle in keys[i]]
+        if self._sort_column is not None:
+            # sorted() stabil: baris dengan kunci sama tetap dalam urutan bawaan (date DESC, id)
+            keys = self._column_keys(self._sort_column)
+            indices = sorted(indices, key=keys.__getitem__, reverse=self._sort_descending)
+        self._view = list(indices)
+
+    def _column_keys(self, column):
+        keys = self._keys.get(column)
+        if keys is None:
+            if column == COL_AMOUNT:
+                keys = [row[COL_AMOUNT] or 0 for row in self._rows]
+            elif column == COL_DATE:
+                keys = [row[COL_DATE] or "" for row in self._rows]
+            else:
+                keys = [row[column].casefold() if row[column] else "" for row in self._rows]
+            self._keys[column] = keys
+        return keys
+
+    def display_text(self, row, column):
+        value = row[column]
+        if column == COL_AMOUNT:
+            return format_rupiah(value)
+        if column == COL_DATE:
+            return display_date(value)
+        return value if value else "-"
+
+    def _brushes(self, trans_type):
+        if trans_type and trans_type.lower() == "pemasukan":
+            return self._income_brushes
+        return self._outcome_brushes
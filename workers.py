@@ -0,0 +1,350 @@
+import sqlite3
+from itertools import chain
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from exporter import export_file
+from importer import import_file
+from instrumentation import span
+from month_cache import MIN_ROW_BYTES, MonthColumns
+from reports import load_dashboard, row_totals
+from transaction_model import COL_DATE, COL_ID, FETCH_ALL_CHUNK
+
+
+class LoadSignals(QObject):
+    # Setiap sinyal membawa nomor generasi agar hasil dari load lama bisa diabaikan
+    chunk = pyqtSignal(int, list)
+    rest = pyqtSignal(int, list)
+    totals = pyqtSignal(int, object, object)
+    finished = pyqtSignal(int)
+    error = pyqtSignal(int, str)
+
+
+class LoadTransactionsTask(QRunnable):
+    # 🔥 Query berjalan di thread pool: total dari monthly_summary + halaman pertama saja,
+    # halaman berikutnya diambil model saat tabel digulir (keyset pagination).
+    # Dengan month_cache, setelah halaman pertama tampil seluruh bulan dibaca sekali lagi untuk disimpan di cache.
+    # Dengan fetch_all (tabel sedang diurut/disaring), sisa bulan juga dibaca di sini dan dikirim lewat sinyal rest,
+    # jadi thread UI tidak pernah memuat seluruh bulan sendiri saat berpindah bulan.
+    def __init__(self, db, year, month, generation, page_size=500, month_cache=None, fetch_all=False):
+        super().__init__()
+        self.db = db
+        self.year = year
+        self.month = month
+        self.generation = generation
+        self.page_size = page_size
+        self.month_cache = month_cache
+        self.fetch_all = fetch_all
+        self.signals = LoadSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        key = f"{self.year:04}-{self.month:02}"
+        # Versi dibaca sebelum query: jika bulan ini berubah selama load, hasilnya tidak disimpan ke cache
+        version = self.month_cache.version(key) if self.month_cache is not None else None
+        try:
+            total_income, total_outcome = self.db.month_totals(self.year, self.month)
+            if self._cancelled:
+                return
+            self.signals.totals.emit(self.generation, total_income, total_outcome)
+
+            rows = self.db.fetch_page(self.year, self.month, None, self.page_size)
+            if self._cancelled:
+                return
+            self.signals.chunk.emit(self.generation, rows)
+
+            complete = len(rows) < self.page_size
+            if self.fetch_all:
+                rest = self.fetch_rest((rows[-1][COL_DATE], rows[-1][COL_ID])) if not complete else []
+                if rest is None:
+                    return
+                self.signals.rest.emit(self.generation, rest)
+                rows = rows + rest
+                complete = True
+            self.signals.finished.emit(self.generation)
+        except sqlite3.Error as e:
+            self.signals.error.emit(self.generation, str(e))
+            return
+
+        if self.month_cache is not None and not self._cancelled:
+            budget = self.month_cache.budget
+            with span("cache.fill", period=key) as info:
+                try:
+                    if not complete:
+                        # Bulan yang pasti melebihi budget tidak dibaca; sisanya dialirkan per potongan
+                        # dan berhenti begitu perkiraan ukurannya melewati budget
+                        count = self.db.month_summary(self.year, self.month)[2]
+                        info["rows"] = count
+                        if count * MIN_ROW_BYTES > budget:
+                            info["stored"] = False
+                            return
+                        chunks = self.db.iter_month(self.year, self.month)
+                        try:
+                            entry = MonthColumns.from_rows(chain.from_iterable(chunks), total_income, total_outcome, budget)
+                        finally:
+                            chunks.close()
+                    else:
+                        entry = MonthColumns.from_rows(rows, total_income, total_outcome, budget)
+                except sqlite3.Error:
+                    # Cache hanya mempercepat; bulan ini dibaca dari database lagi saat dibuka berikutnya
+                    return
+                info["stored"] = entry is not None and self.month_cache.put(key, entry, version)
+
+    def fetch_rest(self, after):
+        # Sisa bulan setelah kursor after = (date, id), keyset yang sama dengan infinite scroll; None jika dibatalkan
+        rest = []
+        with span("db.fetch_rest", period=f"{self.year:04}-{self.month:02}") as info:
+            while True:
+                page = self.db.fetch_page(self.year, self.month, after, FETCH_ALL_CHUNK)
+                if self._cancelled:
+                    return None
+                rest.extend(page)
+                if len(page) < FETCH_ALL_CHUNK:
+                    break
+                after = (page[-1][COL_DATE], page[-1][COL_ID])
+            info["rows"] = len(rest)
+        return rest
+
+
+class LoadRestTask(LoadTransactionsTask):
+    # Hanya sisa bulan yang sudah tampil sebagian: header diklik / saringan diubah sebelum bulan termuat semua
+    def __init__(self, db, year, month, after, generation):
+        super().__init__(db, year, month, generation)
+        self.after = after
+
+    def run(self):
+        try:
+            rest = self.fetch_rest(self.after)
+        except sqlite3.Error as e:
+            self.signals.error.emit(self.generation, str(e))
+            return
+        if rest is None:
+            return
+        self.signals.rest.emit(self.generation, rest)
+        self.signals.finished.emit(self.generation)
+
+
+class ImportSignals(QObject):
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class ImportTask(QRunnable):
+    def __init__(self, db, path):
+        super().__init__()
+        self.db = db
+        self.path = path
+        self.signals = ImportSignals()
+
+    def run(self):
+        try:
+            result = import_file(self.db, self.path, progress=self.signals.progress.emit)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+class ArchiveSignals(QObject):
+    finished = pyqtSignal(int, int)
+    error = pyqtSignal(str)
+
+
+class ArchiveTask(QRunnable):
+    # Menyalin satu tahun ke file arsip + VACUUM bisa lama untuk database besar
+    def __init__(self, db, year):
+        super().__init__()
+        self.db = db
+        self.year = year
+        self.signals = ArchiveSignals()
+
+    def run(self):
+        try:
+            rows = self.db.archive_year(self.year)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(self.year, rows)
+
+
+class BackupSignals(QObject):
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+
+class BackupTask(QRunnable):
+    # Backup berjalan di thread sendiri dengan koneksi sendiri (bukan koneksi Database), per beberapa halaman
+    def __init__(self, db_path, directory=None):
+        super().__init__()
+        self.db_path = db_path
+        self.directory = directory
+        self.signals = BackupSignals()
+
+    def run(self):
+        from snapshots import backup_archives, create_snapshot
+        try:
+            path = create_snapshot(self.db_path, self.directory)
+            backup_archives(self.db_path, self.directory)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(path)
+
+
+class ExportSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class ExportTask(QRunnable):
+    def __init__(self, db, path, start, end):
+        super().__init__()
+        self.db = db
+        self.path = path
+        self.start = start
+        self.end = end
+        self.signals = ExportSignals()
+
+    def run(self):
+        try:
+            result = export_file(self.db, self.path, self.start, self.end)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+class SearchTask(QRunnable):
+    # Pencarian full-text memakai sinyal yang sama dengan load bulanan (generasi ikut berbagi)
+    def __init__(self, db, text, generation):
+        super().__init__()
+        self.db = db
+        self.text = text
+        self.generation = generation
+        self.signals = LoadSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        try:
+            rows = self.db.search(self.text)
+        except sqlite3.Error as e:
+            self.signals.error.emit(self.generation, str(e))
+            return
+        if self._cancelled:
+            return
+
+        total_income, total_outcome = row_totals(rows)
+        self.signals.totals.emit(self.generation, total_income, total_outcome)
+        self.signals.chunk.emit(self.generation, rows)
+        self.signals.finished.emit(self.generation)
+
+
+class BackendLoadTask(QRunnable):
+    # Load satu bulan dari StorageBackend apapun (mis. RestBackend) tanpa memblokir thread UI
+    def __init__(self, backend, year, month, generation):
+        super().__init__()
+        self.backend = backend
+        self.year = year
+        self.month = month
+        self.generation = generation
+        self.signals = LoadSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        # Diimport di sini: backends memuat requests, yang tidak perlu ikut dimuat saat aplikasi start
+        from backends import BackendError
+        try:
+            rows = self.backend.list_month(self.year, self.month)
+        except (BackendError, sqlite3.Error) as e:
+            self.signals.error.emit(self.generation, str(e))
+            return
+        if self._cancelled:
+            return
+
+        total_income, total_outcome = row_totals(rows)
+        self.signals.totals.emit(self.generation, total_income, total_outcome)
+        self.signals.chunk.emit(self.generation, rows)
+        self.signals.finished.emit(self.generation)
+
+
+class BackendWriteSignals(QObject):
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str, str)
+
+
+class BackendWriteTask(QRunnable):
+    # create/update/delete ke StorageBackend di thread pool: request yang lambat (timeout + retry) tidak membekukan jendela.
+    # action = nama method backend, mis. "create_transaction"; dikirim kembali di sinyal finished/error
+    def __init__(self, backend, action, *args):
+        super().__init__()
+        self.backend = backend
+        self.action = action
+        self.args = args
+        self.signals = BackendWriteSignals()
+
+    def run(self):
+        from backends import BackendError
+        try:
+            getattr(self.backend, self.action)(*self.args)
+        except (BackendError, sqlite3.Error) as e:
+            self.signals.error.emit(self.action, str(e))
+            return
+        self.signals.finished.emit(self.action)
+
+
+class SyncSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str, int)
+
+
+class SyncTask(QRunnable):
+    # Satu putaran sync replika (push outbox lalu tarik delta) di thread pool
+    def __init__(self, replica):
+        super().__init__()
+        self.replica = replica
+        self.signals = SyncSignals()
+
+    def run(self):
+        from backends import BackendError
+        try:
+            result = self.replica.sync()
+        except (BackendError, sqlite3.Error) as e:
+            try:
+                pending = self.replica.pending_count()
+            except sqlite3.Error:
+                pending = -1
+            self.signals.error.emit(str(e), pending)
+            return
+        self.signals.finished.emit(result)
+
+
+class DashboardSignals(QObject):
+    finished = pyqtSignal(int, object)
+    error = pyqtSignal(int, str)
+
+
+class DashboardTask(QRunnable):
+    def __init__(self, db, start_year, end_year, generation, top=10):
+        super().__init__()
+        self.db = db
+        self.start_year = start_year
+        self.end_year = end_year
+        self.generation = generation
+        self.top = top
+        self.signals = DashboardSignals()
+
+    def run(self):
+        try:
+            data = load_dashboard(self.db, self.start_year, self.end_year, self.top)
+        except sqlite3.Error as e:
+            self.signals.error.emit(self.generation, str(e))
+            return
+        self.signals.finished.emit(self.generation, data)